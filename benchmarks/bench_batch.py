@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Kokoro throughput across generate_batch batch sizes.
+
+Reports chunks per second and real-time factor (synthesis time divided by
+audio duration; lower is faster) for each batch size.
+
+    python benchmarks/bench_batch.py --chunks 48 --batch_sizes 1 2 4 8 16
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+from tts.api import iter_batches  # noqa: E402
+from tts.config.settings import LANGUAGE_CODES  # noqa: E402
+from tts.core import TTSEngineType, get_engine_class  # noqa: E402
+
+SENTENCES = [
+    "The quick brown fox jumps over the lazy dog.",
+    "A journey of a thousand miles begins with a single step.",
+    "It was the best of times, it was the worst of times.",
+    "Speech synthesis converts written text into spoken words.",
+    "Short one.",
+    "Batching groups several chunks so the model is invoked fewer times per document.",
+]
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--chunks", type=int, default=48)
+    parser.add_argument("--batch_sizes", type=int, nargs="+", default=[1, 2, 4, 8, 16])
+    parser.add_argument("--language", default="en-gb")
+    parser.add_argument("--voice", default="bm_george")
+    args = parser.parse_args()
+
+    texts = [SENTENCES[i % len(SENTENCES)] for i in range(args.chunks)]
+    engine = get_engine_class(TTSEngineType.KOKORO)(language_code=LANGUAGE_CODES[args.language])
+    engine.generate(texts[0], voice=args.voice)  # Warm-up
+
+    print(f"{'batch':>6}  {'chunks/s':>9}  {'RTF':>6}")
+    for batch_size in args.batch_sizes:
+        audio_frames = 0
+        start = time.perf_counter()
+        for batch in iter_batches(texts, batch_size):
+            for _, _, audio in engine.generate_batch(batch, voice=args.voice):
+                audio_frames += len(audio)
+        elapsed = time.perf_counter() - start
+        rtf = elapsed / (audio_frames / engine.sample_rate)
+        print(f"{batch_size:>6}  {args.chunks / elapsed:>9.2f}  {rtf:>6.3f}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Fixed sentence-count chunking versus character-budget chunking.
+
+Compares chunk length spread, time to first audio (unbatched streaming) and
+throughput (batched synthesis) of grouping a fixed number of sentences per
+chunk against targeting a character budget with a small first chunk. Runs
+offline on a stub engine that emulates a per-call cost and padded batches,
+where every text in a batch costs as much as the longest one:
+
+    python benchmarks/bench_chunking.py --sentences_per_chunk 1 3 10 --chunk_chars 100 200 400
+"""
+
+import argparse
+import itertools
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import List, Sequence, Tuple
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+import numpy as np  # noqa: E402
+
+from tts.api import synthesize_stream  # noqa: E402
+from tts.utils.text import iter_text_chunks  # noqa: E402
+from stub_engine import StubEngine  # noqa: E402
+
+# Sentences of very different lengths, as in real documents
+SENTENCES = [
+    "Yes.",
+    "The quick brown fox jumps over the lazy dog.",
+    "See figure 3.",
+    "It was the best of times, it was the worst of times, it was the age of wisdom, "
+    "it was the age of foolishness, it was the epoch of belief, it was the epoch of incredulity, "
+    "it was the season of light, it was the season of darkness.",
+    "Speech synthesis converts written text into spoken words.",
+    "No.",
+    "A journey of a thousand miles begins with a single step, and every step after that "
+    "is taken one at a time, whether the road ahead is short or long.",
+]
+
+class PaddedBatchStub(StubEngine):
+    """Stub engine with a fixed cost per call and padded batch inference."""
+
+    def __init__(self, call_seconds: float, **kwargs):
+        super().__init__(**kwargs)
+        self.call_seconds = call_seconds
+
+    def _seconds(self, text: str, speed: float) -> float:
+        return len(text) / self.chars_per_second / speed
+
+    def generate(self, text: str, voice=None, speed: float = 1.0, **kwargs) -> Tuple[str, str, np.ndarray]:
+        time.sleep(self.call_seconds)
+        return super().generate(text, voice, speed, **kwargs)
+
+    def generate_batch(self, texts: Sequence[str], voice=None, speed: float = 1.0, **kwargs) -> List[Tuple[str, str, np.ndarray]]:
+        rtf, self.rtf = self.rtf, 0.0
+        try:
+            results = [StubEngine.generate(self, text, voice, speed) for text in texts]
+        finally:
+            self.rtf = rtf
+        longest = max(self._seconds(text, speed) for text in texts)
+        time.sleep(self.call_seconds + self.rtf * longest * len(texts))
+        return results
+
+def make_text(sentences: int) -> str:
+    return " ".join(itertools.islice(itertools.cycle(SENTENCES), sentences))
+
+def measure(engine: StubEngine, text: str, batch_size: int, **chunking) -> Tuple[float, float, float]:
+    """Return (first audio seconds, wall seconds, audio seconds) of one run."""
+    first = None
+    audio_seconds = 0.0
+    start = time.perf_counter()
+    for chunk in synthesize_stream(text, tts_engine=engine, batch_size=batch_size, **chunking):
+        if first is None:
+            first = time.perf_counter() - start
+        audio_seconds += len(chunk.audio) / chunk.sample_rate
+    return first, time.perf_counter() - start, audio_seconds
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sentences", type=int, default=70, help="Input length in sentences")
+    parser.add_argument("--sentences_per_chunk", type=int, nargs="+", default=[1, 3, 10])
+    parser.add_argument("--chunk_chars", type=int, nargs="+", default=[100, 200, 400])
+    parser.add_argument("--first_chunk_chars", type=int, default=60)
+    parser.add_argument("--batch_size", type=int, default=8, help="Batch size of the throughput run")
+    parser.add_argument("--rtf", type=float, default=0.005, help="Emulated model real-time factor")
+    parser.add_argument("--call_ms", type=float, default=5.0, help="Emulated fixed cost per engine call")
+    args = parser.parse_args()
+
+    text = make_text(args.sentences)
+    engine = PaddedBatchStub(call_seconds=args.call_ms / 1000, rtf=args.rtf)
+    configs = [(f"fixed spc={n}", dict(sentences_per_chunk=n)) for n in args.sentences_per_chunk]
+    configs += [
+        (f"budget chars={n}", dict(chunk_chars=n, first_chunk_chars=min(args.first_chunk_chars, n)))
+        for n in args.chunk_chars
+    ]
+
+    print(f"{'chunking':<18} {'chunks':>6} {'min':>5} {'median':>7} {'max':>5} "
+          f"{'first audio ms':>15} {'audio s/s':>10}")
+    for name, chunking in configs:
+        lengths = [len(chunk) for chunk in iter_text_chunks([text], **chunking)]
+        first, _, _ = measure(engine, text, 1, **chunking)
+        _, wall, audio_seconds = measure(engine, text, args.batch_size, **chunking)
+        print(f"{name:<18} {len(lengths):>6} {min(lengths):>5} {statistics.median(lengths):>7.0f} "
+              f"{max(lengths):>5} {first * 1000:>15.1f} {audio_seconds / wall:>10.1f}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
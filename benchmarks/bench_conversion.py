@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Conversion benchmark: per-chunk overhead of turning engine output into audio arrays.
+
+    python benchmarks/bench_conversion.py --chunks 200 --chunk_seconds 4
+
+Compares the previous conversion path (squeeze/detach/numpy per engine, then a
+float32 cast at every consumer) with the single to_audio_array() conversion,
+for numpy inputs and, when torch is installed, CPU and GPU tensors.
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+import numpy as np
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+from tts.core.engine import to_audio_array  # noqa: E402
+
+SAMPLE_RATE = 24000
+CONSUMERS = 3  # writer, audio cache and daemon protocol each see the array
+
+def legacy_conversion(audio) -> None:
+    """Previous path: convert in the engine, then cast again in every consumer."""
+    if hasattr(audio, "detach"):
+        audio = audio.squeeze().detach().cpu().numpy()
+    audio = np.concatenate([np.asarray(audio)])  # join_segments
+    for _ in range(CONSUMERS):
+        np.asarray(audio, dtype=np.float32)
+
+def contract_conversion(audio) -> None:
+    """Current path: convert once; consumers receive float32 and do not copy."""
+    audio = to_audio_array(audio)
+    for _ in range(CONSUMERS):
+        np.asarray(audio, dtype=np.float32)
+
+def make_inputs(count: int, seconds: float) -> dict:
+    """Build deterministic chunk outputs in each representation engines produce."""
+    rng = np.random.default_rng(0)
+    samples = int(seconds * SAMPLE_RATE)
+    base = [rng.uniform(-0.5, 0.5, samples).astype(np.float32) for _ in range(count)]
+    inputs = {
+        "numpy float32": base,
+        "numpy float64": [audio.astype(np.float64) for audio in base],
+    }
+    try:
+        import torch
+    except ImportError:
+        print("torch not installed; skipping tensor inputs")
+        return inputs
+    inputs["torch cpu"] = [torch.from_numpy(audio).unsqueeze(0) for audio in base]
+    if torch.cuda.is_available():
+        inputs["torch cuda"] = [tensor.cuda() for tensor in inputs["torch cpu"]]
+    return inputs
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--chunks", type=int, default=200)
+    parser.add_argument("--chunk_seconds", type=float, default=4.0)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    inputs = make_inputs(args.chunks, args.chunk_seconds)
+    print(f"{args.chunks} chunks of {args.chunk_seconds:g}s at {SAMPLE_RATE} Hz")
+    print(f"{'input':<15} {'legacy us/chunk':>16} {'contract us/chunk':>18}")
+    for name, chunks in inputs.items():
+        row = []
+        for method in (legacy_conversion, contract_conversion):
+            times = []
+            for _ in range(args.runs):
+                start = time.perf_counter()
+                for audio in chunks:
+                    method(audio)
+                times.append(time.perf_counter() - start)
+            row.append(min(times) / len(chunks) * 1e6)
+        print(f"{name:<15} {row[0]:>16.1f} {row[1]:>18.1f}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
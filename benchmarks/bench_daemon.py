@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Per-request latency of a cold ``tts`` invocation versus a warm ``tts serve`` daemon.
+
+Three cases are measured for the same short input:
+  cold:   a fresh CLI process that loads the model itself
+  client: a fresh CLI process that forwards to the running daemon
+  warm:   an in-process RemoteEngine.generate call against the daemon
+
+    python benchmarks/bench_daemon.py --runs 5 --engine kokoro
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, List
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+from tts.core.engine import TTSEngineType  # noqa: E402
+from tts.server.client import connect_daemon  # noqa: E402
+
+TEXT = "The quick brown fox jumps over the lazy dog."
+
+def time_runs(fn: Callable[[], None], runs: int) -> List[float]:
+    """Call fn repeatedly and return the wall time of each call in seconds."""
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return times
+
+def run_cli(args: List[str]) -> None:
+    """Run the CLI in a fresh interpreter, feeding the benchmark text on stdin."""
+    subprocess.run(
+        [sys.executable, "-m", "tts.cli", *args],
+        cwd=REPO_ROOT, input=TEXT, text=True, check=True,
+        stdout=subprocess.DEVNULL
+    )
+
+def wait_for_socket(socket_path: str, timeout: float) -> None:
+    """Block until the daemon accepts connections."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if Path(socket_path).exists():
+            return
+        time.sleep(0.1)
+    raise TimeoutError(f"Daemon did not start within {timeout:.0f}s")
+
+def report(name: str, times: List[float]) -> None:
+    print(f"{name:<8} median {statistics.median(times) * 1000:>9.1f} ms   "
+          f"min {min(times) * 1000:>9.1f} ms   max {max(times) * 1000:>9.1f} ms")
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--engine", default="kokoro")
+    parser.add_argument("--language", default="en-gb")
+    parser.add_argument("--startup_timeout", type=float, default=300.0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        socket_path = str(Path(tmp) / "tts.sock")
+        common = [
+            "--engine", args.engine, "--language", args.language,
+            "--mode", "save", "--output_dir", tmp, "--stitch=False",
+            "--socket_path", socket_path
+        ]
+
+        cold = time_runs(lambda: run_cli([*common, "--use_daemon=False"]), args.runs)
+
+        daemon = subprocess.Popen(
+            [sys.executable, "-m", "tts.cli", "serve", "--engine", args.engine,
+             "--language", args.language, "--socket_path", socket_path],
+            cwd=REPO_ROOT, stdout=subprocess.DEVNULL
+        )
+        try:
+            wait_for_socket(socket_path, args.startup_timeout)
+            client = time_runs(lambda: run_cli(common), args.runs)
+
+            engine = connect_daemon(TTSEngineType(args.engine), args.language, socket_path=socket_path)
+            if engine is None:
+                raise RuntimeError("Could not connect to the daemon")
+            warm = time_runs(lambda: engine.generate(TEXT, voice="bm_george"), args.runs)
+            engine.close()
+        finally:
+            daemon.terminate()
+            daemon.wait()
+
+    print(f"Per-request latency over {args.runs} runs ({args.engine}, {len(TEXT)} chars):")
+    report("cold", cold)
+    report("client", client)
+    report("warm", warm)
+    print(f"\nSpeed-up of daemon client over cold CLI: {statistics.median(cold) / statistics.median(client):.1f}x")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Output format benchmark: file size and encoding speed of each saved format.
+
+Streams chunks into a StreamingAudioWriter for every output format (and
+any extra compression levels), reporting the file size per hour of audio,
+the size relative to WAV and how much faster than real time it encodes.
+The audio is a synthetic, speech-like signal unless --input points at a
+mono recording, such as a WAV file saved by `tts`:
+
+    python benchmarks/bench_formats.py --minutes 10 --levels 0.5 0.8
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+import numpy as np
+import soundfile as sf
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+from tts.utils.audio import OUTPUT_FORMATS, AudioEncoding, StreamingAudioWriter  # noqa: E402
+
+SAMPLE_RATE = 24000
+
+def make_speech_like(seconds: float, sample_rate: int = SAMPLE_RATE) -> np.ndarray:
+    """Voiced harmonics with a wandering pitch, syllable-rate envelope and pauses.
+
+    A pure tone or white noise would flatter or punish the lossy codecs;
+    this has roughly the spectral shape and silences of speech.
+    """
+    rng = np.random.default_rng(0)
+    n = int(seconds * sample_rate)
+    t = np.arange(n) / sample_rate
+    pitch = 120 + 30 * np.sin(2 * np.pi * 0.3 * t) + 10 * np.sin(2 * np.pi * 2.1 * t)
+    phase = 2 * np.pi * np.cumsum(pitch) / sample_rate
+    voiced = sum(np.sin(k * phase) / k for k in range(1, 20))
+    envelope = np.clip(np.sin(2 * np.pi * 4.0 * t + rng.uniform(0, 2 * np.pi)), 0, None)
+    # Pause for about a fifth of every 3 s, as between sentences
+    pauses = (t % 3.0) < 2.4
+    audio = (0.1 * voiced + 0.02 * rng.standard_normal(n)) * envelope * pauses
+    return audio.astype(np.float32)
+
+def make_chunks(audio: np.ndarray, chunk_seconds: float, sample_rate: int) -> list:
+    size = int(chunk_seconds * sample_rate)
+    return [audio[start:start + size] for start in range(0, len(audio), size)]
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--minutes", type=float, default=10.0)
+    parser.add_argument("--input", help="Mono audio file to encode instead of the synthetic signal")
+    parser.add_argument("--chunk_seconds", type=float, default=4.0)
+    parser.add_argument("--levels", type=float, nargs="*", default=[],
+                        help="Extra compression levels to try for the compressed formats")
+    args = parser.parse_args()
+
+    if args.input:
+        audio, sample_rate = sf.read(args.input, dtype="float32")
+        if audio.ndim > 1:
+            audio = audio.mean(axis=1)
+    else:
+        audio, sample_rate = make_speech_like(args.minutes * 60), SAMPLE_RATE
+    seconds = len(audio) / sample_rate
+    chunks = make_chunks(audio, args.chunk_seconds, sample_rate)
+    print(f"{seconds / 60:.1f} minutes of audio at {sample_rate} Hz in {len(chunks)} chunks")
+
+    encodings = [AudioEncoding(name) for name in OUTPUT_FORMATS]
+    encodings += [AudioEncoding(name, level) for name in OUTPUT_FORMATS if name != "wav" for level in args.levels]
+
+    print(f"{'format':<6} {'level':>5} {'MB/hour':>8} {'vs wav':>7} {'x real time':>12}")
+    wav_bytes = None
+    with tempfile.TemporaryDirectory() as tmp:
+        for encoding in encodings:
+            output_file = Path(tmp) / f"output{encoding.suffix}"
+            try:
+                start = time.perf_counter()
+                with StreamingAudioWriter(output_file, sample_rate, encoding) as writer:
+                    for chunk in chunks:
+                        writer.write(chunk)
+                elapsed = time.perf_counter() - start
+            except (ValueError, RuntimeError) as e:
+                print(f"{encoding.format:<6} {'':>5} failed: {e}")
+                continue
+            size = output_file.stat().st_size
+            wav_bytes = wav_bytes or size
+            level = "-" if encoding.compression_level is None else f"{encoding.compression_level:.2f}"
+            print(f"{encoding.format:<6} {level:>5} {size / seconds * 3600 / 1e6:>8.1f} "
+                  f"{wav_bytes / size:>6.1f}x {seconds / elapsed:>11.0f}x")
+            output_file.unlink()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Load test for the ``tts http`` server.
+
+Sends requests from concurrent clients and reports time to first audio
+byte, total latency, audio throughput and how many requests were rejected
+as busy (503). Point it at a running server with --url, or use --stub to
+start an in-process server backed by the deterministic stub engine:
+
+    python benchmarks/bench_http.py --url http://127.0.0.1:8080 --clients 8 --requests 64
+    python benchmarks/bench_http.py --stub --stub_rtf 0.1 --clients 16 --max_queue 8
+"""
+
+import argparse
+import statistics
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+from tts.core import TTSEngineType  # noqa: E402
+from tts.core.pool import EnginePool  # noqa: E402
+from tts.server.http_server import HTTPSynthesisServer, HTTPSynthesisHandler  # noqa: E402
+from stub_engine import StubEngine  # noqa: E402
+
+TEXT = (
+    "The quick brown fox jumps over the lazy dog. A journey of a thousand miles "
+    "begins with a single step. Speech synthesis converts written text into spoken words."
+)
+
+class QuietHandler(HTTPSynthesisHandler):
+    def log_message(self, format, *args) -> None:
+        pass
+
+def start_stub_server(rtf: float, concurrency: int, max_queue: int) -> HTTPSynthesisServer:
+    """Start an HTTP server on a free local port using the stub engine."""
+    pool = EnginePool(lambda *_: StubEngine(rtf=rtf), concurrency=concurrency)
+    pool.get(TTSEngineType.KOKORO, "en-gb", None)
+    server = HTTPSynthesisServer(("127.0.0.1", 0), pool, "kokoro", "en-gb", max_queue=max_queue)
+    server.RequestHandlerClass = QuietHandler
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+def request(url: str, text: str, sentences_per_chunk: int) -> dict:
+    """Send one synthesis request and time the response."""
+    req = urllib.request.Request(
+        f"{url}/synthesize?format=pcm&sentences_per_chunk={sentences_per_chunk}",
+        data=text.encode("utf-8"),
+        headers={"Content-Type": "text/plain"}
+    )
+    start = time.perf_counter()
+    try:
+        with urllib.request.urlopen(req) as response:
+            first_byte = None
+            nbytes = 0
+            while data := response.read1(65536):
+                if first_byte is None:
+                    first_byte = time.perf_counter() - start
+                nbytes += len(data)
+    except urllib.error.HTTPError as e:
+        return {"status": e.code}
+    return {"status": 200, "first_byte": first_byte, "total": time.perf_counter() - start, "bytes": nbytes}
+
+def percentile(values: list, q: float) -> float:
+    return statistics.quantiles(values, n=100)[int(q) - 1] if len(values) > 1 else values[0]
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--url", default="http://127.0.0.1:8080")
+    parser.add_argument("--clients", type=int, default=8)
+    parser.add_argument("--requests", type=int, default=64)
+    parser.add_argument("--sentences_per_chunk", type=int, default=1)
+    parser.add_argument("--sample_rate", type=int, default=24000)
+    parser.add_argument("--stub", action="store_true", help="Start an in-process server with the stub engine")
+    parser.add_argument("--stub_rtf", type=float, default=0.05)
+    parser.add_argument("--concurrency", type=int, default=1, help="Engine concurrency of the stub server")
+    parser.add_argument("--max_queue", type=int, default=16, help="Queue limit of the stub server")
+    args = parser.parse_args()
+
+    url = args.url
+    if args.stub:
+        server = start_stub_server(args.stub_rtf, args.concurrency, args.max_queue)
+        url = f"http://127.0.0.1:{server.server_address[1]}"
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.clients) as executor:
+        results = list(executor.map(
+            lambda _: request(url, TEXT, args.sentences_per_chunk), range(args.requests)
+        ))
+    wall = time.perf_counter() - start
+
+    ok = [result for result in results if result["status"] == 200]
+    busy = sum(1 for result in results if result["status"] == 503)
+    failed = len(results) - len(ok) - busy
+    print(f"{len(results)} requests from {args.clients} clients in {wall:.2f}s: "
+          f"{len(ok)} ok, {busy} busy (503), {failed} failed")
+    if ok:
+        first_bytes = [result["first_byte"] for result in ok]
+        totals = [result["total"] for result in ok]
+        audio_seconds = sum(result["bytes"] for result in ok) / 2 / args.sample_rate
+        print(f"  first byte  p50 {percentile(first_bytes, 50) * 1000:8.1f} ms   p95 {percentile(first_bytes, 95) * 1000:8.1f} ms")
+        print(f"  total       p50 {percentile(totals, 50) * 1000:8.1f} ms   p95 {percentile(totals, 95) * 1000:8.1f} ms")
+        print(f"  throughput  {len(ok) / wall:.1f} requests/s, {audio_seconds / wall:.1f}s of audio per second")
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Markdown-to-text conversion time, direct converter versus HTML round-trip.
+
+Converts a generated documentation-style Markdown file of the given size
+with markdown_to_text() and with the old path (render HTML with the
+`markdown` package, parse it with BeautifulSoup, extract the text), which
+needs `markdown` and `beautifulsoup4` installed:
+
+    python benchmarks/bench_markdown.py --megabytes 5
+"""
+
+import argparse
+import re
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+from tts.utils.markdown_text import markdown_to_text  # noqa: E402
+
+SECTION = """
+## Configuring the {n}th service
+
+The `service` command starts the **daemon** described in [the overview](overview.md#daemon).
+It reads its settings from `~/.config/service.toml`, e.g. the port and *log level*,
+and falls back to the defaults listed below.
+
+- `port`: the TCP port to listen on
+- `log_level`: one of _debug_, _info_ or _error_
+- `workers`: number of worker processes
+
+| Setting | Default | Description |
+|---------|---------|-------------|
+| port | 8080 | Listening port |
+| workers | 4 | Worker processes |
+
+```bash
+service start --port 8080 --workers 4
+```
+
+> **Note:** restart the service after changing its settings.
+
+![Architecture diagram](images/architecture-{n}.png)
+"""
+
+def legacy_markdown_to_text(md_content: str) -> str:
+    """The HTML round-trip this benchmark replaced."""
+    import markdown
+    from bs4 import BeautifulSoup
+
+    html = markdown.markdown(md_content)
+    soup = BeautifulSoup(html, 'html.parser')
+    for elem in soup.find_all(['h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'p']):
+        elem.append('\n\n')
+    text = soup.get_text()
+    text = re.sub(r'\n\s*\n', '\n\n', text)
+    return text.strip()
+
+def make_document(megabytes: float) -> str:
+    size = int(megabytes * 1024 * 1024)
+    parts, length, n = ["# Service documentation\n"], 0, 0
+    while length < size:
+        section = SECTION.format(n=n)
+        parts.append(section)
+        length += len(section)
+        n += 1
+    return "".join(parts)
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--megabytes", type=float, default=5.0)
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--skip_legacy", action="store_true", help="Only time the direct converter")
+    args = parser.parse_args()
+
+    document = make_document(args.megabytes)
+    megabytes = len(document.encode("utf-8")) / 1024 / 1024
+    converters = {"direct": markdown_to_text}
+    if not args.skip_legacy:
+        converters["html round-trip"] = legacy_markdown_to_text
+
+    print(f"{megabytes:.1f} MB document")
+    print(f"{'converter':<16} {'seconds':>8} {'MB/s':>8} {'output chars':>13}")
+    for name, convert in converters.items():
+        best = None
+        for _ in range(args.runs):
+            start = time.perf_counter()
+            text = convert(document)
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        print(f"{name:<16} {best:>8.2f} {megabytes / best:>8.1f} {len(text):>13}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+End-to-end throughput of generate_speech with a deterministic stub engine.
+
+Runs offline: no model is loaded and playback goes to a null device, so the
+timings measure the pipeline around the model (text chunking, AudioChunk
+handling, file writes, stitching, manifests and playback queueing) across
+input sizes, chunk sizes and output modes. Fails (exit code 1) if the
+pipeline overhead of any run exceeds the per-chunk budget:
+
+    python benchmarks/bench_pipeline.py --sizes 1000 10000 100000 --max_ms_per_chunk 5
+"""
+
+import argparse
+import contextlib
+import itertools
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+import tts.cli as cli  # noqa: E402
+from tts.utils.playback import StreamingPlayer  # noqa: E402
+from tts.utils.profiling import register_profile_hook, unregister_profile_hook  # noqa: E402
+from stub_engine import StubEngine  # noqa: E402
+
+SENTENCES = [
+    "The quick brown fox jumps over the lazy dog.",
+    "A journey of a thousand miles begins with a single step!",
+    "Is it the best of times, or the worst of times?",
+    "Speech synthesis converts written text into spoken words.",
+    "Short one.",
+]
+
+# Benchmark mode -> generate_speech arguments
+MODES = {
+    "save": dict(mode="save", stitch=True),
+    "save_chunks": dict(mode="save", stitch=False),
+    "play": dict(mode="play"),
+    "both": dict(mode="both", stitch=True),
+}
+
+class NullPlayer(StreamingPlayer):
+    """StreamingPlayer that drains its queue without an audio device."""
+
+    def _run(self) -> None:
+        while True:
+            audio = self._queue.get()
+            if audio is self._STOP or self._abort.is_set():
+                break
+
+def make_text(characters: int) -> str:
+    """Build deterministic text of roughly the given length."""
+    sentences = itertools.cycle(SENTENCES)
+    parts, length = [], 0
+    while length < characters:
+        sentence = next(sentences)
+        parts.append(sentence)
+        length += len(sentence) + 1
+    return " ".join(parts)
+
+def run(text: str, mode: str, sentences_per_chunk: int, rtf: float) -> dict:
+    """Run generate_speech once and return its profile report."""
+    reports = []
+    hook = register_profile_hook(reports.append)
+    try:
+        with tempfile.TemporaryDirectory() as tmp, open(os.devnull, "w") as devnull:
+            with contextlib.redirect_stdout(devnull):
+                cli.generate_speech(
+                    text=text,
+                    output_dir=tmp,
+                    sentences_per_chunk=sentences_per_chunk,
+                    use_daemon=False,
+                    no_cache=True,
+                    **MODES[mode]
+                )
+    finally:
+        unregister_profile_hook(hook)
+    return reports[0]
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000], help="Input sizes in characters")
+    parser.add_argument("--sentences_per_chunk", type=int, nargs="+", default=[1, 3, 10])
+    parser.add_argument("--modes", nargs="+", choices=list(MODES), default=list(MODES))
+    parser.add_argument("--rtf", type=float, default=0.0, help="Emulated model real-time factor")
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--max_ms_per_chunk", type=float, default=None, help="Pipeline overhead budget per chunk")
+    args = parser.parse_args()
+
+    cli.create_tts_engine = lambda *_, **__: StubEngine(rtf=args.rtf)
+    cli.StreamingPlayer = NullPlayer
+
+    print(f"{'mode':<12} {'chars':>8} {'spc':>4} {'chunks':>7} {'chars/s':>11} "
+          f"{'chunks/s':>9} {'overhead ms/chunk':>18}")
+    failed = False
+    for mode, size, sentences_per_chunk in itertools.product(args.modes, args.sizes, args.sentences_per_chunk):
+        text = make_text(size)
+        best = None
+        for _ in range(args.runs):
+            start = time.perf_counter()
+            report = run(text, mode, sentences_per_chunk, args.rtf)
+            wall = time.perf_counter() - start
+            if best is None or wall < best[0]:
+                best = (wall, report)
+        wall, report = best
+        chunks = len(report["chunks"])
+        synthesis = report["stages"].get("synthesis", {}).get("seconds", 0.0)
+        overhead_ms = (wall - synthesis) / chunks * 1000
+        print(f"{mode:<12} {size:>8} {sentences_per_chunk:>4} {chunks:>7} {size / wall:>11.0f} "
+              f"{chunks / wall:>9.0f} {overhead_ms:>18.3f}")
+        if args.max_ms_per_chunk is not None and overhead_ms > args.max_ms_per_chunk:
+            failed = True
+
+    if failed:
+        print(f"FAIL: pipeline overhead exceeded {args.max_ms_per_chunk} ms per chunk")
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
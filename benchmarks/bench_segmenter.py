@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Sentence segmentation throughput on a multi-megabyte corpus.
+
+Compares the old per-call regex split on sentence punctuation with
+iter_sentences(), both on the whole text and streamed in blocks as the CLI
+reads files. Reports throughput, sentence count and how many "sentences"
+are fragments of a few characters (split after "Dr.", "e.g.", ellipses...):
+
+    python benchmarks/bench_segmenter.py --megabytes 8
+"""
+
+import argparse
+import itertools
+import re
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+from tts.utils.text import iter_sentences  # noqa: E402
+
+SENTENCES = [
+    "Dr. Smith arrived at 3.5 p.m. on Jan. 4 with Mr. Jones.",
+    "The results, e.g. the error rates, were lower than expected.",
+    "She paused... then carried on reading.",
+    "Prices rose by 2.5 percent, i.e. faster than wages.",
+    "J. R. R. Tolkien wrote The Hobbit.",
+    "Is this the U.S. edition?",
+    "Yes!",
+    "The meeting ended at noon.",
+    "今天天气很好。我们去公园吧！",
+]
+
+def legacy_split(text: str) -> list:
+    """The segmenter this benchmark replaced."""
+    return [piece.strip() for piece in re.split(r'(?<=[.!?])\s+', text) if piece.strip()]
+
+def make_corpus(megabytes: float) -> str:
+    size = int(megabytes * 1024 * 1024)
+    parts, length = [], 0
+    for sentence in itertools.cycle(SENTENCES):
+        if length >= size:
+            break
+        parts.append(sentence)
+        length += len(sentence.encode("utf-8")) + 1
+    return " ".join(parts)
+
+def iter_blocks(text: str, block_size: int):
+    for i in range(0, len(text), block_size):
+        yield text[i:i + block_size]
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--megabytes", type=float, default=8.0)
+    parser.add_argument("--block_size", type=int, default=64 * 1024, help="Characters per streamed block")
+    parser.add_argument("--fragment_chars", type=int, default=3, help="Sentences this short count as fragments")
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+
+    text = make_corpus(args.megabytes)
+    megabytes = len(text.encode("utf-8")) / 1024 / 1024
+    segmenters = {
+        "legacy re.split": lambda: legacy_split(text),
+        "iter_sentences": lambda: list(iter_sentences([text])),
+        "iter_sentences (blocks)": lambda: list(iter_sentences(iter_blocks(text, args.block_size))),
+    }
+
+    print(f"{megabytes:.1f} MB corpus")
+    print(f"{'segmenter':<24} {'MB/s':>8} {'sentences':>10} {'fragments':>10}")
+    for name, segment in segmenters.items():
+        best = None
+        for _ in range(args.runs):
+            start = time.perf_counter()
+            sentences = segment()
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        fragments = sum(1 for sentence in sentences if len(sentence) <= args.fragment_chars)
+        print(f"{name:<24} {megabytes / best:>8.1f} {len(sentences):>10} {fragments:>10}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Cold-start benchmark for the ``tts`` command line entry point.
+
+Runs ``python -X importtime`` on ``tts.cli`` in a fresh interpreter, prints the
+slowest imports and fails (exit code 1) if a heavy backend is loaded eagerly or
+the total import time exceeds the budget. Intended to be run in CI:
+
+    python benchmarks/bench_startup.py --max_ms 1500
+"""
+
+import argparse
+import subprocess
+import sys
+from pathlib import Path
+from typing import List, Tuple
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# Modules that must never be imported just to start the CLI
+FORBIDDEN_MODULES = ("torch", "chatterbox", "kokoro")
+
+def run_importtime(module: str) -> List[Tuple[int, int, str]]:
+    """Import a module in a fresh interpreter and return (self_us, cumulative_us, name) rows."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=REPO_ROOT, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Importing {module} failed:\n{result.stderr}")
+
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        rows.append((int(self_us), int(cumulative_us), name[1:].rstrip()))
+    return rows
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--module", default="tts.cli", help="Module to import")
+    parser.add_argument("--max_ms", type=float, default=1500.0, help="Total import time budget in milliseconds")
+    parser.add_argument("--top", type=int, default=15, help="Number of slowest imports to show")
+    args = parser.parse_args()
+
+    rows = run_importtime(args.module)
+    # The un-indented row for the requested module includes everything it pulled in
+    total_ms = max(cumulative for _, cumulative, name in rows if name == args.module) / 1000
+
+    print(f"{'cumulative ms':>14}  {'self ms':>8}  module")
+    for self_us, cumulative_us, name in sorted(rows, key=lambda r: r[1], reverse=True)[:args.top]:
+        print(f"{cumulative_us / 1000:>14.1f}  {self_us / 1000:>8.1f}  {name.strip()}")
+    print(f"\nTotal import time for {args.module}: {total_ms:.1f} ms (budget {args.max_ms:.0f} ms)")
+
+    loaded = {name.strip().split(".")[0] for _, _, name in rows}
+    forbidden = sorted(loaded.intersection(FORBIDDEN_MODULES))
+    failed = False
+    if forbidden:
+        print(f"FAIL: heavy backends imported at startup: {', '.join(forbidden)}")
+        failed = True
+    if total_ms > args.max_ms:
+        print("FAIL: import time exceeds budget")
+        failed = True
+    if not failed:
+        print("OK")
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Stitching benchmark: per-chunk WAV files + ffmpeg concat versus streaming writes.
+
+    python benchmarks/bench_stitch.py --chunks 500 --chunk_seconds 4
+"""
+
+import argparse
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+import numpy as np
+import soundfile as sf
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+from tts.utils.audio import StreamingAudioWriter  # noqa: E402
+
+SAMPLE_RATE = 24000
+
+def make_chunks(count: int, seconds: float) -> list:
+    """Generate deterministic chunk audio of varying length."""
+    rng = np.random.default_rng(0)
+    lengths = (seconds * SAMPLE_RATE * rng.uniform(0.5, 1.5, count)).astype(int)
+    return [rng.uniform(-0.5, 0.5, n).astype(np.float32) for n in lengths]
+
+def stitch_ffmpeg(chunks: list, output_dir: Path) -> None:
+    """Previous path: write every chunk, list them, concatenate with ffmpeg, delete."""
+    files = []
+    for i, audio in enumerate(chunks):
+        path = output_dir / f"output_{i}.wav"
+        sf.write(str(path), audio, SAMPLE_RATE)
+        files.append(path)
+    list_file = output_dir / "chunks.txt"
+    list_file.write_text("".join(f"file '{path.name}'\n" for path in files))
+    subprocess.run(
+        ["ffmpeg", "-y", "-loglevel", "error", "-f", "concat", "-safe", "0",
+         "-i", str(list_file), "-c", "copy", str(output_dir / "output.wav")],
+        check=True
+    )
+    list_file.unlink()
+    for path in files:
+        path.unlink()
+
+def stitch_streaming(chunks: list, output_dir: Path) -> None:
+    """Current path: append each chunk to one open file."""
+    with StreamingAudioWriter(output_dir / "output.wav", SAMPLE_RATE) as writer:
+        for audio in chunks:
+            writer.write(audio)
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--chunks", type=int, default=500)
+    parser.add_argument("--chunk_seconds", type=float, default=4.0)
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+
+    chunks = make_chunks(args.chunks, args.chunk_seconds)
+    total_seconds = sum(len(audio) for audio in chunks) / SAMPLE_RATE
+    print(f"{args.chunks} chunks, {total_seconds / 60:.1f} minutes of audio")
+
+    methods = {"streaming": stitch_streaming}
+    if shutil.which("ffmpeg"):
+        methods["ffmpeg"] = stitch_ffmpeg
+    else:
+        print("ffmpeg not found; skipping the per-chunk file baseline")
+
+    for name, method in methods.items():
+        times = []
+        for _ in range(args.runs):
+            with tempfile.TemporaryDirectory() as tmp:
+                start = time.perf_counter()
+                method(chunks, Path(tmp))
+                times.append(time.perf_counter() - start)
+        print(f"{name:<10} best of {args.runs}: {min(times) * 1000:>9.1f} ms")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
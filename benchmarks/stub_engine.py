@@ -0,0 +1,46 @@
+"""
+Deterministic stand-in for a real TTS engine, for benchmarking the pipeline
+(chunking, AudioChunk handling, file writes, stitching, manifests) without
+loading or running a model.
+"""
+
+import time
+import zlib
+from typing import Optional, Tuple
+import numpy as np
+
+from tts.core import TTSEngine
+
+class StubEngine(TTSEngine):
+    """Synthesize a sine tone whose pitch depends on the text.
+
+    Audio duration is proportional to the text length (chars_per_second at
+    speed 1.0), so runs are reproducible. With rtf > 0, generation sleeps for
+    rtf seconds per second of audio to emulate a model of that speed.
+    """
+
+    def __init__(self, rtf: float = 0.0, chars_per_second: float = 15.0, sample_rate: int = 24000):
+        self.rtf = rtf
+        self.chars_per_second = chars_per_second
+        self._sample_rate = sample_rate
+        self.calls = 0
+
+    def generate(
+        self,
+        text: str,
+        voice: Optional[str] = None,
+        speed: float = 1.0,
+        **kwargs
+    ) -> Tuple[str, str, np.ndarray]:
+        self.calls += 1
+        seconds = len(text) / self.chars_per_second / speed
+        frequency = 110.0 + zlib.crc32(text.encode("utf-8")) % 770
+        t = np.arange(int(seconds * self._sample_rate), dtype=np.float32) / self._sample_rate
+        audio = 0.2 * np.sin(2 * np.pi * frequency * t, dtype=np.float32)
+        if self.rtf > 0:
+            time.sleep(self.rtf * seconds)
+        return text, "", audio
+
+    @property
+    def sample_rate(self) -> int:
+        return self._sample_rate
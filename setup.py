@@ -6,12 +6,10 @@ setup(
     packages=find_packages(),
     install_requires=[
         "fire",
-        "soundfile",
+        "soundfile>=0.13",  # compression_level and bitrate_mode for compressed formats
         "sounddevice",
         "kokoro",  # make sure this is the correct package name
         "chatterbox-tts",  # add Chatterbox TTS support
-        "markdown",
-        "beautifulsoup4",
         "numpy",
     ],
     entry_points={
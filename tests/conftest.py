@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# Tests run on the StubEngine from the benchmarks instead of a model
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "benchmarks"))
@@ -0,0 +1,69 @@
+import asyncio
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from stub_engine import StubEngine
+from tts.aio import AsyncTTS
+
+TEXT = "The first sentence is here. The second one follows it. A third closes the text."
+
+class ConcurrencyEngine(StubEngine):
+    """StubEngine that records how many calls run at the same time."""
+
+    def __init__(self):
+        super().__init__()
+        self._lock = threading.Lock()
+        self.running = 0
+        self.max_running = 0
+        self.closed = False
+
+    def generate(self, text, voice=None, speed=1.0, **kwargs):
+        with self._lock:
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+        try:
+            time.sleep(0.01)
+            return super().generate(text, voice, speed, **kwargs)
+        finally:
+            with self._lock:
+                self.running -= 1
+
+    def close(self):
+        self.closed = True
+
+def test_stream_yields_chunks_in_order():
+    async def run():
+        async with AsyncTTS(StubEngine()) as tts:
+            return [chunk async for chunk in tts.stream(TEXT, sentences_per_chunk=1)]
+    chunks = asyncio.run(run())
+    assert [chunk.index for chunk in chunks] == [0, 1, 2]
+    assert chunks[0].text == "The first sentence is here."
+
+def test_synthesize_matches_the_engine():
+    async def run():
+        async with AsyncTTS(StubEngine()) as tts:
+            return await tts.synthesize(TEXT, sentences_per_chunk=1)
+    audio = asyncio.run(run())
+    engine = StubEngine()
+    expected = np.concatenate([
+        engine.generate(text)[2]
+        for text in ["The first sentence is here.", "The second one follows it.", "A third closes the text."]
+    ])
+    np.testing.assert_array_equal(audio, expected)
+
+def test_concurrency_limits_parallel_calls():
+    engine = ConcurrencyEngine()
+    async def run():
+        async with AsyncTTS(engine, concurrency=2) as tts:
+            await asyncio.gather(*(tts.synthesize(TEXT, sentences_per_chunk=1) for _ in range(4)))
+    asyncio.run(run())
+    assert engine.max_running == 2
+    assert engine.calls == 12
+    assert engine.closed
+
+def test_concurrency_must_be_positive():
+    with pytest.raises(ValueError):
+        AsyncTTS(StubEngine(), concurrency=0)
@@ -0,0 +1,52 @@
+import numpy as np
+
+from stub_engine import StubEngine
+from tts.api import iter_audio_chunks, synthesize, synthesize_stream
+
+TEXT = "The first sentence is here. The second one follows it. A third closes the text."
+
+def test_stream_yields_chunks_in_order():
+    engine = StubEngine()
+    chunks = list(synthesize_stream(TEXT, sentences_per_chunk=1, tts_engine=engine))
+    assert [chunk.index for chunk in chunks] == [0, 1, 2]
+    assert [chunk.text for chunk in chunks] == [
+        "The first sentence is here.", "The second one follows it.", "A third closes the text."
+    ]
+    assert all(chunk.sample_rate == engine.sample_rate for chunk in chunks)
+
+def test_stream_accepts_text_blocks():
+    blocks = ["The first sentence is here. The second", " one follows it."]
+    chunks = list(synthesize_stream(blocks, sentences_per_chunk=1, tts_engine=StubEngine()))
+    assert [chunk.text for chunk in chunks] == ["The first sentence is here.", "The second one follows it."]
+
+def test_synthesize_joins_chunk_audio():
+    result = synthesize(TEXT, sentences_per_chunk=1, tts_engine=StubEngine())
+    assert len(result.chunks) == 3
+    assert len(result.audio) == sum(len(chunk.audio) for chunk in result.chunks)
+    assert result.sample_rate == 24000
+    # Chunks are views into the joined audio
+    assert all(np.shares_memory(chunk.audio, result.audio) for chunk in result.chunks)
+    offset = len(result.chunks[0].audio)
+    np.testing.assert_array_equal(result.chunks[1].audio, result.audio[offset:offset + len(result.chunks[1].audio)])
+
+def test_synthesize_empty_text():
+    result = synthesize("", tts_engine=StubEngine())
+    assert result.chunks == []
+    assert len(result.audio) == 0
+
+def test_batches_give_the_same_audio():
+    texts = list(enumerate(["One sentence.", "Another sentence.", "A last one."]))
+    single = list(iter_audio_chunks(StubEngine(), texts, batch_size=1, voice="af_heart"))
+    batched = list(iter_audio_chunks(StubEngine(), texts, batch_size=2, voice="af_heart"))
+    assert [chunk.index for chunk in batched] == [0, 1, 2]
+    for a, b in zip(single, batched):
+        np.testing.assert_array_equal(a.audio, b.audio)
+
+def test_on_segment_receives_each_segment():
+    segments = []
+    chunks = list(iter_audio_chunks(
+        StubEngine(), enumerate(["One sentence.", "Another sentence."]), on_segment=segments.append, voice="af_heart"
+    ))
+    assert len(segments) == 2
+    for segment, chunk in zip(segments, chunks):
+        np.testing.assert_array_equal(segment, chunk.audio)
@@ -0,0 +1,84 @@
+import io
+
+import numpy as np
+import pytest
+import soundfile as sf
+
+from tts.utils.audio import (
+    OUTPUT_FORMATS, STREAMABLE_FORMATS, AudioEncoding, EncodedBuffer,
+    StreamEncoder, StreamingAudioWriter
+)
+
+SAMPLE_RATE = 24000
+
+def tone(seconds: float) -> np.ndarray:
+    t = np.arange(int(seconds * SAMPLE_RATE)) / SAMPLE_RATE
+    return (0.3 * np.sin(2 * np.pi * 220 * t)).astype(np.float32)
+
+@pytest.mark.parametrize("name", sorted(STREAMABLE_FORMATS))
+def test_streamed_audio_decodes_to_full_length(name):
+    audio = tone(4.0)
+    encoder = StreamEncoder(SAMPLE_RATE, AudioEncoding(name))
+    data = b"".join(encoder.encode(chunk) for chunk in np.array_split(audio, 4))
+    data += encoder.close()
+    decoded, sample_rate = sf.read(io.BytesIO(data), dtype="float32")
+    assert sample_rate == SAMPLE_RATE
+    assert len(decoded) == len(audio)
+
+@pytest.mark.parametrize("name", sorted(set(OUTPUT_FORMATS) - STREAMABLE_FORMATS))
+def test_formats_that_patch_their_header_are_not_streamed(name):
+    with pytest.raises(ValueError):
+        StreamEncoder(SAMPLE_RATE, AudioEncoding(name))
+
+@pytest.mark.parametrize("name", sorted(OUTPUT_FORMATS))
+def test_written_file_decodes_to_full_length(tmp_path, name):
+    encoding = AudioEncoding(name)
+    audio = tone(2.0)
+    output_file = tmp_path / f"output{encoding.suffix}"
+    with StreamingAudioWriter(output_file, SAMPLE_RATE, encoding) as writer:
+        for chunk in np.array_split(audio, 3):
+            writer.write(chunk)
+    with sf.SoundFile(str(output_file)) as f:
+        decoded = f.read(dtype="float32")
+    # MP3 pads the start and end to whole frames
+    assert abs(len(decoded) - len(audio)) <= (2 * 1152 if name == "mp3" else 0)
+
+def test_encoded_buffer_hands_out_bytes_once():
+    buffer = EncodedBuffer()
+    buffer.write(b"abc")
+    assert buffer.take() == b"abc"
+    buffer.write(b"de")
+    # Writes over bytes already taken are dropped
+    buffer.seek(2)
+    buffer.write(b"XY")
+    buffer.seek(0, 2)
+    buffer.write(b"f")
+    assert buffer.take() == b"Yef"
+    assert buffer.tell() == 6
+
+def test_wav_output_can_be_appended(tmp_path):
+    output_file = tmp_path / "output.wav"
+    with StreamingAudioWriter(output_file, SAMPLE_RATE) as writer:
+        writer.write(tone(1.0))
+    with StreamingAudioWriter(output_file, SAMPLE_RATE, append=True) as writer:
+        writer.write(tone(1.0))
+    assert sf.info(str(output_file)).frames == 2 * SAMPLE_RATE
+
+def test_compressed_output_cannot_be_appended(tmp_path):
+    encoding = AudioEncoding("opus")
+    output_file = tmp_path / "output.opus"
+    with StreamingAudioWriter(output_file, SAMPLE_RATE, encoding) as writer:
+        writer.write(tone(1.0))
+    with pytest.raises(ValueError):
+        StreamingAudioWriter(output_file, SAMPLE_RATE, encoding, append=True)
+
+@pytest.mark.parametrize("kwargs", [
+    dict(format="aac"),
+    dict(format="wav", compression_level=0.5),
+    dict(format="opus", compression_level=1.5),
+    dict(format="opus", compression_level=0.5, bitrate_mode="constant"),
+    dict(format="mp3", bitrate_mode="constant"),
+])
+def test_invalid_encodings_are_rejected(kwargs):
+    with pytest.raises(ValueError):
+        AudioEncoding(**kwargs)
@@ -0,0 +1,68 @@
+import pytest
+import soundfile as sf
+
+import tts.batch
+from stub_engine import StubEngine
+
+@pytest.fixture
+def engines(monkeypatch):
+    """Engines handed to batch runs, one per run."""
+    created = []
+    def open_engine(*args, **kwargs):
+        created.append(StubEngine())
+        return created[-1], None
+    monkeypatch.setattr(tts.batch, "open_engine", open_engine)
+    return created
+
+@pytest.fixture
+def inputs(tmp_path):
+    input_dir = tmp_path / "in"
+    input_dir.mkdir()
+    (input_dir / "one.txt").write_text("First file. It has two sentences.")
+    (input_dir / "two.md").write_text("# Second\n\nA Markdown file.")
+    return input_dir
+
+def run(inputs, output_dir, **kwargs):
+    tts.batch.batch(str(inputs), output_dir=str(output_dir), **kwargs)
+
+def test_each_input_is_saved_under_its_stem(engines, inputs, tmp_path):
+    run(inputs, tmp_path / "out")
+    for stem in ("one", "two"):
+        assert sf.info(str(tmp_path / "out" / f"{stem}.wav")).frames > 0
+
+def test_completed_files_are_skipped_on_rerun(engines, inputs, tmp_path):
+    run(inputs, tmp_path / "out")
+    run(inputs, tmp_path / "out")
+    assert engines[1].calls == 0
+
+def test_changed_text_is_synthesized_again(engines, inputs, tmp_path):
+    run(inputs, tmp_path / "out")
+    (inputs / "one.txt").write_text("Different text now.")
+    run(inputs, tmp_path / "out")
+    assert engines[1].calls == 1
+
+@pytest.mark.parametrize("stitch, deleted", [(True, "one.wav"), (False, "one_0.wav")])
+def test_deleted_audio_is_synthesized_again(engines, inputs, tmp_path, stitch, deleted):
+    run(inputs, tmp_path / "out", stitch=stitch)
+    (tmp_path / "out" / deleted).unlink()
+    run(inputs, tmp_path / "out", stitch=stitch)
+    assert (tmp_path / "out" / deleted).exists()
+    assert engines[1].calls > 0
+
+def test_formats_keep_separate_manifests(engines, inputs, tmp_path):
+    run(inputs, tmp_path / "out")
+    run(inputs, tmp_path / "out", format="opus")
+    run(inputs, tmp_path / "out")
+    assert [engine.calls > 0 for engine in engines] == [True, True, False]
+    assert sf.info(str(tmp_path / "out" / "one.opus")).frames > 0
+
+def test_unreadable_inputs_fail_the_batch_after_the_others(engines, inputs, tmp_path):
+    (inputs / "bad.jsonl").write_text("not json\n")
+    with pytest.raises(RuntimeError, match="1 of 3 files failed"):
+        run(inputs, tmp_path / "out")
+    assert (tmp_path / "out" / "one.wav").exists()
+
+def test_inputs_with_the_same_stem_are_rejected(engines, inputs, tmp_path):
+    (inputs / "one.md").write_text("Clash.")
+    with pytest.raises(ValueError):
+        run(inputs, tmp_path / "out")
@@ -0,0 +1,82 @@
+import os
+
+import numpy as np
+
+from stub_engine import StubEngine
+from tts.core.cached import CachedEngine
+from tts.utils.cache import AudioCache
+
+AUDIO = np.linspace(-1, 1, 1000, dtype=np.float32)
+
+def test_entries_round_trip(tmp_path):
+    cache = AudioCache(tmp_path, max_bytes=1 << 20)
+    key = cache.make_key(text="Hello.", voice="bm_george")
+    assert cache.get(key) is None
+    cache.put(key, "Hello.", "həlˈoʊ", AUDIO)
+    graphemes, phonemes, audio = cache.get(key)
+    assert (graphemes, phonemes) == ("Hello.", "həlˈoʊ")
+    assert np.array_equal(audio, AUDIO)
+    assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 1
+
+def test_keys_depend_on_every_parameter():
+    keys = {
+        AudioCache.make_key(text="Hello.", speed=1.0),
+        AudioCache.make_key(text="Hello.", speed=1.1),
+        AudioCache.make_key(text="Hello!", speed=1.0),
+    }
+    assert len(keys) == 3
+    assert AudioCache.make_key(a=1, b=2) == AudioCache.make_key(b=2, a=1)
+
+def test_corrupt_entry_is_a_miss(tmp_path):
+    cache = AudioCache(tmp_path, max_bytes=1 << 20)
+    key = cache.make_key(text="Hello.")
+    cache.put(key, "Hello.", "", AUDIO)
+    cache._path(key).write_bytes(b"not an npz file")
+    assert cache.get(key) is None
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    cache = AudioCache(tmp_path, max_bytes=1 << 20)
+    keys = [cache.make_key(index=i) for i in range(4)]
+    for age, key in enumerate(keys):
+        cache.put(key, "", "", AUDIO)
+        os.utime(cache._path(key), (1000 + age, 1000 + age))
+    # Reading the oldest entry makes it the most recently used
+    assert cache.get(keys[0]) is not None
+    entry_bytes = cache._path(keys[0]).stat().st_size
+    cache.max_bytes = 3 * entry_bytes
+    cache.put(cache.make_key(index=4), "", "", AUDIO)
+    survivors = [key for key in keys if cache._path(key).exists()]
+    assert keys[1] not in survivors and keys[0] in survivors
+    assert cache.stats()["size_bytes"] <= cache.max_bytes * AudioCache.LOW_WATER
+
+def test_full_cache_is_not_rescanned_on_every_write(tmp_path, monkeypatch):
+    cache = AudioCache(tmp_path, max_bytes=1 << 20)
+    cache.put(cache.make_key(index=0), "", "", AUDIO)
+    cache.max_bytes = 20 * cache.stats()["size_bytes"]
+    scans = []
+    evict = cache.evict
+    monkeypatch.setattr(cache, "evict", lambda: (scans.append(1), evict()))
+    for i in range(1, 100):
+        cache.put(cache.make_key(index=i), "", "", AUDIO)
+    assert 0 < len(scans) < 99 // 2
+    assert cache.stats()["size_bytes"] <= cache.max_bytes
+
+def test_rewriting_an_entry_does_not_grow_the_size(tmp_path):
+    cache = AudioCache(tmp_path, max_bytes=1 << 20)
+    key = cache.make_key(text="Hello.")
+    cache.put(key, "Hello.", "", AUDIO)
+    size = cache.stats()["size_bytes"]
+    cache.put(key, "Hello.", "", AUDIO)
+    assert cache.stats()["size_bytes"] == size
+
+def test_cached_engine_synthesizes_only_misses(tmp_path):
+    engine = StubEngine()
+    cached = CachedEngine(engine, AudioCache(tmp_path, max_bytes=1 << 20), engine_type="stub")
+    first = cached.generate_batch(["One.", "Two."], voice="bm_george")
+    second = cached.generate_batch(["Two.", "Three."], voice="bm_george")
+    streamed = list(cached.generate_stream("Three.", voice="bm_george"))
+    assert engine.calls == 3
+    assert np.array_equal(second[0][2], first[1][2])
+    assert len(streamed) == 1 and np.array_equal(streamed[0][2], second[1][2])
+    cached.generate("One.", voice="af_heart")
+    assert engine.calls == 4
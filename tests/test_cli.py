@@ -0,0 +1,23 @@
+import io
+import os
+
+from tts.cli import iter_stdin
+
+def open_pipe():
+    read_fd, write_fd = os.pipe()
+    return io.TextIOWrapper(open(read_fd, "rb"), encoding="utf-8"), write_fd
+
+def test_stdin_text_is_yielded_before_the_pipe_closes():
+    stream, write_fd = open_pipe()
+    blocks = iter_stdin(stream)
+    os.write(write_fd, b"First sentence.\n")
+    # Would block until the writer closes the pipe if stdin were read in full blocks
+    assert next(blocks) == "First sentence.\n"
+    os.write(write_fd, "Café".encode("utf-8")[:-1])
+    os.write(write_fd, "é more.\n".encode("utf-8")[1:])
+    os.close(write_fd)
+    assert "".join(blocks) == "Café more.\n"
+    stream.close()
+
+def test_stdin_without_a_byte_buffer_is_read_by_line():
+    assert list(iter_stdin(io.StringIO("One.\nTwo.\n"))) == ["One.\n", "Two.\n"]
@@ -0,0 +1,82 @@
+import io
+import json
+import socket
+import threading
+
+import numpy as np
+import pytest
+
+from stub_engine import StubEngine
+from tts.core import TTSEngineType
+from tts.core.pool import EnginePool
+from tts.server.client import RemoteEngine, connect_daemon
+from tts.server.daemon import SynthesisServer, remove_stale_socket
+from tts.server.protocol import MAX_PAYLOAD_BYTES, decode_audio, encode_audio, read_message, send_message
+
+@pytest.fixture
+def socket_path(tmp_path):
+    path = str(tmp_path / "tts.sock")
+    server = SynthesisServer(path, EnginePool(lambda *key: StubEngine()))
+    thread = threading.Thread(target=server.serve_forever, args=(0.01,), daemon=True)
+    thread.start()
+    yield path
+    server.shutdown()
+    server.server_close()
+
+def test_message_round_trip():
+    stream = io.BytesIO()
+    audio = np.linspace(-1, 1, 100, dtype=np.float32)
+    send_message(stream, {"op": "generate"}, encode_audio(audio))
+    stream.seek(0)
+    header, payload = read_message(stream)
+    assert header == {"op": "generate", "nbytes": 400}
+    assert np.array_equal(decode_audio(payload), audio)
+
+def test_remote_engine_matches_local_engine(socket_path):
+    engine = connect_daemon(TTSEngineType.KOKORO, "en-gb", socket_path=socket_path)
+    try:
+        graphemes, _, audio = engine.generate("Hello there.", voice="bm_george")
+        assert engine.sample_rate == StubEngine().sample_rate
+        assert graphemes == "Hello there."
+        assert np.array_equal(audio, StubEngine().generate("Hello there.")[2])
+    finally:
+        engine.close()
+
+def test_daemon_errors_are_raised_by_the_client(socket_path):
+    with pytest.raises(RuntimeError):
+        RemoteEngine(TTSEngineType.CHATTERBOX, "fr-fr", socket_path=socket_path)
+
+@pytest.mark.parametrize("line", [
+    b"not json\n",
+    b"[1, 2]\n",
+    b"\xff\n",
+    b'{"op": "ping", "nbytes": "x"}\n',
+    b'{"op": "ping", "nbytes": -1}\n',
+    b'{"op": "ping", "nbytes": true}\n',
+    json.dumps({"op": "ping", "nbytes": MAX_PAYLOAD_BYTES + 1}).encode() + b"\n",
+])
+def test_malformed_requests_get_an_error_reply(socket_path, line):
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(socket_path)
+        sock.settimeout(5)
+        rfile, wfile = sock.makefile("rb"), sock.makefile("wb")
+        wfile.write(line)
+        wfile.flush()
+        response, _ = read_message(rfile)
+        assert response["ok"] is False
+        # The connection stays usable
+        send_message(wfile, {"op": "ping"})
+        response, _ = read_message(rfile)
+        assert response["ok"] is True
+
+def test_no_daemon_means_no_remote_engine(tmp_path):
+    assert connect_daemon(TTSEngineType.KOKORO, "en-gb", socket_path=str(tmp_path / "none.sock")) is None
+
+def test_stale_socket_is_removed_but_a_live_one_is_not(tmp_path, socket_path):
+    stale = tmp_path / "stale.sock"
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.bind(str(stale))
+    remove_stale_socket(str(stale))
+    assert not stale.exists()
+    with pytest.raises(RuntimeError):
+        remove_stale_socket(socket_path)
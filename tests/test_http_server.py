@@ -0,0 +1,94 @@
+import http.client
+import io
+import json
+import threading
+
+import numpy as np
+import pytest
+import soundfile as sf
+
+from stub_engine import StubEngine
+from tts.core.pool import EnginePool
+from tts.server.http_server import HTTPSynthesisServer
+
+class CheckedStubEngine(StubEngine):
+    """StubEngine that rejects unknown voices and fails on request."""
+
+    def generate(self, text, voice=None, speed=1.0, **kwargs):
+        if voice not in ("bm_george", "af_heart"):
+            raise ValueError(f"Voice '{voice}' not found")
+        if "explode" in text:
+            raise RuntimeError("engine failure")
+        return super().generate(text, voice, speed, **kwargs)
+
+def start_server(max_queue: int = 4) -> HTTPSynthesisServer:
+    pool = EnginePool(lambda *key: CheckedStubEngine())
+    server = HTTPSynthesisServer(("127.0.0.1", 0), pool, "kokoro", "en-gb", max_queue=max_queue)
+    threading.Thread(target=server.serve_forever, args=(0.01,), daemon=True).start()
+    return server
+
+@pytest.fixture
+def server():
+    server = start_server()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+def request(server, method, path, body=None, headers=None):
+    connection = http.client.HTTPConnection(*server.server_address, timeout=10)
+    try:
+        connection.request(method, path, body=body, headers=headers or {})
+        response = connection.getresponse()
+        return response.status, response.getheader("Content-Type"), response.read()
+    finally:
+        connection.close()
+
+def test_wav_is_streamed_for_every_chunk(server):
+    text = "First sentence here. Second one. Third one. Fourth one."
+    status, content_type, body = request(server, "POST", "/synthesize?sentences_per_chunk=2", text)
+    assert (status, content_type) == (200, "audio/wav")
+    # The streamed header has no length, so skip it and read the samples
+    audio = np.frombuffer(body[44:], dtype="<i2")
+    engine = StubEngine()
+    expected = sum(len(engine.generate(chunk)[2]) for chunk in ["First sentence here. Second one.", "Third one. Fourth one."])
+    assert len(audio) == expected
+
+def test_opus_is_streamed_as_a_valid_file(server):
+    body = json.dumps({"text": "Hello there. General greeting.", "format": "opus"})
+    status, content_type, data = request(server, "POST", "/synthesize", body, {"Content-Type": "application/json"})
+    assert status == 200 and content_type.startswith("audio/ogg")
+    audio, _ = sf.read(io.BytesIO(data))
+    assert len(audio) == len(StubEngine().generate("Hello there. General greeting.")[2])
+
+@pytest.mark.parametrize("path, body", [
+    ("/synthesize?voice=nobody", "Hello."),
+    ("/synthesize?format=mp3", "Hello."),
+    ("/synthesize?colour=blue", "Hello."),
+    ("/synthesize?speed=fast", "Hello."),
+    ("/synthesize?language=xx", "Hello."),
+    ("/synthesize?chunk_chars=10&min_chunk_chars=20", "Hello."),
+    ("/synthesize", "   "),
+])
+def test_bad_requests_get_400_before_any_audio(server, path, body):
+    status, content_type, data = request(server, "POST", path, body)
+    assert (status, content_type) == (400, "application/json")
+    assert "error" in json.loads(data)
+
+def test_engine_failure_on_the_first_chunk_gets_500(server):
+    status, _, data = request(server, "POST", "/synthesize", "Please explode now.")
+    assert status == 500
+    assert json.loads(data) == {"error": "engine failure"}
+
+def test_unknown_path_gets_404(server):
+    assert request(server, "GET", "/nothing")[0] == 404
+    assert request(server, "POST", "/nothing", "Hello.")[0] == 404
+
+def test_saturated_server_gets_503():
+    server = start_server(max_queue=0)
+    try:
+        status, _, _ = request(server, "POST", "/synthesize", "Hello.")
+        assert status == 503
+        assert json.loads(request(server, "GET", "/health")[2])["rejected"] == 1
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,56 @@
+from tts.cli import load_resumable_manifest
+from tts.models.manifest import JOB_COMPLETE, JOB_RUNNING, ChunkManifest
+
+def make_manifest(chunks: int = 3) -> ChunkManifest:
+    manifest = ChunkManifest(filename="speech", sample_rate=24000, params_hash="p1")
+    for index in range(chunks):
+        manifest.add(index, frames=100 * (index + 1), file=f"speech_{index}.wav", text_hash=f"t{index}")
+    return manifest
+
+def test_chunks_are_placed_one_after_another():
+    manifest = make_manifest()
+    assert [record.offset for record in manifest.chunks] == [0, 100, 300]
+    assert manifest.total_frames == 600
+
+def test_saved_manifest_loads_back(tmp_path):
+    path = ChunkManifest.path_for(tmp_path, "speech", ".wav")
+    manifest = make_manifest()
+    manifest.status = JOB_COMPLETE
+    manifest.save(path)
+    assert ChunkManifest.load(path) == manifest
+    assert [p.name for p in tmp_path.iterdir()] == ["speech.wav.manifest.jsonl"]
+
+def test_appended_chunks_load_back(tmp_path):
+    path = ChunkManifest.path_for(tmp_path, "speech", ".wav")
+    manifest = make_manifest(chunks=0)
+    manifest.save(path)
+    for index in range(3):
+        manifest.append(manifest.add(index, frames=10, text_hash=f"t{index}"), path)
+    loaded = ChunkManifest.load(path)
+    assert loaded.status == JOB_RUNNING
+    assert loaded.chunks == manifest.chunks
+
+def test_torn_last_line_is_ignored(tmp_path):
+    path = ChunkManifest.path_for(tmp_path, "speech", ".wav")
+    make_manifest().save(path)
+    with open(path, "a", encoding="utf-8") as f:
+        f.write('{"type": "chunk", "index": 3, "fra')
+    assert len(ChunkManifest.load(path).chunks) == 3
+
+def test_completed_chunk_requires_the_same_text():
+    manifest = make_manifest()
+    assert manifest.completed_chunk(1, "t1") is manifest.chunks[1]
+    assert manifest.completed_chunk(1, "other") is None
+    assert manifest.completed_chunk(5, "t5") is None
+
+def test_resume_requires_the_same_parameters(tmp_path):
+    path = ChunkManifest.path_for(tmp_path, "speech", ".wav")
+    assert load_resumable_manifest(path, "p1") is None
+    make_manifest().save(path)
+    assert load_resumable_manifest(path, "p1") == make_manifest()
+    assert load_resumable_manifest(path, "p2") is None
+
+def test_unreadable_manifest_is_ignored(tmp_path):
+    path = ChunkManifest.path_for(tmp_path, "speech", ".wav")
+    path.write_text("not a manifest\n")
+    assert load_resumable_manifest(path, "p1") is None
@@ -0,0 +1,35 @@
+import pytest
+
+from tts.utils.markdown_text import iter_markdown_text, markdown_to_text
+
+@pytest.mark.parametrize("markdown, expected", [
+    ("# Title\n\nSome *emphasis* and **bold** text", "Title.\n\nSome emphasis and bold text."),
+    ("Setext heading\n===\n\nBody", "Setext heading.\n\nBody."),
+    ("- first\n- second item", "first.\n\nsecond item."),
+    ("1. one\n2. two", "one.\n\ntwo."),
+    ("> quoted\n> text", "quoted text."),
+    ("Read [the docs](https://example.com) now", "Read the docs now."),
+    ("See ![logo](logo.png) here", "See here."),
+    ("Visit https://example.com.", "Visit."),
+    ("A <https://example.com> link", "A link."),
+    ("Use `code` inline", "Use code inline."),
+    ("Compute 2*3*4 and keep snake_case_names", "Compute 2*3*4 and keep snake_case_names."),
+    ("Escaped \\*stars\\* &amp; entities", "Escaped *stars* & entities."),
+    ("Note[^1] here\n\n[^1]: A footnote", "Note here."),
+    ("Before\n\n<!-- hidden\ncomment -->\n\nAfter", "Before.\n\nAfter."),
+])
+def test_markdown_to_text(markdown, expected):
+    assert markdown_to_text(markdown) == expected
+
+def test_code_blocks_are_skipped():
+    markdown = "Intro\n\n```python\nprint('hi')\n```\n\n    indented code\n\nOutro"
+    assert markdown_to_text(markdown) == "Intro.\n\nOutro."
+
+def test_tables_are_read_row_by_row():
+    markdown = "| Name | Age |\n|---|---:|\n| Ann | 30 |"
+    assert markdown_to_text(markdown) == "Name, Age.\n\nAnn, 30."
+
+def test_streamed_blocks_give_the_same_text():
+    markdown = "# Title\n\nA paragraph\nspanning lines.\n\n- item *one*\n- item two\n\n```\ncode\n```\nEnd"
+    blocks = [markdown[i:i + 7] for i in range(0, len(markdown), 7)]
+    assert "".join(iter_markdown_text(blocks)).strip() == markdown_to_text(markdown)
@@ -0,0 +1,52 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from stub_engine import StubEngine
+from tts.core import parallel
+from tts.core.engine import TTSEngineType
+from tts.core.parallel import ProcessPoolEngine
+
+class RecordingStubEngine(StubEngine):
+    """StubEngine that records the batches it is given."""
+
+    batches = []
+
+    def generate_batch(self, texts, voice, **kwargs):
+        self.batches.append(list(texts))
+        return super().generate_batch(texts, voice, **kwargs)
+
+@pytest.fixture
+def engine(monkeypatch):
+    # Worker threads sharing a stub engine stand in for processes loading a model
+    def thread_pool(max_workers, mp_context, initializer, initargs):
+        return ThreadPoolExecutor(max_workers=max_workers, initializer=initializer, initargs=initargs)
+
+    def init_worker(engine_type, language, device, torch_threads):
+        parallel._worker_engine = RecordingStubEngine()
+
+    RecordingStubEngine.batches = []
+    monkeypatch.setattr(parallel, "ProcessPoolExecutor", thread_pool)
+    monkeypatch.setattr(parallel, "_init_worker", init_worker)
+    monkeypatch.setattr(parallel, "_worker_engine", None)
+    engine = ProcessPoolEngine(TTSEngineType.KOKORO, "en-gb", workers=3, torch_threads=1)
+    yield engine
+    engine.close()
+
+def test_results_keep_input_order(engine):
+    texts = [f"Sentence number {i}." for i in range(7)]
+    results = engine.generate_batch(texts, voice="af_heart")
+    assert [graphemes for graphemes, _, _ in results] == texts
+    expected = StubEngine().generate_batch(texts, voice="af_heart")
+    for (_, _, audio), (_, _, expected_audio) in zip(results, expected):
+        np.testing.assert_array_equal(audio, expected_audio)
+
+def test_texts_are_split_into_one_contiguous_shard_per_worker(engine):
+    texts = [f"Sentence number {i}." for i in range(7)]
+    engine.generate_batch(texts, voice="af_heart")
+    assert sorted(RecordingStubEngine.batches) == [texts[0:3], texts[3:6], texts[6:7]]
+
+def test_generate_returns_a_single_result(engine):
+    assert engine.sample_rate == 24000
+    assert engine.generate("Hello there.", voice="af_heart")[0] == "Hello there."
@@ -0,0 +1,83 @@
+import sys
+import threading
+import types
+
+import numpy as np
+import pytest
+
+from tts.utils.playback import StreamingPlayer
+
+class FakeOutputStream:
+    """Records written audio in place of a sounddevice output stream."""
+
+    fail_on_open = None
+    fail_on_write = None
+
+    def __init__(self, samplerate, channels, dtype):
+        if self.fail_on_open is not None:
+            raise self.fail_on_open
+        self.written = []
+        self.aborted = False
+        FakeOutputStream.last = self
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def write(self, audio):
+        if self.fail_on_write is not None:
+            raise self.fail_on_write
+        self.written.append(audio.copy())
+
+    def abort(self):
+        self.aborted = True
+
+@pytest.fixture
+def output_stream(monkeypatch):
+    stream = type("Stream", (FakeOutputStream,), {})
+    monkeypatch.setitem(sys.modules, "sounddevice", types.SimpleNamespace(OutputStream=stream))
+    return stream
+
+def enqueue_all(player, chunks):
+    """Enqueue chunks on a thread, failing the test instead of hanging."""
+    errors = []
+    def produce():
+        try:
+            for chunk in chunks:
+                player.enqueue(chunk)
+        except Exception as e:
+            errors.append(e)
+    thread = threading.Thread(target=produce, daemon=True)
+    thread.start()
+    thread.join(timeout=5)
+    assert not thread.is_alive(), "enqueue blocked on a failed player"
+    return errors
+
+def test_queued_audio_is_played_in_order(output_stream):
+    chunks = [np.full(10, i, dtype=np.float32) for i in range(5)]
+    with StreamingPlayer(24000, max_queue=2) as player:
+        assert enqueue_all(player, chunks) == []
+    written = np.concatenate(output_stream.last.written).ravel()
+    assert np.array_equal(written, np.concatenate(chunks))
+
+@pytest.mark.parametrize("where", ["fail_on_open", "fail_on_write"])
+def test_playback_errors_reach_the_producer(output_stream, where):
+    setattr(output_stream, where, ValueError("bad stream"))
+    player = StreamingPlayer(24000, max_queue=1).start()
+    errors = enqueue_all(player, [np.zeros(10, dtype=np.float32)] * 20)
+    assert [type(e) for e in errors] == [ValueError]
+    with pytest.raises(ValueError):
+        player.close()
+
+def test_abort_stops_the_stream_without_raising(output_stream):
+    player = StreamingPlayer(24000).start()
+    player.enqueue(np.zeros(10, dtype=np.float32))
+    player.close(drain=False)
+    assert output_stream.last.aborted
+
+def test_abort_after_a_failure_does_not_raise(output_stream):
+    output_stream.fail_on_open = ValueError("bad stream")
+    player = StreamingPlayer(24000).start()
+    player.close(drain=False)
@@ -0,0 +1,76 @@
+import json
+
+import pytest
+
+from stub_engine import StubEngine
+from tts.cli import synthesize_chunks
+from tts.config.settings import OutputMode
+from tts.utils.profiling import (
+    Profiler, profile_hooks_registered, profile_stage,
+    register_profile_hook, unregister_profile_hook
+)
+
+def test_stages_accumulate_time_and_calls():
+    profiler = Profiler()
+    for _ in range(3):
+        with profiler.stage("text"):
+            pass
+    profiler.add_time("synthesis", 1.5)
+    profiler.add_time("synthesis", 0.5)
+    assert profiler.stages["text"].calls == 3
+    assert profiler.stages["synthesis"].seconds == 2.0
+    assert profiler.stages["synthesis"].calls == 2
+
+def test_iter_stage_times_each_step():
+    profiler = Profiler()
+    assert list(profiler.iter_stage("text", ["a", "b"])) == ["a", "b"]
+    # One step per item plus the one that finds the end
+    assert profiler.stages["text"].calls == 3
+
+def test_profile_stage_without_a_profiler_is_a_no_op():
+    with profile_stage(None, "text"):
+        pass
+
+def test_report_totals():
+    profiler = Profiler(metadata={"engine": "stub"})
+    profiler.record_chunk(0, characters=10, audio_seconds=2.0, synthesis_seconds=1.0, output_seconds=0.1)
+    profiler.record_chunk(1, characters=20, audio_seconds=2.0, synthesis_seconds=0.5, output_seconds=0.1)
+    report = profiler.finish()
+    assert report["engine"] == "stub"
+    assert report["audio_seconds"] == 4.0
+    assert report["synthesis_rtf"] == pytest.approx(1.5 / 4.0)
+    assert report["chunks"][0]["rtf"] == 0.5
+    assert report["first_chunk_seconds"] == profiler.chunks[0].ready_seconds
+    json.dumps(report)
+
+def test_hooks_receive_the_report():
+    reports = []
+    hook = register_profile_hook(reports.append)
+    try:
+        assert profile_hooks_registered()
+        Profiler().finish()
+    finally:
+        unregister_profile_hook(hook)
+    assert not profile_hooks_registered()
+    assert len(reports) == 1
+    assert reports[0]["chunks"] == []
+
+def test_synthesis_records_every_chunk(tmp_path):
+    profiler = Profiler()
+    texts = ["One sentence.", "Another, longer sentence.", "A last one."]
+    synthesize_chunks(
+        StubEngine(), texts, OutputMode.SAVE, tmp_path, "speech",
+        profiler=profiler, verbose=False
+    )
+    assert [chunk.index for chunk in profiler.chunks] == [0, 1, 2]
+    assert [chunk.characters for chunk in profiler.chunks] == [len(text) for text in texts]
+    assert profiler.chunks[1].audio_seconds == pytest.approx(len(texts[1]) / 15.0, abs=1e-3)
+    assert profiler.stages["synthesis"].calls == 3
+    assert profiler.stages["output"].calls == 3
+
+def test_saved_report_is_json(tmp_path):
+    profiler = Profiler()
+    profiler.add_time("synthesis", 0.25)
+    path = tmp_path / "profile.json"
+    profiler.save_json(path)
+    assert json.loads(path.read_text())["stages"]["synthesis"] == {"seconds": 0.25, "calls": 1}
@@ -0,0 +1,84 @@
+import io
+import zipfile
+
+import pytest
+
+from tts.utils import readers
+from tts.utils.readers import get_reader, read_input_file, register_reader
+
+def read(suffix: str, data: bytes) -> str:
+    return "".join(get_reader(suffix)(io.BytesIO(data)))
+
+def test_text_drops_byte_order_mark():
+    assert read(".txt", "\ufeffHello wörld".encode("utf-8")) == "Hello wörld"
+
+def test_text_decodes_characters_split_across_blocks():
+    data = "héllo wörld".encode("utf-8")
+    blocks = list(readers.iter_decoded(io.BytesIO(data), block_size=1))
+    assert "".join(blocks) == "héllo wörld"
+
+def test_html_skips_scripts_and_splits_blocks():
+    html = (b"<html><head><title>T</title></head><body><h1>Title</h1>"
+            b"<script>var x;</script><p>Para &amp; more<br>next</p>"
+            b"<table><tr><td>a</td><td>b</td></tr></table></body></html>")
+    assert read(".html", html) == "Title.\n\nPara & more.\n\nnext.\n\na, b.\n\n"
+
+def test_subtitles_keep_only_cue_text():
+    srt = (b"1\n00:00:01,000 --> 00:00:02,000\n<i>Hello</i> there\n\n"
+           b"2\n00:00:02,000 --> 00:00:03,000\nHello there\n\n"
+           b"3\n00:00:03,000 --> 00:00:04,000\nGoodbye\n")
+    assert read(".srt", srt) == "Hello there\nGoodbye\n"
+    vtt = b"WEBVTT\n\nNOTE a comment\n\n00:01.000 --> 00:02.000 align:start\n{\\an8}Cue text\n"
+    assert read(".vtt", vtt) == "Cue text\n"
+
+def test_jsonl_reads_strings_and_text_fields():
+    jsonl = b'"First line"\n\n{"text": "Second line!", "speaker": "a"}\n'
+    assert read(".jsonl", jsonl) == "First line.\n\nSecond line!\n\n"
+
+@pytest.mark.parametrize("line", [b"not json\n", b'{"speaker": "a"}\n', b"42\n"])
+def test_jsonl_rejects_invalid_lines(line):
+    with pytest.raises(ValueError):
+        read(".jsonl", line)
+
+def make_epub() -> bytes:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as epub:
+        epub.writestr("mimetype", "application/epub+zip")
+        epub.writestr("META-INF/container.xml", (
+            '<container xmlns="urn:oasis:names:tc:opendocument:xmlns:container"><rootfiles>'
+            '<rootfile full-path="OEBPS/content.opf"/></rootfiles></container>'))
+        epub.writestr("OEBPS/content.opf", (
+            '<package xmlns="http://www.idpf.org/2007/opf"><manifest>'
+            '<item id="c1" href="one.xhtml" media-type="application/xhtml+xml"/>'
+            '<item id="c2" href="text/two.xhtml" media-type="application/xhtml+xml"/>'
+            '<item id="css" href="style.css" media-type="text/css"/>'
+            '</manifest><spine><itemref idref="c2"/><itemref idref="css"/><itemref idref="c1"/></spine></package>'))
+        epub.writestr("OEBPS/one.xhtml", "<html><body><p>Chapter one</p></body></html>")
+        epub.writestr("OEBPS/text/two.xhtml", "<html><body><p>Chapter two</p></body></html>")
+    return buffer.getvalue()
+
+def test_epub_is_read_in_spine_order():
+    assert read(".epub", make_epub()) == "Chapter two.\n\nChapter one.\n\n"
+
+def test_epub_without_container_is_rejected():
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as epub:
+        epub.writestr("mimetype", "application/epub+zip")
+    with pytest.raises(ValueError):
+        read(".epub", buffer.getvalue())
+
+def test_reader_is_chosen_by_suffix_then_mime_type(tmp_path):
+    input_file = tmp_path / "notes.data"
+    input_file.write_text("# Heading\n\nBody")
+    assert read_input_file(str(input_file), mime_type="text/markdown").strip() == "Heading.\n\nBody."
+    with pytest.raises(ValueError):
+        read_input_file(str(input_file))
+    with pytest.raises(FileNotFoundError):
+        read_input_file(str(tmp_path / "missing.txt"))
+
+def test_registered_reader_is_used(monkeypatch):
+    monkeypatch.setattr(readers, "READERS", dict(readers.READERS))
+    monkeypatch.setattr(readers, "MIME_TYPES", dict(readers.MIME_TYPES))
+    register_reader(lambda stream: iter([stream.read().decode().upper()]), [".RST"], ["text/x-rst"])
+    assert read(".rst", b"shout") == "SHOUT"
+    assert get_reader(mime_type="text/x-rst") is get_reader(".rst")
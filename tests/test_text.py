@@ -0,0 +1,92 @@
+import random
+
+import pytest
+
+from tts.utils.text import (
+    MAX_SENTENCE_CHARS, iter_budget_chunks, iter_sentences, iter_text_chunks
+)
+
+def sentences(text: str, **kwargs) -> list:
+    return list(iter_sentences([text], **kwargs))
+
+def split_blocks(text: str, rng: random.Random) -> list:
+    cuts = sorted(rng.sample(range(1, len(text)), min(5, len(text) - 1)))
+    return [text[start:end] for start, end in zip([0] + cuts, cuts + [len(text)])]
+
+@pytest.mark.parametrize("text, expected", [
+    ("One. Two! Three? Four", ["One.", "Two!", "Three?", "Four"]),
+    ("a b. c d.", ["a b.", "c d."]),
+    ('He said "stop." Then left.', ['He said "stop."', "Then left."]),
+    ("Dr. Smith met J. Doe in the U.S. yesterday.", ["Dr. Smith met J. Doe in the U.S. yesterday."]),
+    ("Wait... what happened? Well… nothing.", ["Wait... what happened?", "Well… nothing."]),
+    ("It trailed off... and then stopped.", ["It trailed off... and then stopped."]),
+    ("Heading\n\nBody text here.", ["Heading.", "Body text here."]),
+    ("Line one\nline two.", ["Line one\nline two."]),
+    ("你好。世界！", ["你好。", "世界！"]),
+])
+def test_sentence_boundaries(text, expected):
+    assert sentences(text) == expected
+
+def test_abbreviations_follow_the_language():
+    text = "Siehe z.B. Seite drei. Danke."
+    assert sentences(text, language="de") == ["Siehe z.B. Seite drei.", "Danke."]
+
+def test_split_pattern_replaces_sentence_boundaries():
+    assert sentences("a, b. c|d", split_pattern=r"\|") == ["a, b. c", "d"]
+
+def test_blocks_split_anywhere_give_the_same_sentences():
+    rng = random.Random(0)
+    words = ["word", "Dr.", "end.", "stop!", "why?", "so...", "U.S.", '"quote."', "\n\n", "next"]
+    for _ in range(200):
+        text = " ".join(rng.choice(words) for _ in range(30))
+        assert list(iter_sentences(split_blocks(text, rng))) == sentences(text)
+
+def test_unbroken_text_is_cut_at_the_limit():
+    text = ("x" * 100 + " ") * 100
+    pieces = list(iter_sentences([text[i:i + 1000] for i in range(0, len(text), 1000)]))
+    assert all(len(piece) <= MAX_SENTENCE_CHARS for piece in pieces)
+    assert " ".join(pieces).split() == text.split()
+
+def test_sentences_are_grouped_by_count():
+    chunks = list(iter_text_chunks(["One. Two. Three. Four"], sentences_per_chunk=2))
+    assert chunks == ["One. Two.", "Three. Four."]
+
+def test_budget_chunks_stay_within_bounds():
+    rng = random.Random(1)
+    # Sentences short enough that a chunk under the minimum always has room for the next
+    text = [" ".join("w" * rng.randint(1, 6) for _ in range(rng.randint(1, 8))) + "." for _ in range(200)]
+    chunks = list(iter_budget_chunks(text, 200, min_chunk_chars=100, max_chunk_chars=300))
+    assert all(len(chunk) <= 300 for chunk in chunks)
+    # The first chunk targets min_chunk_chars, with a floor scaled to match
+    assert len(chunks[0]) >= 50
+    assert all(len(chunk) >= 100 for chunk in chunks[1:-1])
+    assert " ".join(chunks).split() == " ".join(text).split()
+
+def test_budget_chunks_split_overlong_sentences():
+    sentence = ", ".join(["clause of some words"] * 20) + "."
+    chunks = list(iter_budget_chunks([sentence], 50, max_chunk_chars=60))
+    assert all(len(chunk) <= 60 for chunk in chunks)
+    assert len(chunks) > 1
+
+def test_first_chunk_has_its_own_scaled_target():
+    text = ["x" * 38 + "."] * 8
+    chunks = list(iter_budget_chunks(text, 120, first_chunk_chars=40))
+    assert [len(chunk) for chunk in chunks] == [39, 119, 119, 39]
+
+def test_no_chunk_exceeds_the_maximum():
+    rng = random.Random(2)
+    words = ["a", "word", "clause,", "end.", "x" * 500, "https://example.com/" + "p" * 300]
+    for _ in range(50):
+        text = [" ".join(rng.choice(words) for _ in range(rng.randint(1, 30))) for _ in range(10)]
+        chunks = list(iter_budget_chunks(text, 100, max_chunk_chars=200))
+        assert max(len(chunk) for chunk in chunks) <= 200
+        assert "".join("".join(chunks).split()).replace(".", "") == "".join("".join(text).split()).replace(".", "")
+
+def test_first_chunk_is_shorter_by_default():
+    text = ["x" * 38 + "."] * 8
+    chunks = list(iter_budget_chunks(text, 120))
+    assert len(chunks[0]) < len(chunks[1])
+
+def test_invalid_budget_is_rejected():
+    with pytest.raises(ValueError):
+        list(iter_budget_chunks(["a."], 100, min_chunk_chars=200))
@@ -3,7 +3,20 @@ TTS command line tool for generating speech from text in multiple languages.
 Supports both Kokoro and Chatterbox TTS engines.
 """
 
-from .cli import generate_speech, main
+from .api import synthesize, synthesize_stream
+from .aio import AsyncTTS
+from .models.result import SynthesisResult
 
 __version__ = "0.1.0"
-__all__ = ["generate_speech", "main"]
+__all__ = [
+    "generate_speech", "main", "synthesize", "synthesize_stream",
+    "SynthesisResult", "AsyncTTS"
+]
+
+def __getattr__(name: str):
+    # The command line tool is only imported when used, so the library and
+    # server APIs load without its playback and CLI dependencies
+    if name in ("generate_speech", "main"):
+        from . import cli
+        return getattr(cli, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
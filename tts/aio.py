@@ -0,0 +1,149 @@
+"""
+Asyncio interface to the TTS engines.
+
+Synthesis runs in a thread pool so that callers such as aiohttp services do
+not block their event loop while the model is working.
+"""
+
+import asyncio
+import time
+from concurrent.futures import Executor, ThreadPoolExecutor
+from functools import partial
+from typing import AsyncIterator, Optional
+import numpy as np
+
+from .api import create_tts_engine, parse_engine_type, validate_language
+from .core import TTSEngine
+from .config.settings import (
+    DEFAULT_VOICE, DEFAULT_SPEED, DEFAULT_SENTENCES_PER_CHUNK,
+    DEFAULT_EXAGGERATION, DEFAULT_CFG_WEIGHT
+)
+from .models.audio_chunk import AudioChunk
+from .utils.text import iter_text_chunks
+
+class AsyncTTS:
+    """Run a TTS engine from asyncio code.
+
+    At most ``concurrency`` chunks are synthesized on the engine at the same
+    time; further requests wait their turn without blocking the event loop.
+    Chunks of concurrent requests are interleaved, so a long request does not
+    hold up short ones. Only raise ``concurrency`` above 1 for engines that
+    are safe to call from several threads at once.
+
+    Example:
+        async with await AsyncTTS.load("kokoro", "en-gb") as tts:
+            audio = await tts.synthesize("Hello world.")
+            async for chunk in tts.stream(long_text):
+                await send(chunk.audio)
+    """
+
+    def __init__(self, engine: TTSEngine, concurrency: int = 1, executor: Optional[Executor] = None):
+        """
+        Args:
+            engine: Loaded engine to synthesize with
+            concurrency: Maximum number of chunks synthesized at the same time
+            executor: Executor to run synthesis in; by default a thread pool
+                with ``concurrency`` threads owned by this instance
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        self.engine = engine
+        self.concurrency = concurrency
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._owns_executor = executor is None
+        self._executor = executor or ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="tts-async")
+
+    @classmethod
+    async def load(
+        cls,
+        engine: str = "kokoro",
+        language: str = "en-gb",
+        device: Optional[str] = None,
+        concurrency: int = 1,
+        cache_dir: Optional[str] = None
+    ) -> "AsyncTTS":
+        """Load an engine in the background and return an AsyncTTS for it."""
+        engine_type = parse_engine_type(engine)
+        validate_language(engine_type, language)
+        loop = asyncio.get_running_loop()
+        tts_engine = await loop.run_in_executor(
+            None, partial(create_tts_engine, engine_type, language, device, cache_dir=cache_dir)
+        )
+        return cls(tts_engine, concurrency=concurrency)
+
+    @property
+    def sample_rate(self) -> int:
+        """Sample rate of the audio produced by the engine."""
+        return self.engine.sample_rate
+
+    async def _generate(self, text: str, **params) -> tuple:
+        async with self._semaphore:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, partial(self.engine.generate, text, **params))
+
+    async def stream(
+        self,
+        text: str,
+        voice: str = DEFAULT_VOICE,
+        speed: float = DEFAULT_SPEED,
+        split_pattern: Optional[str] = None,
+        sentences_per_chunk: int = DEFAULT_SENTENCES_PER_CHUNK,
+        chunk_chars: Optional[int] = None,
+        min_chunk_chars: Optional[int] = None,
+        max_chunk_chars: Optional[int] = None,
+        first_chunk_chars: Optional[int] = None,
+        language: Optional[str] = None,
+        audio_prompt_path: Optional[str] = None,
+        exaggeration: float = DEFAULT_EXAGGERATION,
+        cfg_weight: float = DEFAULT_CFG_WEIGHT
+    ) -> AsyncIterator[AudioChunk]:
+        """Split text into chunks and yield each chunk's audio as soon as it is synthesized.
+
+        language selects the abbreviations that do not end a sentence (default: English).
+        """
+        params = dict(
+            voice=voice,
+            speed=speed,
+            audio_prompt_path=audio_prompt_path,
+            exaggeration=exaggeration,
+            cfg_weight=cfg_weight
+        )
+        start = time.perf_counter()
+        texts = iter_text_chunks(
+            [text], split_pattern, sentences_per_chunk,
+            chunk_chars, min_chunk_chars, max_chunk_chars, first_chunk_chars,
+            language=language
+        )
+        for i, chunk_text in enumerate(texts):
+            synthesis_start = time.perf_counter()
+            graphemes, phonemes, audio = await self._generate(chunk_text, **params)
+            yield AudioChunk(
+                text=graphemes,
+                phonemes=phonemes,
+                audio=audio,
+                index=i,
+                sample_rate=self.engine.sample_rate,
+                synthesis_seconds=time.perf_counter() - synthesis_start,
+                ready_seconds=time.perf_counter() - start
+            )
+
+    async def synthesize(self, text: str, **params) -> np.ndarray:
+        """Synthesize text and return its complete audio.
+
+        Accepts the same keyword arguments as stream().
+        """
+        audio = [chunk.audio async for chunk in self.stream(text, **params)]
+        return np.concatenate(audio) if audio else np.zeros(0, dtype=np.float32)
+
+    async def aclose(self) -> None:
+        """Release the engine and, if owned, the executor."""
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(self._executor, self.engine.close)
+        if self._owns_executor:
+            self._executor.shutdown(wait=False)
+
+    async def __aenter__(self) -> "AsyncTTS":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.aclose()
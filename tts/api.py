@@ -0,0 +1,199 @@
+"""
+Library API: synthesize text to audio in memory.
+
+Unlike the command line tool, nothing is played, written to disk or printed
+per chunk; callers receive the audio and its timing metadata.
+"""
+
+import time
+from itertools import islice
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, Optional, Tuple, Union
+import numpy as np
+
+from .core import TTSEngine, TTSEngineType, get_engine_class
+from .config.settings import (
+    DEFAULT_VOICE, DEFAULT_SPEED, DEFAULT_SENTENCES_PER_CHUNK,
+    DEFAULT_EXAGGERATION, DEFAULT_CFG_WEIGHT, DEFAULT_BATCH_SIZE,
+    LANGUAGE_CODES
+)
+from .core.engine import join_segments
+from .models.audio_chunk import AudioChunk
+from .models.result import SynthesisResult
+from .utils.text import iter_text_chunks
+
+def parse_engine_type(engine: str) -> TTSEngineType:
+    """Parse and validate engine type."""
+    try:
+        return TTSEngineType(engine.lower())
+    except ValueError:
+        raise ValueError(f"Invalid engine: {engine}. Must be 'kokoro' or 'chatterbox'")
+
+def validate_language(engine_type: TTSEngineType, language: str) -> None:
+    """Validate language support for the selected engine."""
+    if engine_type == TTSEngineType.KOKORO and language not in LANGUAGE_CODES:
+        raise ValueError(f"Unsupported language code. Must be one of: {', '.join(LANGUAGE_CODES.keys())}")
+    if engine_type == TTSEngineType.CHATTERBOX and language != "en-gb":
+        raise ValueError("Chatterbox currently only supports English (en-gb)")
+
+def create_tts_engine(
+    engine_type: TTSEngineType,
+    language: str,
+    device: str,
+    cache_dir: Optional[str] = None
+) -> TTSEngine:
+    """Create and return the appropriate TTS engine.
+
+    Only the selected backend module is imported. If a cache directory is
+    given, Chatterbox persists audio prompt conditionings beneath it.
+    """
+    engine_class = get_engine_class(engine_type)
+    if engine_type == TTSEngineType.KOKORO:
+        return engine_class(language_code=LANGUAGE_CODES[language])
+    else:  # Chatterbox
+        conditioning_cache_dir = str(Path(cache_dir) / "conditionals") if cache_dir else None
+        return engine_class(device=device, conditioning_cache_dir=conditioning_cache_dir)
+
+def load_engine(engine: str = "kokoro", language: str = "en-gb", device: Optional[str] = None) -> TTSEngine:
+    """Validate the engine name and language and load the engine."""
+    engine_type = parse_engine_type(engine)
+    validate_language(engine_type, language)
+    return create_tts_engine(engine_type, language, device)
+
+def iter_batches(items: Iterable, batch_size: int) -> Iterator[list]:
+    """Yield successive lists of up to batch_size items."""
+    iterator = iter(items)
+    while batch := list(islice(iterator, max(1, batch_size))):
+        yield batch
+
+def iter_audio_chunks(
+    tts_engine: TTSEngine,
+    texts: Iterable[Tuple[int, str]],
+    batch_size: int = 1,
+    on_segment: Optional[Callable[[np.ndarray], None]] = None,
+    **params
+) -> Iterator[AudioChunk]:
+    """Synthesize (index, text) pairs and yield an AudioChunk for each, in order.
+
+    Texts are passed to the engine in batches of batch_size. If on_segment
+    is given, chunks are streamed one at a time instead and on_segment is
+    called with each audio segment as soon as the engine produces it; time
+    spent in on_segment is not counted as synthesis time.
+    The remaining keyword arguments are passed to the engine.
+    """
+    start = time.perf_counter()
+    for batch in iter_batches(texts, 1 if on_segment is not None else batch_size):
+        synthesis_start = time.perf_counter()
+        # Time spent in on_segment, e.g. waiting for room in a playback queue
+        callback_seconds = 0.0
+        if on_segment is not None:
+            segments = []
+            for segment in tts_engine.generate_stream(batch[0][1], **params):
+                callback_start = time.perf_counter()
+                on_segment(segment[2])
+                callback_seconds += time.perf_counter() - callback_start
+                segments.append(segment)
+            results = [join_segments(segments)]
+        else:
+            results = tts_engine.generate_batch([text for _, text in batch], **params)
+        synthesis_seconds = (time.perf_counter() - synthesis_start - callback_seconds) / len(batch)
+        ready_seconds = time.perf_counter() - start
+
+        for (i, _), (graphemes, phonemes, audio) in zip(batch, results):
+            yield AudioChunk(
+                text=graphemes,
+                phonemes=phonemes,
+                audio=audio,
+                index=i,
+                sample_rate=tts_engine.sample_rate,
+                synthesis_seconds=synthesis_seconds,
+                ready_seconds=ready_seconds
+            )
+
+def synthesize_stream(
+    text: Union[str, Iterable[str]],
+    engine: str = "kokoro",
+    language: str = "en-gb",
+    voice: str = DEFAULT_VOICE,
+    speed: float = DEFAULT_SPEED,
+    split_pattern: Optional[str] = None,
+    sentences_per_chunk: int = DEFAULT_SENTENCES_PER_CHUNK,
+    chunk_chars: Optional[int] = None,
+    min_chunk_chars: Optional[int] = None,
+    max_chunk_chars: Optional[int] = None,
+    first_chunk_chars: Optional[int] = None,
+    device: Optional[str] = None,
+    audio_prompt_path: Optional[str] = None,
+    exaggeration: float = DEFAULT_EXAGGERATION,
+    cfg_weight: float = DEFAULT_CFG_WEIGHT,
+    batch_size: int = 1,
+    tts_engine: Optional[TTSEngine] = None
+) -> Iterator[AudioChunk]:
+    """Synthesize text and yield an AudioChunk per text chunk as soon as it is ready.
+
+    Args:
+        text: Text to synthesize, or an iterable of text blocks (e.g. read
+            incrementally from a file) that is chunked as it is consumed
+        tts_engine: Loaded engine to use; by default one is loaded for the
+            given engine, language and device and closed afterwards
+        batch_size: Number of chunks per engine call; larger batches
+            increase throughput but delay the first chunk
+
+    The other arguments are as for the ``tts`` command.
+    """
+    owns_engine = tts_engine is None
+    if owns_engine:
+        tts_engine = load_engine(engine, language, device)
+    blocks = [text] if isinstance(text, str) else text
+    try:
+        yield from iter_audio_chunks(
+            tts_engine,
+            enumerate(iter_text_chunks(
+                blocks, split_pattern, sentences_per_chunk,
+                chunk_chars, min_chunk_chars, max_chunk_chars, first_chunk_chars,
+                language=language
+            )),
+            batch_size=batch_size,
+            voice=voice,
+            speed=speed,
+            audio_prompt_path=audio_prompt_path,
+            exaggeration=exaggeration,
+            cfg_weight=cfg_weight
+        )
+    finally:
+        if owns_engine:
+            tts_engine.close()
+
+def synthesize(
+    text: Union[str, Iterable[str]],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    tts_engine: Optional[TTSEngine] = None,
+    **kwargs
+) -> SynthesisResult:
+    """Synthesize text and return its complete audio with per-chunk timings.
+
+    Accepts the same arguments as synthesize_stream().
+    """
+    start = time.perf_counter()
+    chunks = list(synthesize_stream(text, batch_size=batch_size, tts_engine=tts_engine, **kwargs))
+    if tts_engine is not None:
+        sample_rate = tts_engine.sample_rate
+    elif chunks:
+        sample_rate = chunks[0].sample_rate
+    else:
+        sample_rate = 0
+    audio = np.concatenate([chunk.audio for chunk in chunks]) if chunks else np.zeros(0, dtype=np.float32)
+
+    # Point each chunk at its slice of the joined audio instead of keeping a copy
+    offset = 0
+    for chunk in chunks:
+        frames = len(chunk.audio)
+        chunk.audio = audio[offset:offset + frames]
+        offset += frames
+
+    return SynthesisResult(
+        audio=audio,
+        sample_rate=sample_rate,
+        chunks=chunks,
+        wall_seconds=time.perf_counter() - start
+    )
@@ -0,0 +1,231 @@
+"""
+Batch mode: synthesize many input files in one process.
+
+``tts batch`` loads the engine once and renders every input file to
+``<output_dir>/<stem>.<format>``. Upcoming files are read and chunked on
+background threads while the current one is synthesized. Each output has
+its own manifest, so re-running an interrupted batch skips the files that
+were completed and resumes the one that was cut off.
+"""
+
+import glob
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, List, Optional, Tuple
+
+from .api import parse_engine_type, validate_language
+from .cli import (
+    open_engine, job_params_hash, open_save_job,
+    load_resumable_manifest, synthesize_chunks
+)
+from .config.settings import (
+    OutputMode, DEFAULT_VOICE, DEFAULT_SPEED, DEFAULT_SENTENCES_PER_CHUNK,
+    DEFAULT_EXAGGERATION, DEFAULT_CFG_WEIGHT, DEFAULT_BATCH_SIZE,
+    DEFAULT_SOCKET_PATH, DEFAULT_CACHE_DIR, DEFAULT_CACHE_MAX_MB,
+    DEFAULT_OUTPUT_FORMAT
+)
+from .models.manifest import ChunkManifest, JOB_COMPLETE
+from .utils.audio import AudioEncoding
+from .utils.cache import hash_params
+from .utils.file import prepare_output_directory
+from .utils.readers import READERS, iter_input_file
+from .utils.text import iter_text_chunks
+
+GLOB_CHARACTERS = "*?["
+
+def collect_inputs(inputs: str) -> List[Path]:
+    """Resolve a directory, glob pattern or manifest file into input files.
+
+    A directory yields the files in it with a supported suffix. A manifest
+    is a text file listing one input file per line, relative to the
+    manifest's directory; blank lines and lines starting with # are ignored.
+    """
+    path = Path(inputs)
+    if any(character in inputs for character in GLOB_CHARACTERS):
+        files = [Path(match) for match in sorted(glob.glob(inputs, recursive=True))]
+        files = [file for file in files if file.is_file()]
+    elif path.is_dir():
+        files = sorted(file for file in path.iterdir() if file.is_file() and file.suffix.lower() in READERS)
+    elif path.is_file():
+        with open(path, "r", encoding="utf-8") as f:
+            lines = [line.strip() for line in f]
+        files = [path.parent / line for line in lines if line and not line.startswith("#")]
+    else:
+        raise FileNotFoundError(f"No such directory, manifest or matching files: {inputs}")
+
+    # Outputs are named after the input stem, so stems must be unique
+    seen = {}
+    for file in files:
+        if file.stem in seen:
+            raise ValueError(f"Inputs {seen[file.stem]} and {file} would both be saved as {file.stem}")
+        seen[file.stem] = file
+    return files
+
+def iter_prefetched(load: Callable, items: Iterable, workers: int) -> Iterator[Tuple[object, object, Optional[Exception]]]:
+    """Yield (item, result, error) for each item in order, loading up to 2 * workers items ahead."""
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="tts-batch-read") as executor:
+        items = iter(items)
+        pending = deque((item, executor.submit(load, item)) for item in islice(items, 2 * workers))
+        while pending:
+            item, future = pending.popleft()
+            for next_item in islice(items, 1):
+                pending.append((next_item, executor.submit(load, next_item)))
+            try:
+                result = future.result()
+            except Exception as e:
+                yield item, None, e
+            else:
+                yield item, result, None
+
+def output_files(output_path: Path, manifest: ChunkManifest, encoding: AudioEncoding) -> List[Path]:
+    """Audio files a completed job wrote: its chunk files, or the stitched output."""
+    chunk_files = [output_path / record.file for record in manifest.chunks if record.file]
+    return chunk_files or [output_path / f"{manifest.filename}{encoding.suffix}"]
+
+def batch(
+    inputs: str,
+    output_dir: str = ".",
+    language: str = "en-gb",
+    voice: str = DEFAULT_VOICE,
+    speed: float = DEFAULT_SPEED,
+    split_pattern: Optional[str] = None,
+    sentences_per_chunk: int = DEFAULT_SENTENCES_PER_CHUNK,
+    chunk_chars: Optional[int] = None,
+    min_chunk_chars: Optional[int] = None,
+    max_chunk_chars: Optional[int] = None,
+    first_chunk_chars: Optional[int] = None,
+    stitch: bool = True,
+    format: str = DEFAULT_OUTPUT_FORMAT,
+    compression_level: Optional[float] = None,
+    bitrate_mode: Optional[str] = None,
+    engine: str = "kokoro",
+    device: Optional[str] = None,
+    audio_prompt_path: Optional[str] = None,
+    exaggeration: float = DEFAULT_EXAGGERATION,
+    cfg_weight: float = DEFAULT_CFG_WEIGHT,
+    use_daemon: bool = True,
+    socket_path: str = DEFAULT_SOCKET_PATH,
+    cache_dir: str = DEFAULT_CACHE_DIR,
+    no_cache: bool = False,
+    cache_max_mb: int = DEFAULT_CACHE_MAX_MB,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    workers: int = 1,
+    read_workers: int = 4,
+) -> None:
+    """
+    Synthesize every input file to <output_dir>/<stem>.<format> with one engine.
+
+    inputs is a directory, a glob pattern (quote it) or a manifest file
+    listing one input per line. Files are read and chunked by read_workers
+    threads ahead of synthesis; the other arguments are as for ``tts``.
+    """
+    if read_workers < 1:
+        raise ValueError("read_workers must be at least 1")
+    encoding = AudioEncoding(format, compression_level, bitrate_mode)
+    files = collect_inputs(inputs)
+    if not files:
+        print(f"No input files found in {inputs}")
+        return
+    engine_type = parse_engine_type(engine)
+    validate_language(engine_type, language)
+    output_path = Path(output_dir)
+    prepare_output_directory(output_path)
+
+    def load_texts(file: Path) -> List[str]:
+        return list(iter_text_chunks(
+            iter_input_file(str(file)), split_pattern, sentences_per_chunk,
+            chunk_chars, min_chunk_chars, max_chunk_chars, first_chunk_chars,
+            language=language
+        ))
+
+    start = time.perf_counter()
+    print(f"Synthesizing {len(files)} files into {output_path}")
+    tts_engine, cache = open_engine(
+        engine_type, language, device, workers=workers,
+        use_daemon=use_daemon, socket_path=socket_path,
+        cache_dir=None if no_cache else cache_dir, cache_max_mb=cache_max_mb
+    )
+    load_seconds = time.perf_counter() - start
+    params_hash = job_params_hash(
+        engine_type, language, voice, speed, audio_prompt_path,
+        exaggeration, cfg_weight, tts_engine.sample_rate, stitch, encoding
+    )
+
+    completed, skipped, failed = 0, 0, []
+    characters, audio_seconds = 0, 0.0
+    try:
+        for number, (file, texts, error) in enumerate(iter_prefetched(load_texts, files, read_workers), 1):
+            progress = f"[{number}/{len(files)}] {file.name}"
+            if error is not None:
+                print(f"{progress}: failed to read: {error}")
+                failed.append(file)
+                continue
+            filename = file.stem
+            # Skip outputs completed with the same parameters and text whose audio is still there
+            manifest_file = ChunkManifest.path_for(output_path, filename, encoding.suffix)
+            previous = load_resumable_manifest(manifest_file, params_hash)
+            if previous is not None and previous.status == JOB_COMPLETE and (
+                [record.text_hash for record in previous.chunks] == [hash_params(text=text) for text in texts]
+            ) and all(path.exists() for path in output_files(output_path, previous, encoding)):
+                print(f"{progress}: already synthesized, skipping")
+                skipped += 1
+                continue
+            if not texts:
+                print(f"{progress}: no text, skipping")
+                skipped += 1
+                continue
+
+            file_start = time.perf_counter()
+            manifest, previous, writer = open_save_job(
+                output_path, filename, tts_engine.sample_rate, params_hash,
+                stitch=stitch, resume=True, encoding=encoding
+            )
+            try:
+                synthesize_chunks(
+                    tts_engine, texts, OutputMode.SAVE, output_path, filename,
+                    voice=voice,
+                    speed=speed,
+                    audio_prompt_path=audio_prompt_path,
+                    exaggeration=exaggeration,
+                    cfg_weight=cfg_weight,
+                    manifest=manifest,
+                    previous=previous,
+                    writer=writer,
+                    batch_size=batch_size * workers,
+                    verbose=False,
+                    encoding=encoding
+                )
+            except Exception as e:
+                print(f"{progress}: failed: {e}")
+                failed.append(file)
+                continue
+            finally:
+                if writer is not None:
+                    writer.close()
+            manifest.status = JOB_COMPLETE
+            manifest.save(manifest_file)
+
+            file_audio_seconds = manifest.total_frames / tts_engine.sample_rate
+            file_seconds = time.perf_counter() - file_start
+            completed += 1
+            characters += sum(len(text) for text in texts)
+            audio_seconds += file_audio_seconds
+            print(f"{progress}: {len(texts)} chunks, {file_audio_seconds:.1f}s of audio in {file_seconds:.1f}s")
+    finally:
+        tts_engine.close()
+
+    # Throughput summary
+    wall = time.perf_counter() - start
+    synthesis_wall = wall - load_seconds
+    print(f"\nBatch finished in {wall:.1f}s (engine load {load_seconds:.1f}s): "
+          f"{completed} synthesized, {skipped} skipped, {len(failed)} failed")
+    if completed and synthesis_wall > 0 and audio_seconds > 0:
+        print(f"  {completed / synthesis_wall:.2f} files/s, {characters / synthesis_wall:.0f} chars/s, "
+              f"{audio_seconds:.1f}s of audio (real-time factor {synthesis_wall / audio_seconds:.3f})")
+    if cache is not None:
+        cache.print_stats()
+    if failed:
+        raise RuntimeError(f"{len(failed)} of {len(files)} files failed: {', '.join(str(file) for file in failed)}")
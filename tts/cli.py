@@ -4,39 +4,84 @@ TTS command line tool for generating speech from text in multiple languages.
 Supports both Kokoro and Chatterbox TTS engines.
 """
 
+import codecs
 import sys
+import time
 import fire
+import soundfile as sf
+from importlib import import_module
 from pathlib import Path
-from typing import Optional
+from itertools import chain
+from typing import Iterable, Iterator, Optional, TextIO
 
-from .core.engine import TTSEngineType
-from .utils.audio import process_audio_chunk, stitch_audio_files
-from .utils.file import read_input_file, prepare_output_directory
-from .utils.text import process_text_chunks
+from .api import (
+    create_tts_engine, parse_engine_type, validate_language,
+    iter_audio_chunks
+)
+from .core import TTSEngine, TTSEngineType
+from .core.cached import CachedEngine
+from .core.parallel import ProcessPoolEngine
+from .utils.audio import process_audio_chunk, chunk_file_name, StreamingAudioWriter, AudioEncoding
+from .utils.file import prepare_output_directory, READ_BLOCK_SIZE
+from .utils.readers import iter_input_file
+from .utils.text import iter_text_chunks
+from .utils.cache import AudioCache, file_digest, hash_params
+from .utils.playback import StreamingPlayer
+from .utils.profiling import Profiler, profile_stage, profile_hooks_registered
 from .config.settings import (
     OutputMode, DEFAULT_SAMPLE_RATE, DEFAULT_VOICE,
     DEFAULT_SPEED, DEFAULT_SENTENCES_PER_CHUNK,
     DEFAULT_EXAGGERATION, DEFAULT_CFG_WEIGHT,
-    LANGUAGE_CODES
+    DEFAULT_SOCKET_PATH, DEFAULT_CACHE_DIR, DEFAULT_CACHE_MAX_MB,
+    DEFAULT_BATCH_SIZE, DEFAULT_OUTPUT_FORMAT
 )
-from .models.audio_chunk import AudioChunk
+from .models.manifest import ChunkManifest, JOB_COMPLETE
+from .server.client import connect_daemon
+
+# Subcommand name -> (module, function), imported only when invoked
+SUBCOMMANDS = {
+    "serve": (".server.daemon", "serve"),
+    "http": (".server.http_server", "serve"),
+    "batch": (".batch", "batch"),
+}
+
+def stdin_has_data() -> bool:
+    """Check whether text is piped to standard input, without consuming it."""
+    if sys.stdin is None or sys.stdin.isatty():
+        return False
+    buffer = getattr(sys.stdin, 'buffer', None)
+    if not hasattr(buffer, 'peek'):
+        return True
+    return bool(buffer.peek(1))
+
+def iter_stdin(stream: Optional[TextIO] = None, block_size: int = READ_BLOCK_SIZE) -> Iterator[str]:
+    """Stream standard input as it arrives.
 
-def read_stdin() -> Optional[str]:
-    """Read text from standard input."""
-    if not sys.stdin.isatty():  # Check if stdin has data
-        return sys.stdin.read().strip()
-    return None
+    Each block is whatever the pipe holds, up to block_size bytes, so a
+    writer that pauses does not hold back the text it has already sent.
+    """
+    stream = sys.stdin if stream is None else stream
+    buffer = getattr(stream, 'buffer', None)
+    if not hasattr(buffer, 'read1'):
+        yield from stream
+        return
+    decoder = codecs.getincrementaldecoder(stream.encoding or 'utf-8')(stream.errors or 'strict')
+    while block := buffer.read1(block_size):
+        if text := decoder.decode(block):
+            yield text
+    if text := decoder.decode(b'', final=True):
+        yield text
 
-def validate_inputs(text: Optional[str], input_file: Optional[str]) -> tuple[Optional[str], Optional[str]]:
-    """Validate input parameters and return the text to use."""
-    stdin_text = read_stdin()
+def validate_inputs(text: Optional[str], input_file: Optional[str]) -> tuple[bool, Optional[str]]:
+    """Validate input parameters and return whether to read from stdin."""
+    use_stdin = stdin_has_data()
     
-    if text is None and input_file is None and stdin_text is None:
+    if text is None and input_file is None and not use_stdin:
         raise ValueError("Either text, input_file, or stdin input must be provided")
-    if sum(1 for x in [text, input_file, stdin_text] if x is not None) > 1:
+    if sum(1 for x in [text, input_file] if x is not None) + use_stdin > 1:
         raise ValueError("Cannot provide multiple input sources (text, input_file, or stdin)")
     
-    return stdin_text, input_file
+    return use_stdin, input_file
 
 def parse_output_mode(mode: str) -> OutputMode:
     """Parse and validate output mode."""
@@ -45,28 +90,226 @@ def parse_output_mode(mode: str) -> OutputMode:
     except KeyError:
         raise ValueError(f"Invalid mode: {mode}. Must be 'play', 'save', or 'both'")
 
-def parse_engine_type(engine: str) -> TTSEngineType:
-    """Parse and validate engine type."""
+def synthesize_chunks(
+    tts_engine: TTSEngine,
+    texts: Iterable[str],
+    output_mode: OutputMode,
+    output_path: Optional[Path],
+    filename: str,
+    voice: str = DEFAULT_VOICE,
+    speed: float = DEFAULT_SPEED,
+    audio_prompt_path: Optional[str] = None,
+    exaggeration: float = DEFAULT_EXAGGERATION,
+    cfg_weight: float = DEFAULT_CFG_WEIGHT,
+    wait_after_play: bool = True,
+    player: Optional[StreamingPlayer] = None,
+    writer: Optional[StreamingAudioWriter] = None,
+    manifest: Optional[ChunkManifest] = None,
+    previous: Optional[ChunkManifest] = None,
+    batch_size: int = 1,
+    profiler: Optional[Profiler] = None,
+    verbose: bool = True,
+    encoding: AudioEncoding = AudioEncoding()
+) -> None:
+    """Synthesize each text chunk and play and/or save the result.
+
+    Chunks are passed to the engine in batches of batch_size. If a profiler
+    is given, synthesis and output time is recorded for every chunk. With
+    verbose=False, nothing is printed per chunk. Without a writer, chunks
+    are saved as separate files in the given encoding.
+
+    Saved chunks are recorded in the manifest, if one is given, which is
+    checkpointed after every chunk. Leading chunks already completed in a
+    previous run of the same job are skipped.
+    """
+    manifest_file = None
+    if manifest is not None:
+        manifest_file = ChunkManifest.path_for(output_path, filename, encoding.suffix)
+        # When resuming, the previous manifest stays in place until the runs diverge
+        if previous is None:
+            manifest.save(manifest_file)
+    
+    # Index -> (text hash, length) of the chunks handed to the engine
+    pending = {}
+    
+    def iter_pending():
+        resuming = previous is not None
+        for i, chunk_text in enumerate(texts):
+            text_hash = hash_params(text=chunk_text)
+            
+            # Skip chunks completed by an interrupted run with identical text and parameters
+            if resuming:
+                record = previous.completed_chunk(i, text_hash)
+                if record is not None and (writer is not None or (record.file and (output_path / record.file).exists())):
+                    print(f"Skipping chunk {i} (already synthesized)")
+                    manifest.chunks.append(record)
+                    continue
+                resuming = False
+                manifest.save(manifest_file)
+                if writer is not None:
+                    writer.truncate(manifest.total_frames)
+            pending[i] = (text_hash, len(chunk_text))
+            yield i, chunk_text
+    
+    chunks = iter_audio_chunks(
+        tts_engine, iter_pending(),
+        batch_size=batch_size,
+        # Queue each segment for playback as soon as the engine produces it
+        on_segment=player.enqueue if player is not None else None,
+        voice=voice,
+        speed=speed,
+        audio_prompt_path=audio_prompt_path,
+        exaggeration=exaggeration,
+        cfg_weight=cfg_weight
+    )
+    for chunk in chunks:
+        output_start = time.perf_counter()
+        text_hash, characters = pending.pop(chunk.index)
+        
+        process_audio_chunk(
+            chunk=chunk,
+            output_mode=output_mode,
+            output_path=output_path,
+            filename=filename,
+            sample_rate=tts_engine.sample_rate,
+            wait_after_play=wait_after_play,
+            player=player,
+            writer=writer,
+            verbose=verbose,
+            encoding=encoding
+        )
+        
+        # Checkpoint: audio reaches the disk before the manifest refers to it
+        if manifest is not None:
+            if writer is not None:
+                writer.flush()
+            file = None if writer else chunk_file_name(filename, chunk.index, encoding.suffix)
+            record = manifest.add(chunk.index, len(chunk.audio), file=file, text_hash=text_hash)
+            manifest.append(record, manifest_file)
+        
+        if profiler is not None:
+            output_seconds = time.perf_counter() - output_start
+            profiler.add_time("synthesis", chunk.synthesis_seconds)
+            profiler.add_time("output", output_seconds)
+            profiler.record_chunk(
+                chunk.index,
+                characters=characters,
+                audio_seconds=chunk.duration,
+                synthesis_seconds=chunk.synthesis_seconds,
+                output_seconds=output_seconds
+            )
+    
+    # Drop audio left over from a previous run whose text had more chunks
+    if writer is not None and manifest is not None:
+        writer.truncate(manifest.total_frames)
+
+def load_resumable_manifest(manifest_file: Path, params_hash: str) -> Optional[ChunkManifest]:
+    """Return the manifest of an unfinished or finished run of the same job, if any."""
+    if not manifest_file.exists():
+        return None
     try:
-        return TTSEngineType(engine.lower())
-    except ValueError:
-        raise ValueError(f"Invalid engine: {engine}. Must be 'kokoro' or 'chatterbox'")
-
-def validate_language(engine_type: TTSEngineType, language: str) -> None:
-    """Validate language support for the selected engine."""
-    if engine_type == TTSEngineType.KOKORO and language not in LANGUAGE_CODES:
-        raise ValueError(f"Unsupported language code. Must be one of: {', '.join(LANGUAGE_CODES.keys())}")
-    if engine_type == TTSEngineType.CHATTERBOX and language != "en-gb":
-        raise ValueError("Chatterbox currently only supports English (en-gb)")
-
-def create_tts_engine(engine_type: TTSEngineType, language: str, device: str) -> 'TTSEngine':
-    """Create and return the appropriate TTS engine."""
-    if engine_type == TTSEngineType.KOKORO:
-        from .core.kokoro import KokoroEngine
-        return KokoroEngine(language_code=LANGUAGE_CODES[language])
-    else:  # Chatterbox
-        from .core.chatterbox import ChatterboxEngine
-        return ChatterboxEngine(device=device)
+        previous = ChunkManifest.load(manifest_file)
+    except (OSError, ValueError, TypeError, KeyError, IndexError) as e:
+        print(f"Warning: Ignoring unreadable manifest {manifest_file}: {e}")
+        return None
+    if previous.params_hash != params_hash:
+        return None
+    return previous
+
+def open_engine(
+    engine_type: TTSEngineType,
+    language: str,
+    device: Optional[str],
+    workers: int = 1,
+    use_daemon: bool = True,
+    socket_path: str = DEFAULT_SOCKET_PATH,
+    cache_dir: Optional[str] = DEFAULT_CACHE_DIR,
+    cache_max_mb: int = DEFAULT_CACHE_MAX_MB
+) -> tuple[TTSEngine, Optional[AudioCache]]:
+    """Open the engine for a run and return it with its audio cache, if any.
+
+    Synthesis is sharded across worker processes if workers > 1, forwarded
+    to a running daemon if there is one, or else done by an engine loaded
+    in this process. Unless cache_dir is None, previously synthesized
+    chunks are served from the audio cache.
+    """
+    tts_engine = None
+    if workers > 1:
+        print(f"Starting {workers} synthesis workers")
+        tts_engine = ProcessPoolEngine(engine_type, language, device, workers=workers)
+    elif use_daemon:
+        tts_engine = connect_daemon(engine_type, language, device, socket_path)
+        if tts_engine is not None:
+            print(f"Using TTS daemon at {socket_path}")
+    if tts_engine is None:
+        tts_engine = create_tts_engine(engine_type, language, device, cache_dir=cache_dir)
+    
+    cache = None
+    if cache_dir is not None:
+        cache = AudioCache(Path(cache_dir), max_bytes=cache_max_mb * 1024 * 1024)
+        tts_engine = CachedEngine(tts_engine, cache, engine_type=engine_type.value, language=language)
+    return tts_engine, cache
+
+def job_params_hash(
+    engine_type: TTSEngineType,
+    language: str,
+    voice: str,
+    speed: float,
+    audio_prompt_path: Optional[str],
+    exaggeration: float,
+    cfg_weight: float,
+    sample_rate: int,
+    stitch: bool,
+    encoding: AudioEncoding = AudioEncoding()
+) -> str:
+    """Hash of the parameters that must match for a saved job to be resumed."""
+    return hash_params(
+        engine=engine_type.value,
+        language=language,
+        voice=voice,
+        speed=speed,
+        audio_prompt=file_digest(audio_prompt_path),
+        exaggeration=exaggeration,
+        cfg_weight=cfg_weight,
+        sample_rate=sample_rate,
+        stitch=stitch,
+        format=encoding.format,
+        compression_level=encoding.compression_level,
+        bitrate_mode=encoding.bitrate_mode
+    )
+
+def open_save_job(
+    output_path: Path,
+    filename: str,
+    sample_rate: int,
+    params_hash: str,
+    stitch: bool,
+    resume: bool,
+    encoding: AudioEncoding = AudioEncoding()
+) -> tuple[ChunkManifest, Optional[ChunkManifest], Optional[StreamingAudioWriter]]:
+    """Set up the manifest and, when stitching, the output writer of a save job.
+
+    With resume, a previous run of the same job is picked up where it
+    stopped. A stitched output can only be resumed in an appendable format;
+    compressed outputs are written again from the start. Returns
+    (manifest, previous run's manifest or None, writer or None).
+    """
+    manifest = ChunkManifest(filename=filename, sample_rate=sample_rate, params_hash=params_hash)
+    output_file = output_path / f"{filename}{encoding.suffix}"
+    previous = None
+    if resume and (encoding.appendable or not stitch):
+        manifest_file = ChunkManifest.path_for(output_path, filename, encoding.suffix)
+        previous = load_resumable_manifest(manifest_file, params_hash)
+        if stitch and previous is not None and (
+            not output_file.exists() or sf.info(str(output_file)).frames < previous.total_frames
+        ):
+            previous = None
+        if previous is not None:
+            print(f"Resuming from {len(previous.chunks)} previously completed chunks")
+    writer = None
+    if stitch:
+        writer = StreamingAudioWriter(output_file, sample_rate, encoding, append=previous is not None)
+    return manifest, previous, writer
 
 def generate_speech(
     text: Optional[str] = None,
@@ -78,7 +321,14 @@ def generate_speech(
     speed: float = DEFAULT_SPEED,
     split_pattern: Optional[str] = None,
     sentences_per_chunk: int = DEFAULT_SENTENCES_PER_CHUNK,
+    chunk_chars: Optional[int] = None,
+    min_chunk_chars: Optional[int] = None,
+    max_chunk_chars: Optional[int] = None,
+    first_chunk_chars: Optional[int] = None,
     sample_rate: int = DEFAULT_SAMPLE_RATE,
+    format: str = DEFAULT_OUTPUT_FORMAT,
+    compression_level: Optional[float] = None,
+    bitrate_mode: Optional[str] = None,
     mode: str = "play",
     wait_after_play: bool = True,
     stitch: bool = True,
@@ -87,17 +337,39 @@ def generate_speech(
     audio_prompt_path: Optional[str] = None,
     exaggeration: float = DEFAULT_EXAGGERATION,
     cfg_weight: float = DEFAULT_CFG_WEIGHT,
+    use_daemon: bool = True,
+    socket_path: str = DEFAULT_SOCKET_PATH,
+    cache_dir: str = DEFAULT_CACHE_DIR,
+    no_cache: bool = False,
+    cache_max_mb: int = DEFAULT_CACHE_MAX_MB,
+    pipeline: bool = True,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    workers: int = 1,
+    profile: bool = False,
+    profile_json: Optional[str] = None,
 ) -> None:
     """
     Generate speech from text using either Kokoro or Chatterbox TTS.
     """
-    # Input validation and get stdin text if any
-    stdin_text, input_file = validate_inputs(text, input_file)
+    # Time every stage when asked to, or when a profile hook is registered
+    profiler = None
+    if profile or profile_json or profile_hooks_registered():
+        profiler = Profiler(metadata=dict(
+            engine=engine, language=language, mode=mode,
+            sentences_per_chunk=sentences_per_chunk, chunk_chars=chunk_chars,
+            batch_size=batch_size, workers=workers
+        ))
+    
+    # Input validation and check for piped stdin
+    use_stdin, input_file = validate_inputs(text, input_file)
     
-    # Parse and validate modes and engine
+    # Parse and validate modes, output format and engine
     output_mode = parse_output_mode(mode)
+    encoding = AudioEncoding(format, compression_level, bitrate_mode)
     engine_type = parse_engine_type(engine)
     validate_language(engine_type, language)
+    if workers > 1 and output_mode != OutputMode.SAVE:
+        raise ValueError("Multiple workers are only supported in 'save' mode")
     
     # Prepare output directory
     output_path = None
@@ -105,64 +377,121 @@ def generate_speech(
         output_path = Path(output_dir)
         prepare_output_directory(output_path)
     
-    # Handle input sources
-    if stdin_text is not None:
-        text = stdin_text
+    # Handle input sources, streamed so synthesis starts before all input is read
+    if use_stdin:
+        blocks = iter_stdin()
     elif input_file is not None:
-        text = read_input_file(input_file)
+        blocks = iter_input_file(input_file)
         if filename == "output":
             filename = Path(input_file).stem
+    else:
+        blocks = [str(text)]
+    
+    # Split text into chunks lazily as the input arrives
+    texts = iter_text_chunks(
+        blocks, split_pattern, sentences_per_chunk,
+        chunk_chars, min_chunk_chars, max_chunk_chars, first_chunk_chars,
+        language=language
+    )
+    if profiler is not None:
+        texts = profiler.iter_stage("text", texts)
+    first_chunk = next(texts, None)
     
     # Early exit if no text
-    if not text:
+    if first_chunk is None:
         print("ERROR: No text to process")
         return
+    texts = chain([first_chunk], texts)
+    
+    with profile_stage(profiler, "engine_load"):
+        tts_engine, cache = open_engine(
+            engine_type, language, device, workers=workers,
+            use_daemon=use_daemon, socket_path=socket_path,
+            cache_dir=None if no_cache else cache_dir, cache_max_mb=cache_max_mb
+        )
     
-    # Process text into chunks
-    texts = process_text_chunks(text, split_pattern, sentences_per_chunk)
+    # Overlap synthesis of the next chunk with playback of the current one
+    player = None
+    if pipeline and output_mode in (OutputMode.PLAY, OutputMode.BOTH):
+        player = StreamingPlayer(tts_engine.sample_rate).start()
     
-    # Create TTS engine
-    tts_engine = create_tts_engine(engine_type, language, device)
+    # Stitch by appending each chunk to a single output file as it is produced
+    writer = None
+    manifest = None
+    previous = None
+    if output_path:
+        params_hash = job_params_hash(
+            engine_type, language, voice, speed, audio_prompt_path,
+            exaggeration, cfg_weight, tts_engine.sample_rate, stitch, encoding
+        )
+        # Resume an interrupted save-only job with the same parameters
+        manifest, previous, writer = open_save_job(
+            output_path, filename, tts_engine.sample_rate, params_hash,
+            stitch=stitch, resume=output_mode == OutputMode.SAVE, encoding=encoding
+        )
     
-    # Process all chunks
-    for i, chunk_text in enumerate(texts):
-        # Generate audio using the selected engine
-        graphemes, phonemes, audio = tts_engine.generate(
-            chunk_text,
+    try:
+        synthesize_chunks(
+            tts_engine, texts, output_mode, output_path, filename,
             voice=voice,
             speed=speed,
             audio_prompt_path=audio_prompt_path,
             exaggeration=exaggeration,
-            cfg_weight=cfg_weight
+            cfg_weight=cfg_weight,
+            wait_after_play=wait_after_play,
+            player=player,
+            writer=writer,
+            manifest=manifest,
+            previous=previous,
+            # Batching delays the first audio, so only use it when nothing is played live;
+            # with workers, each batch is sharded so every worker gets batch_size chunks
+            batch_size=batch_size * workers if output_mode == OutputMode.SAVE else 1,
+            profiler=profiler,
+            encoding=encoding
         )
+    except BaseException:
+        if player is not None:
+            player.close(drain=False)
+        raise
+    finally:
+        with profile_stage(profiler, "finalize"):
+            if writer is not None:
+                writer.close()
+            tts_engine.close()
+    with profile_stage(profiler, "finalize"):
+        if player is not None:
+            player.close()
         
-        chunk = AudioChunk(
-            text=graphemes,
-            phonemes=phonemes,
-            audio=audio,
-            index=i
-        )
-        
-        process_audio_chunk(
-            chunk=chunk,
-            output_mode=output_mode,
-            output_path=output_path,
-            filename=filename,
-            sample_rate=tts_engine.sample_rate,
-            wait_after_play=wait_after_play
-        )
+        if manifest is not None:
+            manifest.status = JOB_COMPLETE
+            manifest.save(ChunkManifest.path_for(output_path, filename, encoding.suffix))
+    
+    if writer is not None:
+        print(f"\nSuccessfully combined audio chunks into: {writer.output_file}")
+    
+    if cache is not None:
+        cache.print_stats()
     
-    # Stitch audio files if requested and in a save mode
-    if stitch and output_path and output_mode in (OutputMode.SAVE, OutputMode.BOTH):
-        stitch_audio_files(output_path, filename)
+    if profiler is not None:
+        profiler.finish()
+        if profile:
+            profiler.print_summary()
+        if profile_json:
+            profiler.save_json(Path(profile_json))
+            print(f"Profile report written to {profile_json}")
 
 def main():
     """
     Main entry point for the TTS command line tool.
     """
     try:
+        # Dispatch subcommands such as `tts serve`
+        if len(sys.argv) > 1 and sys.argv[1] in SUBCOMMANDS:
+            module_name, function_name = SUBCOMMANDS[sys.argv[1]]
+            command = getattr(import_module(module_name, __package__), function_name)
+            fire.Fire(command, command=sys.argv[2:], name=f"tts {sys.argv[1]}")
         # Check if stdin has data and no arguments provided
-        if len(sys.argv) == 1 and not sys.stdin.isatty():
+        elif len(sys.argv) == 1 and not sys.stdin.isatty():
             # Call generate_speech with default arguments
             generate_speech()
         else:
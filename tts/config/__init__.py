@@ -3,13 +3,17 @@
 from .settings import (
     OutputMode, DEFAULT_SAMPLE_RATE, DEFAULT_VOICE,
     DEFAULT_SPEED, DEFAULT_SENTENCES_PER_CHUNK,
-    DEFAULT_EXAGGERATION, DEFAULT_CFG_WEIGHT,
-    LANGUAGE_CODES
+    DEFAULT_EXAGGERATION, DEFAULT_CFG_WEIGHT, DEFAULT_BATCH_SIZE,
+    DEFAULT_OUTPUT_FORMAT, DEFAULT_SOCKET_PATH, DEFAULT_CACHE_DIR, DEFAULT_CACHE_MAX_MB,
+    DEFAULT_PLAYBACK_QUEUE_SIZE, DEFAULT_HTTP_HOST, DEFAULT_HTTP_PORT,
+    DEFAULT_HTTP_MAX_QUEUE, LANGUAGE_CODES
 )
 
 __all__ = [
     "OutputMode", "DEFAULT_SAMPLE_RATE", "DEFAULT_VOICE",
     "DEFAULT_SPEED", "DEFAULT_SENTENCES_PER_CHUNK",
-    "DEFAULT_EXAGGERATION", "DEFAULT_CFG_WEIGHT",
-    "LANGUAGE_CODES"
+    "DEFAULT_EXAGGERATION", "DEFAULT_CFG_WEIGHT", "DEFAULT_BATCH_SIZE",
+    "DEFAULT_OUTPUT_FORMAT", "DEFAULT_SOCKET_PATH", "DEFAULT_CACHE_DIR", "DEFAULT_CACHE_MAX_MB",
+    "DEFAULT_PLAYBACK_QUEUE_SIZE", "DEFAULT_HTTP_HOST", "DEFAULT_HTTP_PORT",
+    "DEFAULT_HTTP_MAX_QUEUE", "LANGUAGE_CODES"
 ] 
\ No newline at end of file
@@ -1,3 +1,6 @@
+import getpass
+import os
+import tempfile
 from enum import Enum, auto
 
 class OutputMode(Enum):
@@ -12,6 +15,30 @@ DEFAULT_SPEED = 1.0
 DEFAULT_SENTENCES_PER_CHUNK = 3
 DEFAULT_EXAGGERATION = 0.5
 DEFAULT_CFG_WEIGHT = 0.5
+DEFAULT_BATCH_SIZE = 1  # Chunks per engine call in save mode (no engine batches the model yet)
+DEFAULT_OUTPUT_FORMAT = "wav"  # Format of saved audio: wav, flac, ogg, opus or mp3
+
+# Unix domain socket used by the synthesis daemon (`tts serve`), named by
+# user ID, which unlike the user name exists even without a passwd entry
+DEFAULT_SOCKET_PATH = os.path.join(
+    os.environ.get("XDG_RUNTIME_DIR", tempfile.gettempdir()),
+    f"tts-{os.getuid() if hasattr(os, 'getuid') else getpass.getuser()}.sock"
+)
+
+# On-disk audio cache
+DEFAULT_CACHE_DIR = os.path.join(
+    os.environ.get("XDG_CACHE_HOME", os.path.join(os.path.expanduser("~"), ".cache")),
+    "tts", "audio"
+)
+DEFAULT_CACHE_MAX_MB = 1024
+
+# Number of synthesized chunks that may wait for playback in pipelined mode
+DEFAULT_PLAYBACK_QUEUE_SIZE = 4
+
+# HTTP synthesis server (`tts http`)
+DEFAULT_HTTP_HOST = "127.0.0.1"
+DEFAULT_HTTP_PORT = 8080
+DEFAULT_HTTP_MAX_QUEUE = 16
 
 # Language codes for Kokoro engine
 LANGUAGE_CODES = {
@@ -1,7 +1,32 @@
-"""Core TTS engine implementations."""
+"""Core TTS engine implementations.
 
-from .engine import TTSEngine, TTSEngineType
-from .kokoro import KokoroEngine
-from .chatterbox import ChatterboxEngine
+Engine backends are imported lazily so that only the selected backend (and
+its heavy dependencies such as ``torch`` or ``chatterbox``) is ever loaded.
+"""
 
-__all__ = ["TTSEngine", "TTSEngineType", "KokoroEngine", "ChatterboxEngine"] 
\ No newline at end of file
+from importlib import import_module
+from typing import Dict, Tuple, Type
+
+from .engine import TTSEngine, TTSEngineType, join_segments, to_audio_array
+
+# Engine type -> (module, class name), resolved on first use
+ENGINE_REGISTRY: Dict[TTSEngineType, Tuple[str, str]] = {
+    TTSEngineType.KOKORO: (".kokoro", "KokoroEngine"),
+    TTSEngineType.CHATTERBOX: (".chatterbox", "ChatterboxEngine"),
+}
+
+def get_engine_class(engine_type: TTSEngineType) -> Type[TTSEngine]:
+    """Import and return the engine class for the given engine type."""
+    module_name, class_name = ENGINE_REGISTRY[engine_type]
+    return getattr(import_module(module_name, __name__), class_name)
+
+def __getattr__(name: str):
+    for engine_type, (_, class_name) in ENGINE_REGISTRY.items():
+        if name == class_name:
+            return get_engine_class(engine_type)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+__all__ = [
+    "TTSEngine", "TTSEngineType", "KokoroEngine", "ChatterboxEngine",
+    "ENGINE_REGISTRY", "get_engine_class", "join_segments", "to_audio_array"
+]
@@ -0,0 +1,136 @@
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+import numpy as np
+from .engine import TTSEngine, join_segments
+from ..utils.cache import AudioCache, file_digest
+
+class CachedEngine(TTSEngine):
+    """Wraps an engine and serves repeated chunks from an AudioCache."""
+
+    def __init__(self, engine: TTSEngine, cache: AudioCache, **namespace: Any):
+        """
+        Args:
+            engine: Engine used on cache misses
+            cache: Audio cache to consult
+            namespace: Parameters that identify the engine configuration
+                (e.g. engine type and language) and are part of every key
+        """
+        self.engine = engine
+        self.cache = cache
+        self.namespace = namespace
+        self._prompt_digests: Dict[str, Optional[str]] = {}
+
+    def _prompt_digest(self, audio_prompt_path: Optional[str]) -> Optional[str]:
+        if audio_prompt_path not in self._prompt_digests:
+            self._prompt_digests[audio_prompt_path] = file_digest(audio_prompt_path)
+        return self._prompt_digests[audio_prompt_path]
+
+    def _key(
+        self,
+        text: str,
+        voice: Optional[str],
+        speed: float,
+        audio_prompt_path: Optional[str],
+        exaggeration: float,
+        cfg_weight: float
+    ) -> str:
+        return self.cache.make_key(
+            **self.namespace,
+            text=text,
+            voice=voice,
+            speed=speed,
+            audio_prompt=self._prompt_digest(audio_prompt_path),
+            exaggeration=exaggeration,
+            cfg_weight=cfg_weight
+        )
+
+    def generate(
+        self,
+        text: str,
+        voice: str = None,
+        speed: float = 1.0,
+        audio_prompt_path: Optional[str] = None,
+        exaggeration: float = 0.5,
+        cfg_weight: float = 0.5,
+        **kwargs
+    ) -> Tuple[str, str, np.ndarray]:
+        """Return cached audio for this chunk, synthesizing it on a miss."""
+        return self.generate_batch(
+            [text],
+            voice=voice,
+            speed=speed,
+            audio_prompt_path=audio_prompt_path,
+            exaggeration=exaggeration,
+            cfg_weight=cfg_weight,
+            **kwargs
+        )[0]
+
+    def generate_stream(
+        self,
+        text: str,
+        voice: str = None,
+        speed: float = 1.0,
+        audio_prompt_path: Optional[str] = None,
+        exaggeration: float = 0.5,
+        cfg_weight: float = 0.5,
+        **kwargs
+    ) -> Iterator[Tuple[str, str, np.ndarray]]:
+        """Yield a cached chunk whole, or stream a miss and cache it once complete."""
+        key = self._key(text, voice, speed, audio_prompt_path, exaggeration, cfg_weight)
+        entry = self.cache.get(key)
+        if entry is not None:
+            yield entry
+            return
+
+        segments = []
+        for segment in self.engine.generate_stream(
+            text,
+            voice=voice,
+            speed=speed,
+            audio_prompt_path=audio_prompt_path,
+            exaggeration=exaggeration,
+            cfg_weight=cfg_weight,
+            **kwargs
+        ):
+            segments.append(segment)
+            yield segment
+        self.cache.put(key, *join_segments(segments))
+
+    def generate_batch(
+        self,
+        texts: Sequence[str],
+        voice: str = None,
+        speed: float = 1.0,
+        audio_prompt_path: Optional[str] = None,
+        exaggeration: float = 0.5,
+        cfg_weight: float = 0.5,
+        **kwargs
+    ) -> List[Tuple[str, str, np.ndarray]]:
+        """Serve cached chunks and synthesize only the misses, as one batch."""
+        keys = [
+            self._key(text, voice, speed, audio_prompt_path, exaggeration, cfg_weight)
+            for text in texts
+        ]
+        outputs = [self.cache.get(key) for key in keys]
+
+        misses = [i for i, output in enumerate(outputs) if output is None]
+        if misses:
+            generated = self.engine.generate_batch(
+                [texts[i] for i in misses],
+                voice=voice,
+                speed=speed,
+                audio_prompt_path=audio_prompt_path,
+                exaggeration=exaggeration,
+                cfg_weight=cfg_weight,
+                **kwargs
+            )
+            for i, output in zip(misses, generated):
+                self.cache.put(keys[i], *output)
+                outputs[i] = output
+        return outputs
+
+    def close(self) -> None:
+        self.engine.close()
+
+    @property
+    def sample_rate(self) -> int:
+        return self.engine.sample_rate
@@ -1,8 +1,11 @@
+import hashlib
+from collections import OrderedDict
+from pathlib import Path
 from typing import Optional, Tuple
 import numpy as np
 import torch
-from chatterbox.tts import ChatterboxTTS
-from .engine import TTSEngine
+from chatterbox.tts import ChatterboxTTS, Conditionals
+from .engine import TTSEngine, to_audio_array
 
 def get_available_device() -> str:
     """Get the best available device for model inference."""
@@ -15,12 +18,85 @@ def get_available_device() -> str:
 class ChatterboxEngine(TTSEngine):
     """Chatterbox TTS engine implementation."""
     
-    def __init__(self, device: Optional[str] = None):
+    # Number of audio prompt conditionings kept in memory
+    MAX_CACHED_CONDITIONALS = 16
+    # Number of conditionings persisted in conditioning_cache_dir
+    MAX_STORED_CONDITIONALS = 64
+    
+    def __init__(self, device: Optional[str] = None, conditioning_cache_dir: Optional[str] = None):
+        """
+        Args:
+            device: Device for inference; the best available one if None
+            conditioning_cache_dir: Optional directory in which speaker
+                conditionings derived from audio prompts are persisted
+        """
         if device is None:
             device = get_available_device()
         self.model = ChatterboxTTS.from_pretrained(device=device)
         self._sample_rate = self.model.sr
         self.device = device
+        self._default_conds = self.model.conds
+        self._conditionals: "OrderedDict[Tuple[str, int, float], Conditionals]" = OrderedDict()
+        self.conditioning_cache_dir = Path(conditioning_cache_dir) if conditioning_cache_dir else None
+        if self.conditioning_cache_dir:
+            self.conditioning_cache_dir.mkdir(parents=True, exist_ok=True)
+    
+    def _get_conditionals(self, audio_prompt_path: str, exaggeration: float) -> Conditionals:
+        """Return the conditioning for an audio prompt, encoding the clip only once.
+        
+        Keyed on (path, modification time, exaggeration) so an edited clip is
+        re-encoded. Looked up in memory first, then in the on-disk cache,
+        which drops the entries of a clip's earlier versions and keeps at
+        most MAX_STORED_CONDITIONALS entries, evicting the least recently used.
+        """
+        path = Path(audio_prompt_path).resolve()
+        key = (str(path), path.stat().st_mtime_ns, float(exaggeration))
+        if key in self._conditionals:
+            self._conditionals.move_to_end(key)
+            return self._conditionals[key]
+        
+        cache_file = None
+        if self.conditioning_cache_dir:
+            # <path digest>-<mtime>-<exaggeration>.pt, so a clip's stale versions can be found
+            path_digest = hashlib.sha256(str(path).encode('utf-8')).hexdigest()[:32]
+            cache_file = self.conditioning_cache_dir / f"{path_digest}-{key[1]}-{key[2]!r}.pt"
+        
+        if cache_file is not None and cache_file.exists():
+            conds = Conditionals.load(cache_file, map_location=self.device).to(self.device)
+            # Refresh the modification time so eviction is least-recently-used
+            cache_file.touch()
+        else:
+            with torch.inference_mode():
+                self.model.prepare_conditionals(str(path), exaggeration=exaggeration)
+            conds = self.model.conds
+            if cache_file is not None:
+                self._evict_stored_conditionals(path_digest, key[1])
+                conds.save(cache_file)
+        
+        self._conditionals[key] = conds
+        if len(self._conditionals) > self.MAX_CACHED_CONDITIONALS:
+            self._conditionals.popitem(last=False)
+        return conds
+    
+    def _evict_stored_conditionals(self, path_digest: str, mtime_ns: int) -> None:
+        """Make room for a new on-disk conditioning of the clip with the given path digest.
+
+        Entries for earlier versions of the clip are removed, then the least
+        recently used entries until fewer than MAX_STORED_CONDITIONALS remain.
+        """
+        current = f"{path_digest}-{mtime_ns}-"
+        entries = []
+        for cache_file in self.conditioning_cache_dir.glob("*.pt"):
+            try:
+                if cache_file.name.startswith(f"{path_digest}-") and not cache_file.name.startswith(current):
+                    cache_file.unlink()
+                else:
+                    entries.append((cache_file.stat().st_mtime, cache_file))
+            except FileNotFoundError:
+                continue
+        entries.sort()
+        for _, cache_file in entries[:max(0, len(entries) - self.MAX_STORED_CONDITIONALS + 1)]:
+            cache_file.unlink(missing_ok=True)
     
     def generate(
         self,
@@ -33,17 +109,22 @@ class ChatterboxEngine(TTSEngine):
         **kwargs
     ) -> Tuple[str, str, np.ndarray]:
         """Generate speech using Chatterbox TTS."""
-        wav = self.model.generate(
-            text,
-            audio_prompt_path=audio_prompt_path,
-            exaggeration=exaggeration,
-            cfg_weight=cfg_weight
-        )
-        # Convert torch tensor to numpy array
-        audio = wav.squeeze().detach().numpy()
+        # Use the cached conditioning instead of re-encoding the prompt per chunk
+        if audio_prompt_path is not None:
+            self.model.conds = self._get_conditionals(audio_prompt_path, exaggeration)
+        else:
+            self.model.conds = self._default_conds
+        with torch.inference_mode():
+            wav = self.model.generate(
+                text,
+                exaggeration=exaggeration,
+                cfg_weight=cfg_weight
+            )
+        # Single conversion to CPU float32 (also valid for CUDA/MPS tensors)
+        audio = to_audio_array(wav)
         # Return empty strings for graphemes/phonemes as Chatterbox doesn't provide these
         return text, "", audio
     
     @property
     def sample_rate(self) -> int:
-        return self._sample_rate 
\ No newline at end of file
+        return self._sample_rate
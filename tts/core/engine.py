@@ -1,12 +1,32 @@
 from abc import ABC, abstractmethod
 from enum import Enum
-from typing import Optional, Tuple
+from typing import Iterator, List, Optional, Sequence, Tuple
 import numpy as np
 
 class TTSEngineType(Enum):
     KOKORO = "kokoro"
     CHATTERBOX = "chatterbox"
 
+def to_audio_array(audio) -> np.ndarray:
+    """Convert engine output to the audio contract shared by all engines.
+    
+    Audio is a 1-D, C-contiguous float32 numpy array in CPU memory. Torch
+    tensors are moved to the CPU if needed and their memory is shared rather
+    than copied whenever they already are contiguous float32 on the CPU.
+    """
+    if hasattr(audio, "detach"):  # torch.Tensor, without importing torch
+        audio = audio.detach().float().cpu().numpy()
+    return np.ascontiguousarray(np.asarray(audio, dtype=np.float32).reshape(-1))
+
+def join_segments(segments: Sequence[Tuple[str, str, np.ndarray]]) -> Tuple[str, str, np.ndarray]:
+    """Join streamed (graphemes, phonemes, audio) segments into one result."""
+    graphemes = " ".join(segment[0] for segment in segments)
+    phonemes = " ".join(segment[1] for segment in segments)
+    audio = [to_audio_array(segment[2]) for segment in segments]
+    if len(audio) == 1:
+        return graphemes, phonemes, audio[0]
+    return graphemes, phonemes, np.concatenate(audio) if audio else np.zeros(0, dtype=np.float32)
+
 class TTSEngine(ABC):
     """Base class for TTS engines."""
     
@@ -32,10 +52,74 @@ class TTSEngine(ABC):
             cfg_weight: Classifier-free guidance weight
             
         Returns:
-            Tuple of (graphemes, phonemes, audio_data)
+            Tuple of (graphemes, phonemes, audio_data), where audio_data
+            follows the contract of to_audio_array()
         """
         pass
     
+    def generate_batch(
+        self,
+        texts: Sequence[str],
+        voice: str,
+        speed: float = 1.0,
+        audio_prompt_path: Optional[str] = None,
+        exaggeration: float = 0.5,
+        cfg_weight: float = 0.5,
+        **kwargs
+    ) -> List[Tuple[str, str, np.ndarray]]:
+        """Generate speech for several texts.
+        
+        Engines that can process several texts more efficiently together
+        override this; the default generates them one at a time.
+        
+        Returns:
+            List of (graphemes, phonemes, audio_data), in the order of texts
+        """
+        return [
+            self.generate(
+                text,
+                voice=voice,
+                speed=speed,
+                audio_prompt_path=audio_prompt_path,
+                exaggeration=exaggeration,
+                cfg_weight=cfg_weight,
+                **kwargs
+            )
+            for text in texts
+        ]
+    
+    def generate_stream(
+        self,
+        text: str,
+        voice: str,
+        speed: float = 1.0,
+        audio_prompt_path: Optional[str] = None,
+        exaggeration: float = 0.5,
+        cfg_weight: float = 0.5,
+        **kwargs
+    ) -> Iterator[Tuple[str, str, np.ndarray]]:
+        """Generate speech for one text, yielding audio segments as they are produced.
+        
+        Engines whose models produce audio incrementally override this; the
+        default yields the whole text as a single segment.
+        
+        Yields:
+            Tuples of (graphemes, phonemes, audio_data) for each segment
+        """
+        yield self.generate(
+            text,
+            voice=voice,
+            speed=speed,
+            audio_prompt_path=audio_prompt_path,
+            exaggeration=exaggeration,
+            cfg_weight=cfg_weight,
+            **kwargs
+        )
+    
+    def close(self) -> None:
+        """Release resources held by the engine (connections, worker processes)."""
+        pass
+    
     @property
     @abstractmethod
     def sample_rate(self) -> int:
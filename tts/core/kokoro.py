@@ -1,7 +1,51 @@
-from typing import Optional, Tuple, Dict
+from collections import OrderedDict
+from typing import Optional, Tuple, Dict, Iterable, Iterator, List, Sequence
 import numpy as np
+import torch
 from kokoro import KPipeline
-from .engine import TTSEngine
+from .engine import TTSEngine, join_segments, to_audio_array
+from ..config.settings import LANGUAGE_CODES
+from ..utils.text import iter_sentences
+
+class VoiceCache:
+    """Memory-bounded LRU cache of loaded Kokoro voice tensors.
+
+    KPipeline keeps every voice it ever loads; this cache takes ownership of
+    them instead so a long-running process holds at most max_bytes of voices.
+    """
+
+    def __init__(self, pipeline: KPipeline, max_bytes: int):
+        self.pipeline = pipeline
+        self.max_bytes = max_bytes
+        self._voices: "OrderedDict[str, object]" = OrderedDict()
+        self._size = 0
+
+    @staticmethod
+    def _nbytes(pack) -> int:
+        return pack.element_size() * pack.nelement()
+
+    def get(self, voice: str):
+        """Return the voice tensor, loading it on first use."""
+        if voice in self._voices:
+            self._voices.move_to_end(voice)
+            return self._voices[voice]
+
+        pack = self.pipeline.load_voice(voice)
+        # Drop the pipeline's own reference so eviction actually frees memory
+        self.pipeline.voices.pop(voice, None)
+        self._voices[voice] = pack
+        self._size += self._nbytes(pack)
+        # Evict least recently used voices, always keeping the one just loaded
+        while self._size > self.max_bytes and len(self._voices) > 1:
+            _, evicted = self._voices.popitem(last=False)
+            self._size -= self._nbytes(evicted)
+        return pack
+
+    def __contains__(self, voice: str) -> bool:
+        return voice in self._voices
+
+    def __len__(self) -> int:
+        return len(self._voices)
 
 class KokoroEngine(TTSEngine):
     """Kokoro TTS engine implementation.
@@ -9,6 +53,7 @@ class KokoroEngine(TTSEngine):
     
     DEFAULT_SAMPLE_RATE = 24000
     DEFAULT_VOICE = "bm_george"  # Male British English voice
+    DEFAULT_VOICE_CACHE_MB = 64  # Each voice pack is about 0.5 MB
     
     # Available voices by language
     VOICES: Dict[str, Dict[str, str]] = {
@@ -85,9 +130,37 @@ class KokoroEngine(TTSEngine):
         "pm_santa": {"gender": "male", "language": "Brazilian Portuguese"},
     }
     
-    def __init__(self, language_code: str):
+    def __init__(
+        self,
+        language_code: str,
+        preload_voices: Optional[Iterable[str]] = None,
+        voice_cache_mb: int = DEFAULT_VOICE_CACHE_MB
+    ):
+        """
+        Args:
+            language_code: Kokoro pipeline language code
+            preload_voices: Voices to load up front
+            voice_cache_mb: Memory bound of the voice tensor cache
+        """
         self.pipeline = KPipeline(lang_code=language_code)
+        # Language name, for the abbreviations used when splitting sentences
+        self.language = next((name for name, code in LANGUAGE_CODES.items() if code == language_code), None)
         self._sample_rate = self.DEFAULT_SAMPLE_RATE
+        self.voices = VoiceCache(self.pipeline, voice_cache_mb * 1024 * 1024)
+        if preload_voices:
+            self.preload_voices(preload_voices)
+    
+    def preload_voices(self, voices: Optional[Iterable[str]] = None) -> None:
+        """Load voice tensors ahead of use; all known voices if none are given."""
+        for voice in voices if voices is not None else self.VOICES:
+            self._check_voice(voice)
+            self.voices.get(voice)
+    
+    def _check_voice(self, voice: str) -> None:
+        if voice not in self.VOICES:
+            raise ValueError(
+                f"Voice '{voice}' not found. Available voices: {', '.join(sorted(self.VOICES.keys()))}"
+            )
     
     def generate(
         self,
@@ -100,20 +173,71 @@ class KokoroEngine(TTSEngine):
         **kwargs
     ) -> Tuple[str, str, np.ndarray]:
         """Generate speech using Kokoro TTS."""
-        if voice not in self.VOICES:
-            raise ValueError(
-                f"Voice '{voice}' not found. Available voices: {', '.join(sorted(self.VOICES.keys()))}"
-            )
-            
-        # Call the pipeline directly with a list of texts
+        return self.generate_batch([text], voice=voice, speed=speed)[0]
+    
+    def generate_stream(
+        self,
+        text: str,
+        voice: str = DEFAULT_VOICE,
+        speed: float = 1.0,
+        audio_prompt_path: Optional[str] = None,
+        exaggeration: float = 0.5,
+        cfg_weight: float = 0.5,
+        **kwargs
+    ) -> Iterator[Tuple[str, str, np.ndarray]]:
+        """Yield audio sentence by sentence as the Kokoro pipeline produces it."""
+        self._check_voice(voice)
+        pack = self.voices.get(voice)
+        sentences = list(iter_sentences([text], language=self.language))
+        results = iter(self.pipeline(sentences, voice=pack, speed=speed))
+        while True:
+            # Run each pipeline step in inference mode but yield outside it, so
+            # the mode does not stay on in the consumer's thread between steps
+            with torch.inference_mode():
+                result = next(results, None)
+                if result is None:
+                    return
+                audio = None if result.audio is None else to_audio_array(result.audio)
+            if audio is not None:
+                yield result.graphemes, result.phonemes, audio
+    
+    def generate_batch(
+        self,
+        texts: Sequence[str],
+        voice: str = DEFAULT_VOICE,
+        speed: float = 1.0,
+        audio_prompt_path: Optional[str] = None,
+        exaggeration: float = 0.5,
+        cfg_weight: float = 0.5,
+        **kwargs
+    ) -> List[Tuple[str, str, np.ndarray]]:
+        """Generate speech for several texts in one pipeline pass.
+        
+        The pipeline still runs the model once per text; a batch saves only
+        the per-call overhead, and the cached voice tensor is used for the
+        whole batch. Every segment the pipeline produces for a text is kept.
+        """
+        self._check_voice(voice)
+        
+        segments: List[List] = [[] for _ in texts]
         generator = self.pipeline(
-            [text],
-            voice=voice,
+            list(texts),
+            voice=self.voices.get(voice),
             speed=speed,
             split_pattern=None
         )
-        graphemes, phonemes, audio = next(generator)
-        return graphemes, phonemes, audio
+        with torch.inference_mode():
+            for result in generator:
+                segments[result.text_index].append(result)
+        
+        outputs = [
+            join_segments([
+                (result.graphemes, result.phonemes, result.audio)
+                for result in results if result.audio is not None
+            ])
+            for results in segments
+        ]
+        return outputs
     
     @property
     def sample_rate(self) -> int:
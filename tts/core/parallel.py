@@ -0,0 +1,110 @@
+import math
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, List, Optional, Sequence, Tuple
+import numpy as np
+from .engine import TTSEngine, TTSEngineType, to_audio_array
+
+# Engine owned by the current worker process
+_worker_engine: Optional[TTSEngine] = None
+
+def _init_worker(engine_type: str, language: str, device: Optional[str], torch_threads: int) -> None:
+    """Limit intra-op threads, then load this worker's own engine."""
+    global _worker_engine
+    # Must happen before torch is first imported by the engine backend
+    for var in ("OMP_NUM_THREADS", "MKL_NUM_THREADS", "OPENBLAS_NUM_THREADS"):
+        os.environ[var] = str(torch_threads)
+    import torch
+    torch.set_num_threads(torch_threads)
+
+    from ..api import create_tts_engine
+    _worker_engine = create_tts_engine(TTSEngineType(engine_type), language, device)
+
+def _worker_sample_rate() -> int:
+    return _worker_engine.sample_rate
+
+def _worker_generate_batch(texts: Sequence[str], params: dict) -> List[Tuple[str, str, np.ndarray]]:
+    results = _worker_engine.generate_batch(texts, **params)
+    # Ship plain float32 arrays back to the parent process
+    return [(graphemes, phonemes, to_audio_array(audio)) for graphemes, phonemes, audio in results]
+
+class ProcessPoolEngine(TTSEngine):
+    """Shards synthesis across worker processes, each holding its own engine.
+
+    Every worker limits torch to ``cpu_count // workers`` threads so the pool
+    does not oversubscribe the CPU. Results are returned in input order.
+    """
+
+    def __init__(
+        self,
+        engine_type: TTSEngineType,
+        language: str,
+        device: Optional[str] = None,
+        workers: int = 2,
+        torch_threads: Optional[int] = None
+    ):
+        self.workers = workers
+        if torch_threads is None:
+            torch_threads = max(1, (os.cpu_count() or 1) // workers)
+        # Spawn rather than fork: forking a process that may hold torch threads is unsafe
+        self._executor = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(engine_type.value, language, device, torch_threads)
+        )
+        self._sample_rate = self._executor.submit(_worker_sample_rate).result()
+
+    def generate(
+        self,
+        text: str,
+        voice: str = None,
+        speed: float = 1.0,
+        audio_prompt_path: Optional[str] = None,
+        exaggeration: float = 0.5,
+        cfg_weight: float = 0.5,
+        **kwargs
+    ) -> Tuple[str, str, np.ndarray]:
+        """Generate speech for one text in a worker process."""
+        return self.generate_batch(
+            [text],
+            voice=voice,
+            speed=speed,
+            audio_prompt_path=audio_prompt_path,
+            exaggeration=exaggeration,
+            cfg_weight=cfg_weight,
+            **kwargs
+        )[0]
+
+    def generate_batch(
+        self,
+        texts: Sequence[str],
+        voice: str = None,
+        speed: float = 1.0,
+        audio_prompt_path: Optional[str] = None,
+        exaggeration: float = 0.5,
+        cfg_weight: float = 0.5,
+        **kwargs: Any
+    ) -> List[Tuple[str, str, np.ndarray]]:
+        """Split texts into one contiguous shard per worker and reassemble in order."""
+        params = dict(
+            kwargs,
+            voice=voice,
+            speed=speed,
+            audio_prompt_path=audio_prompt_path,
+            exaggeration=exaggeration,
+            cfg_weight=cfg_weight
+        )
+        shard_size = max(1, math.ceil(len(texts) / self.workers))
+        shards = [texts[i:i + shard_size] for i in range(0, len(texts), shard_size)]
+        futures = [self._executor.submit(_worker_generate_batch, shard, params) for shard in shards]
+        return [result for future in futures for result in future.result()]
+
+    def close(self) -> None:
+        """Shut down the worker processes."""
+        self._executor.shutdown(cancel_futures=True)
+
+    @property
+    def sample_rate(self) -> int:
+        return self._sample_rate
@@ -0,0 +1,48 @@
+import threading
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, Optional, Tuple
+from .engine import TTSEngine, TTSEngineType
+
+EngineKey = Tuple[TTSEngineType, str, Optional[str]]
+
+class EnginePool:
+    """Keeps loaded TTS engines warm, keyed by (engine type, language, device).
+
+    Each engine admits at most ``concurrency`` callers at a time (by default
+    one), so concurrent callers share a loaded model without overloading it.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[TTSEngineType, str, Optional[str]], TTSEngine],
+        concurrency: int = 1
+    ):
+        self._factory = factory
+        self.concurrency = concurrency
+        self._engines: Dict[EngineKey, TTSEngine] = {}
+        self._locks: Dict[EngineKey, threading.Lock] = {}
+        self._slots: Dict[EngineKey, threading.BoundedSemaphore] = {}
+        self._pool_lock = threading.Lock()
+
+    def get(self, engine_type: TTSEngineType, language: str, device: Optional[str] = None) -> TTSEngine:
+        """Return the engine for the given key, loading it on first use."""
+        key = (engine_type, language, device)
+        with self._pool_lock:
+            lock = self._locks.setdefault(key, threading.Lock())
+            self._slots.setdefault(key, threading.BoundedSemaphore(self.concurrency))
+        # Load outside the pool lock so other engines stay usable while a model loads
+        with lock:
+            if key not in self._engines:
+                print(f"Loading {engine_type.value} engine (language={language}, device={device})")
+                self._engines[key] = self._factory(engine_type, language, device)
+            return self._engines[key]
+
+    @contextmanager
+    def acquire(self, engine_type: TTSEngineType, language: str, device: Optional[str] = None) -> Iterator[TTSEngine]:
+        """Context manager giving use of a pooled engine, waiting for a free slot."""
+        engine = self.get(engine_type, language, device)
+        with self._slots[(engine_type, language, device)]:
+            yield engine
+
+    def __len__(self) -> int:
+        return len(self._engines)
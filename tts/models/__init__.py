@@ -1,5 +1,7 @@
 """Data models for the TTS package."""
 
 from .audio_chunk import AudioChunk
+from .manifest import ChunkManifest, ChunkRecord
+from .result import SynthesisResult
 
-__all__ = ["AudioChunk"] 
\ No newline at end of file
+__all__ = ["AudioChunk", "ChunkManifest", "ChunkRecord", "SynthesisResult"]
@@ -1,10 +1,23 @@
 from dataclasses import dataclass
+from typing import Optional
 import numpy as np
 
 @dataclass
 class AudioChunk:
-    """Container for generated audio chunks and their metadata."""
+    """Container for generated audio chunks and their metadata.
+
+    synthesis_seconds is the chunk's share of the engine call that produced
+    it; ready_seconds is measured from the start of the synthesis stream.
+    """
     text: str
     phonemes: str
     audio: np.ndarray
-    index: int 
\ No newline at end of file
+    index: int
+    sample_rate: Optional[int] = None
+    synthesis_seconds: float = 0.0
+    ready_seconds: float = 0.0
+
+    @property
+    def duration(self) -> float:
+        """Length of the audio in seconds, or 0.0 if the sample rate is unknown."""
+        return len(self.audio) / self.sample_rate if self.sample_rate else 0.0
@@ -0,0 +1,125 @@
+import json
+import os
+import tempfile
+from dataclasses import dataclass, field, asdict
+from pathlib import Path
+from typing import List, Optional
+
+CHUNK_DONE = "done"
+JOB_RUNNING = "running"
+JOB_COMPLETE = "complete"
+
+@dataclass
+class ChunkRecord:
+    """A chunk produced in a run and where its audio lives."""
+    index: int
+    frames: int
+    offset: int
+    file: Optional[str] = None  # Separate chunk file, relative to the manifest
+    text_hash: str = ""
+    status: str = CHUNK_DONE
+
+@dataclass
+class ChunkManifest:
+    """Explicit, index-ordered record of the chunks produced for one output.
+
+    The manifest doubles as a job checkpoint. It is stored as JSON Lines: a
+    job line, one line per completed chunk and, once finished, a status
+    line. Chunks are appended (and synced) one line at a time, so
+    checkpointing costs the same for the first chunk as for the ten
+    thousandth, and a line torn by a crash is simply ignored on load.
+    """
+    filename: str
+    sample_rate: int
+    params_hash: str = ""
+    status: str = JOB_RUNNING
+    chunks: List[ChunkRecord] = field(default_factory=list)
+
+    @staticmethod
+    def path_for(output_path: Path, filename: str, suffix: str) -> Path:
+        """Location of the manifest written alongside an output.
+
+        The output's file suffix is part of the name, so outputs of the same
+        name in different formats keep separate manifests.
+        """
+        return output_path / f"{filename}{suffix}.manifest.jsonl"
+
+    @property
+    def total_frames(self) -> int:
+        return self.chunks[-1].offset + self.chunks[-1].frames if self.chunks else 0
+
+    def add(self, index: int, frames: int, file: Optional[str] = None, text_hash: str = "") -> ChunkRecord:
+        """Record a chunk placed directly after the previous one."""
+        record = ChunkRecord(
+            index=index, frames=frames, offset=self.total_frames,
+            file=file, text_hash=text_hash
+        )
+        self.chunks.append(record)
+        return record
+
+    def completed_chunk(self, index: int, text_hash: str) -> Optional[ChunkRecord]:
+        """Return the record for a chunk if it was completed with the same text."""
+        if index < len(self.chunks):
+            record = self.chunks[index]
+            if record.status == CHUNK_DONE and record.text_hash == text_hash:
+                return record
+        return None
+
+    def _job_line(self) -> str:
+        return json.dumps({
+            "type": "job",
+            "filename": self.filename,
+            "sample_rate": self.sample_rate,
+            "params_hash": self.params_hash,
+        }) + "\n"
+
+    @staticmethod
+    def _chunk_line(record: ChunkRecord) -> str:
+        return json.dumps(dict(asdict(record), type="chunk")) + "\n"
+
+    def save(self, path: Path) -> None:
+        """Rewrite the whole manifest atomically so a crash never leaves it half-written."""
+        path = Path(path)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(self._job_line())
+                f.writelines(self._chunk_line(record) for record in self.chunks)
+                if self.status != JOB_RUNNING:
+                    f.write(json.dumps({"type": "status", "status": self.status}) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_name, path)
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+
+    def append(self, record: ChunkRecord, path: Path) -> None:
+        """Durably append one completed chunk to a manifest saved at path."""
+        with open(path, 'a', encoding='utf-8') as f:
+            f.write(self._chunk_line(record))
+            f.flush()
+            os.fsync(f.fileno())
+
+    @classmethod
+    def load(cls, path: Path) -> "ChunkManifest":
+        with open(path, 'r', encoding='utf-8') as f:
+            lines = f.read().splitlines()
+        job = json.loads(lines[0])
+        manifest = cls(
+            filename=job["filename"],
+            sample_rate=job["sample_rate"],
+            params_hash=job.get("params_hash", "")
+        )
+        for line in lines[1:]:
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                # Torn final line from an interrupted append
+                break
+            entry_type = entry.pop("type")
+            if entry_type == "chunk":
+                manifest.chunks.append(ChunkRecord(**entry))
+            elif entry_type == "status":
+                manifest.status = entry["status"]
+        return manifest
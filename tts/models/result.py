@@ -0,0 +1,31 @@
+from dataclasses import dataclass, field
+from typing import List
+import numpy as np
+from .audio_chunk import AudioChunk
+
+@dataclass
+class SynthesisResult:
+    """Complete audio of a synthesized text with per-chunk timing metadata.
+
+    The audio of each chunk is a view into ``audio``, so the chunks add no
+    copy of the samples.
+    """
+    audio: np.ndarray
+    sample_rate: int
+    chunks: List[AudioChunk] = field(default_factory=list)
+    wall_seconds: float = 0.0
+
+    @property
+    def duration(self) -> float:
+        """Length of the audio in seconds."""
+        return len(self.audio) / self.sample_rate if self.sample_rate else 0.0
+
+    @property
+    def synthesis_seconds(self) -> float:
+        """Total time spent in the engine."""
+        return sum(chunk.synthesis_seconds for chunk in self.chunks)
+
+    @property
+    def rtf(self) -> float:
+        """Real-time factor: wall time per second of audio."""
+        return self.wall_seconds / self.duration if self.duration else 0.0
@@ -0,0 +1,5 @@
+"""Long-running synthesis servers that keep TTS engines loaded."""
+
+from .client import RemoteEngine, connect_daemon
+
+__all__ = ["RemoteEngine", "connect_daemon"]
@@ -0,0 +1,95 @@
+import socket
+from pathlib import Path
+from typing import Optional, Tuple
+import numpy as np
+from ..core.engine import TTSEngine, TTSEngineType
+from ..config.settings import DEFAULT_SOCKET_PATH
+from .protocol import send_message, read_message, decode_audio
+
+class RemoteEngine(TTSEngine):
+    """TTS engine that forwards synthesis requests to a running `tts serve` daemon."""
+
+    def __init__(
+        self,
+        engine_type: TTSEngineType,
+        language: str,
+        device: Optional[str] = None,
+        socket_path: str = DEFAULT_SOCKET_PATH
+    ):
+        self.engine_type = engine_type
+        self.language = language
+        self.device = device
+        self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            self._sock.connect(socket_path)
+        except OSError:
+            self._sock.close()
+            raise
+        self._rfile = self._sock.makefile("rb")
+        self._wfile = self._sock.makefile("wb")
+        header, _ = self._request({"op": "load"})
+        self._sample_rate = header["sample_rate"]
+
+    def _request(self, header: dict) -> Tuple[dict, bytes]:
+        """Send a request for this engine and return the daemon's response."""
+        send_message(self._wfile, dict(
+            header,
+            engine=self.engine_type.value,
+            language=self.language,
+            device=self.device
+        ))
+        response, payload = read_message(self._rfile)
+        if not response.get("ok"):
+            raise RuntimeError(f"TTS daemon error: {response.get('error')}")
+        return response, payload
+
+    def generate(
+        self,
+        text: str,
+        voice: str = None,
+        speed: float = 1.0,
+        audio_prompt_path: Optional[str] = None,
+        exaggeration: float = 0.5,
+        cfg_weight: float = 0.5,
+        **kwargs
+    ) -> Tuple[str, str, np.ndarray]:
+        """Generate speech on the daemon."""
+        # The daemon may run in a different working directory
+        if audio_prompt_path is not None:
+            audio_prompt_path = str(Path(audio_prompt_path).resolve())
+        response, payload = self._request({
+            "op": "generate",
+            "text": text,
+            "voice": voice,
+            "speed": speed,
+            "audio_prompt_path": audio_prompt_path,
+            "exaggeration": exaggeration,
+            "cfg_weight": cfg_weight,
+        })
+        return response["graphemes"], response["phonemes"], decode_audio(payload)
+
+    def close(self) -> None:
+        """Close the connection to the daemon."""
+        for f in (self._rfile, self._wfile, self._sock):
+            try:
+                f.close()
+            except OSError:
+                pass
+
+    @property
+    def sample_rate(self) -> int:
+        return self._sample_rate
+
+def connect_daemon(
+    engine_type: TTSEngineType,
+    language: str,
+    device: Optional[str] = None,
+    socket_path: str = DEFAULT_SOCKET_PATH
+) -> Optional[RemoteEngine]:
+    """Connect to a running synthesis daemon, or return None if none is available."""
+    if not hasattr(socket, "AF_UNIX") or not Path(socket_path).exists():
+        return None
+    try:
+        return RemoteEngine(engine_type, language, device, socket_path)
+    except (OSError, EOFError):
+        return None
@@ -0,0 +1,123 @@
+"""
+Synthesis daemon that keeps TTS engines loaded across CLI invocations.
+
+Start it with ``tts serve``; subsequent ``tts`` runs detect the socket and
+forward synthesis requests to it instead of loading a model themselves.
+"""
+
+import os
+import socket
+import socketserver
+from pathlib import Path
+from typing import Optional
+from ..api import create_tts_engine, parse_engine_type, validate_language
+from ..core.pool import EnginePool
+from ..config.settings import (
+    DEFAULT_SOCKET_PATH, DEFAULT_SPEED,
+    DEFAULT_EXAGGERATION, DEFAULT_CFG_WEIGHT
+)
+from .protocol import send_message, read_message, encode_audio
+
+class SynthesisRequestHandler(socketserver.StreamRequestHandler):
+    """Serves requests on one client connection until the client disconnects."""
+
+    def handle(self) -> None:
+        while True:
+            try:
+                request, _ = read_message(self.rfile)
+            except (EOFError, ConnectionError):
+                return
+            except ValueError as e:
+                send_message(self.wfile, {"ok": False, "error": f"Malformed request: {e}"})
+                continue
+            try:
+                header, payload = self.server.dispatch(request)
+                send_message(self.wfile, dict(header, ok=True), payload)
+            except (BrokenPipeError, ConnectionError):
+                return
+            except Exception as e:
+                send_message(self.wfile, {"ok": False, "error": str(e)})
+
+class SynthesisServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Unix socket server hosting a warm engine pool."""
+
+    daemon_threads = True
+
+    def __init__(self, socket_path: str, pool: EnginePool):
+        self.pool = pool
+        super().__init__(socket_path, SynthesisRequestHandler)
+
+    def dispatch(self, request: dict) -> tuple[dict, bytes]:
+        """Handle a single decoded request and return (header, payload)."""
+        op = request.get("op")
+        if op == "ping":
+            return {"pid": os.getpid(), "engines": len(self.pool)}, b""
+
+        engine_type = parse_engine_type(request["engine"])
+        language = request["language"]
+        validate_language(engine_type, language)
+
+        if op == "load":
+            engine = self.pool.get(engine_type, language, request.get("device"))
+            return {"sample_rate": engine.sample_rate}, b""
+        if op == "generate":
+            with self.pool.acquire(engine_type, language, request.get("device")) as engine:
+                graphemes, phonemes, audio = engine.generate(
+                    request["text"],
+                    voice=request.get("voice"),
+                    speed=request.get("speed", DEFAULT_SPEED),
+                    audio_prompt_path=request.get("audio_prompt_path"),
+                    exaggeration=request.get("exaggeration", DEFAULT_EXAGGERATION),
+                    cfg_weight=request.get("cfg_weight", DEFAULT_CFG_WEIGHT)
+                )
+            return {"graphemes": graphemes, "phonemes": phonemes}, encode_audio(audio)
+        raise ValueError(f"Unknown request: {op}")
+
+def remove_stale_socket(socket_path: str) -> None:
+    """Remove a socket file left behind by a daemon that is no longer running."""
+    if not Path(socket_path).exists():
+        return
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(socket_path)
+    except OSError:
+        os.unlink(socket_path)
+        return
+    finally:
+        probe.close()
+    raise RuntimeError(f"A TTS daemon is already running on {socket_path}")
+
+def serve(
+    engine: str = "kokoro",
+    language: str = "en-gb",
+    device: Optional[str] = None,
+    socket_path: str = DEFAULT_SOCKET_PATH,
+    preload_voices: bool = False,
+) -> None:
+    """
+    Run the synthesis daemon in the foreground.
+
+    The given engine is loaded up front; other engine/language combinations
+    requested by clients are loaded on demand and kept warm. With
+    preload_voices, all Kokoro voices are loaded into memory at startup.
+    """
+    if not hasattr(socket, "AF_UNIX"):
+        raise RuntimeError("The TTS daemon requires Unix domain socket support")
+
+    pool = EnginePool(create_tts_engine)
+    engine_type = parse_engine_type(engine)
+    validate_language(engine_type, language)
+    tts_engine = pool.get(engine_type, language, device)
+    if preload_voices and hasattr(tts_engine, "preload_voices"):
+        tts_engine.preload_voices()
+
+    remove_stale_socket(socket_path)
+    with SynthesisServer(socket_path, pool) as server:
+        os.chmod(socket_path, 0o600)
+        print(f"TTS daemon listening on {socket_path} (pid {os.getpid()})")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            print("\nShutting down TTS daemon")
+        finally:
+            os.unlink(socket_path)
@@ -0,0 +1,338 @@
+"""
+HTTP synthesis server that keeps TTS engines loaded and streams audio back.
+
+Start it with ``tts http``. Text (plain, JSON, or any input format with a
+registered reader such as Markdown or HTML) is POSTed to
+``/synthesize`` and the audio of each chunk is sent with chunked transfer
+encoding as soon as it has been synthesized, as WAV, raw PCM, or encoded
+in-process to Ogg Vorbis or Opus.
+"""
+
+import io
+import json
+import struct
+import threading
+import zipfile
+from itertools import chain
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Optional
+from urllib.parse import parse_qsl, urlsplit
+import numpy as np
+from ..api import create_tts_engine, parse_engine_type, validate_language
+from ..core.pool import EnginePool
+from ..config.settings import (
+    DEFAULT_VOICE, DEFAULT_SPEED, DEFAULT_SENTENCES_PER_CHUNK,
+    DEFAULT_EXAGGERATION, DEFAULT_CFG_WEIGHT,
+    DEFAULT_HTTP_HOST, DEFAULT_HTTP_PORT, DEFAULT_HTTP_MAX_QUEUE
+)
+from ..utils.audio import STREAMABLE_FORMATS, AudioEncoding, StreamEncoder
+from ..utils.readers import MIME_TYPES, get_reader
+from ..utils.text import iter_text_chunks
+
+# Largest accepted request body
+MAX_BODY_BYTES = 10 * 1024 * 1024
+
+# Request option -> type, accepted from the query string or a JSON body
+REQUEST_OPTIONS = {
+    "engine": str,
+    "language": str,
+    "voice": str,
+    "speed": float,
+    "sentences_per_chunk": int,
+    "chunk_chars": int,
+    "min_chunk_chars": int,
+    "max_chunk_chars": int,
+    "first_chunk_chars": int,
+    "exaggeration": float,
+    "cfg_weight": float,
+    "format": str,
+    "compression_level": float,
+}
+
+# WAV and PCM are streamed as is; the other formats are encoded by a StreamEncoder
+AUDIO_FORMATS = ("wav", "pcm") + tuple(sorted(STREAMABLE_FORMATS))
+
+def wav_stream_header(sample_rate: int) -> bytes:
+    """Return a 16-bit mono WAV header for a stream of unknown length.
+
+    The RIFF and data sizes are set to the maximum, which players treat as
+    "read until the end of the stream".
+    """
+    return (
+        b"RIFF" + struct.pack("<I", 0xFFFFFFFF) + b"WAVE"
+        + b"fmt " + struct.pack("<IHHIIHH", 16, 1, 1, sample_rate, sample_rate * 2, 2, 16)
+        + b"data" + struct.pack("<I", 0xFFFFFFFF)
+    )
+
+def encode_pcm16(audio: np.ndarray) -> bytes:
+    """Convert float audio to little-endian 16-bit PCM bytes."""
+    return (np.clip(audio, -1.0, 1.0) * 32767).astype("<i2").tobytes()
+
+class HTTPRequestError(Exception):
+    """Error reported to the client with the given HTTP status."""
+
+    def __init__(self, status: HTTPStatus, message: str):
+        super().__init__(message)
+        self.status = status
+
+class HTTPSynthesisHandler(BaseHTTPRequestHandler):
+    """Handles /health and /synthesize requests."""
+
+    protocol_version = "HTTP/1.1"
+    server_version = "tts-http"
+
+    def do_GET(self) -> None:
+        if urlsplit(self.path).path != "/health":
+            self.send_json(HTTPStatus.NOT_FOUND, {"error": "Not found"})
+            return
+        self.send_json(HTTPStatus.OK, self.server.stats())
+
+    def do_POST(self) -> None:
+        if urlsplit(self.path).path != "/synthesize":
+            # The body is left unread, so the connection cannot be reused
+            self.close_connection = True
+            self.send_json(HTTPStatus.NOT_FOUND, {"error": "Not found"})
+            return
+        # Reject rather than queue without bound when the server is saturated
+        if not self.server.admit():
+            # The body is left unread, so the connection cannot be reused
+            self.close_connection = True
+            self.send_json(HTTPStatus.SERVICE_UNAVAILABLE, {"error": "Server busy"}, {"Retry-After": "1"})
+            return
+        try:
+            text, options = self.read_request()
+            self.stream_synthesis(text, options)
+        except HTTPRequestError as e:
+            self.close_connection = True
+            self.send_json(e.status, {"error": str(e)})
+        except Exception as e:
+            self.log_error("Request failed: %s", e)
+            self.close_connection = True
+            self.send_json(HTTPStatus.INTERNAL_SERVER_ERROR, {"error": str(e)})
+        finally:
+            self.server.release()
+
+    def read_request(self) -> tuple[str, Dict[str, Any]]:
+        """Parse the request body and options into (text, options)."""
+        try:
+            length = int(self.headers["Content-Length"])
+        except (TypeError, ValueError):
+            raise HTTPRequestError(HTTPStatus.LENGTH_REQUIRED, "Content-Length required")
+        if length > MAX_BODY_BYTES:
+            raise HTTPRequestError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, "Request body too large")
+        body = self.rfile.read(length)
+
+        options: Dict[str, Any] = dict(parse_qsl(urlsplit(self.path).query))
+        content_type = self.headers.get_content_type()
+        try:
+            if content_type == "application/json":
+                try:
+                    request = json.loads(body.decode("utf-8"))
+                except ValueError as e:
+                    raise HTTPRequestError(HTTPStatus.BAD_REQUEST, f"Invalid JSON: {e}")
+                if not isinstance(request, dict) or not isinstance(request.get("text", ""), str):
+                    raise HTTPRequestError(HTTPStatus.BAD_REQUEST, 'JSON body must be an object with a "text" string')
+                text = request.pop("text", "")
+                options.update(request)
+            elif content_type in MIME_TYPES:
+                # Other supported input formats, e.g. Markdown, HTML or subtitles
+                text = "".join(get_reader(mime_type=content_type)(io.BytesIO(body)))
+            else:
+                text = body.decode("utf-8")
+        except UnicodeDecodeError:
+            raise HTTPRequestError(HTTPStatus.BAD_REQUEST, "Request body must be UTF-8")
+        except (ValueError, zipfile.BadZipFile) as e:
+            raise HTTPRequestError(HTTPStatus.BAD_REQUEST, f"Invalid {content_type} body: {e}")
+
+        unknown = set(options) - set(REQUEST_OPTIONS)
+        if unknown:
+            raise HTTPRequestError(HTTPStatus.BAD_REQUEST, f"Unknown options: {', '.join(sorted(unknown))}")
+        try:
+            options = {name: REQUEST_OPTIONS[name](value) for name, value in options.items()}
+        except (TypeError, ValueError) as e:
+            raise HTTPRequestError(HTTPStatus.BAD_REQUEST, f"Invalid option: {e}")
+        if not text.strip():
+            raise HTTPRequestError(HTTPStatus.BAD_REQUEST, "No text to synthesize")
+        if options.get("format", "wav") not in AUDIO_FORMATS:
+            raise HTTPRequestError(HTTPStatus.BAD_REQUEST, f"format must be one of: {', '.join(AUDIO_FORMATS)}")
+        return text, options
+
+    def stream_synthesis(self, text: str, options: Dict[str, Any]) -> None:
+        """Synthesize text chunk by chunk, sending each chunk's audio as it is ready."""
+        try:
+            engine_type = parse_engine_type(options.get("engine", self.server.engine))
+            language = options.get("language", self.server.language)
+            validate_language(engine_type, language)
+        except ValueError as e:
+            raise HTTPRequestError(HTTPStatus.BAD_REQUEST, str(e))
+        key = (engine_type, language, self.server.device)
+        sample_rate = self.server.pool.get(*key).sample_rate
+        params = dict(
+            voice=options.get("voice", DEFAULT_VOICE),
+            speed=options.get("speed", DEFAULT_SPEED),
+            exaggeration=options.get("exaggeration", DEFAULT_EXAGGERATION),
+            cfg_weight=options.get("cfg_weight", DEFAULT_CFG_WEIGHT)
+        )
+        audio_format = options.get("format", "wav")
+        try:
+            encoding = AudioEncoding(
+                "wav" if audio_format == "pcm" else audio_format, options.get("compression_level")
+            )
+            texts = iter_text_chunks(
+                [text], None, options.get("sentences_per_chunk", DEFAULT_SENTENCES_PER_CHUNK),
+                options.get("chunk_chars"), options.get("min_chunk_chars"),
+                options.get("max_chunk_chars"), options.get("first_chunk_chars"),
+                language=language
+            )
+            first_chunk = next(texts)
+        except ValueError as e:
+            raise HTTPRequestError(HTTPStatus.BAD_REQUEST, str(e))
+
+        def synthesize(chunk_text: str) -> np.ndarray:
+            # Take an engine slot per chunk so concurrent requests interleave
+            with self.server.pool.acquire(*key) as engine:
+                return engine.generate(chunk_text, **params)[2]
+
+        # Synthesize the first chunk before sending headers, so that bad
+        # parameters (e.g. an unknown voice) and engine failures get an error status
+        try:
+            first_audio = synthesize(first_chunk)
+        except ValueError as e:
+            raise HTTPRequestError(HTTPStatus.BAD_REQUEST, str(e))
+        audios = chain([first_audio], map(synthesize, texts))
+        encoder = None
+        if audio_format not in ("wav", "pcm"):
+            encoder = StreamEncoder(sample_rate, encoding)
+
+        self.send_response(HTTPStatus.OK)
+        if audio_format == "pcm":
+            self.send_header("Content-Type", f"audio/pcm;rate={sample_rate};channels=1;format=s16le")
+        else:
+            self.send_header("Content-Type", encoding.mime_type)
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        try:
+            if audio_format == "wav":
+                self.write_chunk(wav_stream_header(sample_rate))
+            for audio in audios:
+                if encoder is not None:
+                    # The encoder may hold audio back until it has a full frame
+                    if data := encoder.encode(audio):
+                        self.write_chunk(data)
+                else:
+                    self.write_chunk(encode_pcm16(audio))
+            if encoder is not None and (data := encoder.close()):
+                self.write_chunk(data)
+            self.write_chunk(b"")
+        except (BrokenPipeError, ConnectionResetError):
+            # Client went away; stop synthesizing for it
+            self.close_connection = True
+        except Exception as e:
+            # Headers are already sent: end the connection without the final
+            # chunk so the client sees an incomplete response
+            self.log_error("Synthesis failed: %s", e)
+            self.close_connection = True
+
+    def write_chunk(self, data: bytes) -> None:
+        """Write one chunk of a chunked transfer-encoded response."""
+        self.wfile.write(f"{len(data):X}\r\n".encode("ascii") + data + b"\r\n")
+        self.wfile.flush()
+
+    def send_json(self, status: HTTPStatus, body: Dict[str, Any], headers: Optional[Dict[str, str]] = None) -> None:
+        data = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+class HTTPSynthesisServer(ThreadingHTTPServer):
+    """HTTP server hosting a warm engine pool.
+
+    At most ``max_queue`` synthesis requests are admitted at a time; they
+    wait for one of the ``concurrency`` slots of their engine. Requests
+    beyond that are rejected with 503 Service Unavailable.
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        address: tuple[str, int],
+        pool: EnginePool,
+        engine: str,
+        language: str,
+        device: Optional[str] = None,
+        max_queue: int = DEFAULT_HTTP_MAX_QUEUE
+    ):
+        self.pool = pool
+        self.engine = engine
+        self.language = language
+        self.device = device
+        self.max_queue = max_queue
+        self.active = 0
+        self.rejected = 0
+        self._active_lock = threading.Lock()
+        super().__init__(address, HTTPSynthesisHandler)
+
+    def admit(self) -> bool:
+        """Admit a request if the queue has room."""
+        with self._active_lock:
+            if self.active >= self.max_queue:
+                self.rejected += 1
+                return False
+            self.active += 1
+            return True
+
+    def release(self) -> None:
+        """Mark an admitted request as finished."""
+        with self._active_lock:
+            self.active -= 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Return server load statistics."""
+        with self._active_lock:
+            return {
+                "engines": len(self.pool),
+                "concurrency": self.pool.concurrency,
+                "active": self.active,
+                "max_queue": self.max_queue,
+                "rejected": self.rejected,
+            }
+
+def serve(
+    engine: str = "kokoro",
+    language: str = "en-gb",
+    device: Optional[str] = None,
+    host: str = DEFAULT_HTTP_HOST,
+    port: int = DEFAULT_HTTP_PORT,
+    concurrency: int = 1,
+    max_queue: int = DEFAULT_HTTP_MAX_QUEUE,
+    preload_voices: bool = False,
+) -> None:
+    """
+    Run the HTTP synthesis server in the foreground.
+
+    The given engine and language are the defaults for requests and are
+    loaded up front; others requested by clients are loaded on demand and
+    kept warm. Each engine synthesizes at most `concurrency` chunks at a
+    time and at most `max_queue` requests are accepted at once.
+    """
+    if concurrency < 1 or max_queue < 1:
+        raise ValueError("concurrency and max_queue must be at least 1")
+    pool = EnginePool(create_tts_engine, concurrency=concurrency)
+    engine_type = parse_engine_type(engine)
+    validate_language(engine_type, language)
+    tts_engine = pool.get(engine_type, language, device)
+    if preload_voices and hasattr(tts_engine, "preload_voices"):
+        tts_engine.preload_voices()
+
+    with HTTPSynthesisServer((host, port), pool, engine, language, device, max_queue) as server:
+        print(f"TTS HTTP server listening on http://{host}:{server.server_address[1]}")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            print("\nShutting down TTS HTTP server")
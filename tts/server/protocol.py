@@ -0,0 +1,49 @@
+"""
+Wire format shared by the synthesis daemon and its clients.
+
+Each message is a single line of JSON (the header) optionally followed by
+``header["nbytes"]`` bytes of raw float32 PCM.
+"""
+
+import json
+from typing import Any, BinaryIO, Dict, Tuple
+import numpy as np
+
+AUDIO_DTYPE = np.float32
+# Largest payload accepted, about 45 minutes of 24 kHz audio
+MAX_PAYLOAD_BYTES = 1 << 28
+
+def send_message(wfile: BinaryIO, header: Dict[str, Any], payload: bytes = b"") -> None:
+    """Write a header line and optional binary payload, then flush."""
+    header = dict(header, nbytes=len(payload))
+    wfile.write(json.dumps(header).encode("utf-8") + b"\n")
+    if payload:
+        wfile.write(payload)
+    wfile.flush()
+
+def read_message(rfile: BinaryIO) -> Tuple[Dict[str, Any], bytes]:
+    """Read a header line and its payload.
+
+    Raises EOFError when the peer closed and ValueError for a malformed header.
+    """
+    line = rfile.readline()
+    if not line:
+        raise EOFError("Connection closed")
+    header = json.loads(line)
+    if not isinstance(header, dict):
+        raise ValueError("Message header must be a JSON object")
+    nbytes = header.get("nbytes", 0)
+    if not isinstance(nbytes, int) or isinstance(nbytes, bool) or not 0 <= nbytes <= MAX_PAYLOAD_BYTES:
+        raise ValueError(f"Message nbytes must be an integer from 0 to {MAX_PAYLOAD_BYTES}")
+    payload = rfile.read(nbytes) if nbytes else b""
+    if len(payload) != nbytes:
+        raise EOFError("Connection closed while reading payload")
+    return header, payload
+
+def encode_audio(audio) -> bytes:
+    """Serialise audio samples as float32 bytes."""
+    return np.asarray(audio, dtype=AUDIO_DTYPE).tobytes()
+
+def decode_audio(payload: bytes) -> np.ndarray:
+    """Deserialise float32 bytes into an audio array."""
+    return np.frombuffer(payload, dtype=AUDIO_DTYPE)
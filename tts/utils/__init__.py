@@ -1,19 +1,40 @@
 """Utility functions for the TTS package."""
 
-from .audio import (
-    play_audio, save_audio, process_audio_chunk,
-    stitch_audio_files, get_audio_chunks
-)
 from .file import (
-    read_text_file, read_markdown_file,
-    read_input_file, prepare_output_directory
+    read_text_file, read_markdown_file, markdown_to_text,
+    prepare_output_directory, iter_text_file
+)
+from .readers import (
+    read_input_file, iter_input_file,
+    READERS, MIME_TYPES, register_reader, get_reader
 )
-from .text import process_text_chunks
+from .text import process_text_chunks, iter_text_chunks, iter_sentences
+from .cache import AudioCache, file_digest, hash_params
+from .profiling import Profiler, register_profile_hook, unregister_profile_hook
 
 __all__ = [
     "play_audio", "save_audio", "process_audio_chunk",
-    "stitch_audio_files", "get_audio_chunks",
-    "read_text_file", "read_markdown_file",
+    "chunk_file_name",
+    "StreamingAudioWriter", "StreamEncoder", "AudioEncoding", "OUTPUT_FORMATS",
+    "read_text_file", "read_markdown_file", "markdown_to_text",
     "read_input_file", "prepare_output_directory",
-    "process_text_chunks"
-] 
\ No newline at end of file
+    "iter_text_file", "iter_input_file",
+    "READERS", "MIME_TYPES", "register_reader", "get_reader",
+    "process_text_chunks", "iter_text_chunks", "iter_sentences",
+    "AudioCache", "file_digest", "hash_params",
+    "Profiler", "register_profile_hook", "unregister_profile_hook"
+]
+
+# Audio helpers are imported on first use, so text utilities load without
+# the audio stack
+AUDIO_NAMES = {
+    "play_audio", "save_audio", "process_audio_chunk",
+    "chunk_file_name",
+    "StreamingAudioWriter", "StreamEncoder", "AudioEncoding", "OUTPUT_FORMATS"
+}
+
+def __getattr__(name: str):
+    if name in AUDIO_NAMES:
+        from . import audio
+        return getattr(audio, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,14 +1,16 @@
 import soundfile as sf
-import sounddevice as sd
 import numpy as np
+from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Optional
-import subprocess
+from typing import BinaryIO, Optional, Union
 from ..models.audio_chunk import AudioChunk
 from ..config.settings import OutputMode
+from .playback import StreamingPlayer
 
 def play_audio(audio: np.ndarray, sample_rate: int, blocking: bool = True) -> None:
     """Play audio using sounddevice."""
+    # Imported here so the package loads on hosts without PortAudio
+    import sounddevice as sd
     try:
         sd.play(audio, sample_rate, blocking=blocking)
         if blocking:
@@ -16,11 +18,217 @@ def play_audio(audio: np.ndarray, sample_rate: int, blocking: bool = True) -> No
     except sd.PortAudioError as e:
         print(f"Audio playback error: {e}")
 
-def save_audio(audio_chunk: AudioChunk, output_path: Path, filename: str, sample_rate: int) -> None:
+# Output format -> (file suffix, libsndfile format, libsndfile subtype, MIME type)
+OUTPUT_FORMATS = {
+    'wav': ('.wav', 'WAV', 'PCM_16', 'audio/wav'),
+    'flac': ('.flac', 'FLAC', 'PCM_16', 'audio/flac'),
+    'ogg': ('.ogg', 'OGG', 'VORBIS', 'audio/ogg'),
+    'opus': ('.opus', 'OGG', 'OPUS', 'audio/ogg; codecs=opus'),
+    'mp3': ('.mp3', 'MP3', 'MPEG_LAYER_III', 'audio/mpeg'),
+}
+
+# Formats whose files can be reopened to continue writing, as resuming a stitched job does
+APPENDABLE_FORMATS = {'wav'}
+
+# Formats whose encoder only ever appends, so they can be sent while being
+# encoded; FLAC and MP3 go back to patch their header when the file is closed
+STREAMABLE_FORMATS = {'ogg', 'opus'}
+
+BITRATE_MODES = ('constant', 'average', 'variable')
+
+@dataclass(frozen=True)
+class AudioEncoding:
+    """Format of written audio and the settings of its encoder.
+
+    All formats are encoded in-process by libsndfile. compression_level
+    sets the bitrate of the lossy formats, from 0 (highest bitrate and
+    quality) to 1 (smallest file); for FLAC it only trades encoding time
+    for size. None keeps the encoder's default. bitrate_mode ('constant',
+    'average' or 'variable') applies to MP3 together with compression_level.
+    """
+    format: str = 'wav'
+    compression_level: Optional[float] = None
+    bitrate_mode: Optional[str] = None
+
+    def __post_init__(self):
+        if self.format not in OUTPUT_FORMATS:
+            raise ValueError(f"Invalid format: {self.format}. Must be one of: {', '.join(OUTPUT_FORMATS)}")
+        _, major, subtype, _ = OUTPUT_FORMATS[self.format]
+        if not sf.check_format(major, subtype):
+            raise ValueError(f"The installed libsndfile cannot write {self.format} files")
+        if self.compression_level is not None:
+            if self.format == 'wav':
+                raise ValueError("compression_level only applies to compressed formats")
+            if not 0.0 <= self.compression_level <= 1.0:
+                raise ValueError("compression_level must be between 0.0 and 1.0")
+        if self.bitrate_mode is not None:
+            if self.format != 'mp3':
+                raise ValueError("bitrate_mode only applies to mp3")
+            if self.bitrate_mode not in BITRATE_MODES:
+                raise ValueError(f"bitrate_mode must be one of: {', '.join(BITRATE_MODES)}")
+            if self.compression_level is None:
+                raise ValueError("bitrate_mode needs a compression_level")
+
+    @property
+    def suffix(self) -> str:
+        return OUTPUT_FORMATS[self.format][0]
+
+    @property
+    def mime_type(self) -> str:
+        return OUTPUT_FORMATS[self.format][3]
+
+    @property
+    def appendable(self) -> bool:
+        return self.format in APPENDABLE_FORMATS
+
+    def open(self, file: Union[str, BinaryIO], sample_rate: int) -> sf.SoundFile:
+        """Open a mono sound file (path or binary stream) for writing in this encoding."""
+        _, major, subtype, _ = OUTPUT_FORMATS[self.format]
+        return sf.SoundFile(
+            file, 'w', samplerate=sample_rate, channels=1,
+            format=major, subtype=subtype,
+            compression_level=self.compression_level,
+            bitrate_mode=self.bitrate_mode.upper() if self.bitrate_mode else None
+        )
+
+class StreamingAudioWriter:
+    """Appends audio chunks to a single open sound file as they are produced.
+
+    Replaces writing one file per chunk and concatenating them afterwards.
+    Compressed formats are encoded as the chunks are written.
+    """
+
+    def __init__(self, output_file: Path, sample_rate: int, encoding: AudioEncoding = AudioEncoding(), append: bool = False):
+        """
+        Args:
+            output_file: File to write
+            sample_rate: Sample rate of the audio
+            encoding: Format of the file and encoder settings
+            append: Reopen an existing file and continue writing at its end
+                (only for formats in APPENDABLE_FORMATS)
+        """
+        self.output_file = Path(output_file)
+        if append and self.output_file.exists():
+            if not encoding.appendable:
+                raise ValueError(f"Cannot append to {encoding.format} files")
+            self._file = sf.SoundFile(str(self.output_file), 'r+')
+            self._file.seek(0, sf.SEEK_END)
+        else:
+            self._file = encoding.open(str(self.output_file), sample_rate)
+
+    @property
+    def frames(self) -> int:
+        """Number of frames written so far."""
+        return self._file.frames
+
+    def write(self, audio: np.ndarray) -> None:
+        """Append audio samples to the file."""
+        self._file.write(np.asarray(audio, dtype=np.float32))
+
+    def truncate(self, frames: int) -> None:
+        """Discard everything after the given frame and continue writing there."""
+        # Compressed files cannot seek while writing, but never need to truncate
+        if frames == self._file.frames:
+            return
+        if frames < self._file.frames:
+            self._file.truncate(frames)
+        self._file.seek(frames)
+
+    def flush(self) -> None:
+        """Sync written audio to disk so it survives the process being killed."""
+        self._file.flush()
+
+    def close(self) -> None:
+        self._file.close()
+
+    def __enter__(self) -> "StreamingAudioWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+class EncodedBuffer:
+    """Write-only file object that hands out encoded audio as it is produced.
+
+    Bytes are dropped once taken, so later writes to them are lost. It only
+    suits encoders that never go back, those of STREAMABLE_FORMATS.
+    """
+
+    def __init__(self):
+        self._data = bytearray()
+        self._start = 0  # Stream position of the first byte in _data
+        self._position = 0
+        self._end = 0
+
+    def write(self, data: bytes) -> int:
+        size = len(data)
+        skip = max(0, self._start - self._position)
+        if skip < size:
+            offset = self._position + skip - self._start
+            if offset > len(self._data):
+                self._data.extend(bytes(offset - len(self._data)))
+            self._data[offset:offset + size - skip] = memoryview(data)[skip:]
+        self._position += size
+        self._end = max(self._end, self._position)
+        return size
+
+    def seek(self, offset: int, whence: int = 0) -> int:
+        base = {0: 0, 1: self._position, 2: self._end}[whence]
+        self._position = base + offset
+        return self._position
+
+    def tell(self) -> int:
+        return self._position
+
+    def read(self, size: int = -1) -> bytes:
+        return b''
+
+    def take(self) -> bytes:
+        """Return the bytes written since the last call."""
+        data = bytes(self._data)
+        self._start += len(self._data)
+        self._data.clear()
+        return data
+
+class StreamEncoder:
+    """Encodes audio chunks in memory, for sending over a stream."""
+
+    def __init__(self, sample_rate: int, encoding: AudioEncoding):
+        if encoding.format not in STREAMABLE_FORMATS:
+            raise ValueError(f"Cannot stream {encoding.format}; streamable formats are: {', '.join(sorted(STREAMABLE_FORMATS))}")
+        self._buffer = EncodedBuffer()
+        self._file = encoding.open(self._buffer, sample_rate)
+
+    def encode(self, audio: np.ndarray) -> bytes:
+        """Encode audio samples and return the bytes produced so far.
+
+        Encoders may hold back some audio until enough has accumulated, so
+        the result can be empty.
+        """
+        self._file.write(np.asarray(audio, dtype=np.float32))
+        return self._buffer.take()
+
+    def close(self) -> bytes:
+        """Finish the stream and return its remaining bytes."""
+        self._file.close()
+        return self._buffer.take()
+
+def chunk_file_name(filename: str, index: int, suffix: str = '.wav') -> str:
+    """Name of the file holding a single saved chunk."""
+    return f"{filename}_{index}{suffix}"
+
+def save_audio(
+    audio_chunk: AudioChunk,
+    output_path: Path,
+    filename: str,
+    sample_rate: int,
+    encoding: AudioEncoding = AudioEncoding()
+) -> None:
     """Save audio chunk to file."""
-    output_file = output_path / f"{filename}_{audio_chunk.index}.wav"
+    output_file = output_path / chunk_file_name(filename, audio_chunk.index, encoding.suffix)
     print(f"Saving to: {output_file}")
-    sf.write(str(output_file), audio_chunk.audio, sample_rate)
+    with encoding.open(str(output_file), sample_rate) as f:
+        f.write(np.asarray(audio_chunk.audio, dtype=np.float32))
 
 def process_audio_chunk(
     chunk: AudioChunk,
@@ -28,72 +236,44 @@ def process_audio_chunk(
     output_path: Optional[Path],
     filename: str,
     sample_rate: int,
-    wait_after_play: bool = True
+    wait_after_play: bool = True,
+    player: Optional[StreamingPlayer] = None,
+    writer: Optional[StreamingAudioWriter] = None,
+    verbose: bool = True,
+    encoding: AudioEncoding = AudioEncoding()
 ) -> None:
-    """Process a single audio chunk according to output mode."""
-    print(f"\nProcessing chunk {chunk.index}:")
-    print(f"Text: {chunk.text}")
-    print(f"Phonemes: {chunk.phonemes}")
+    """Process a single audio chunk according to output mode.
+
+    If a player is given, the audio has already been queued on it, segment
+    by segment as it was synthesized, so it is not played (and waited for)
+    here. If a writer is given, audio is appended to its file instead of
+    being saved as a chunk file in the given encoding. With verbose=False,
+    the chunk's text and progress are not printed.
+    """
+    if verbose:
+        print(f"\nProcessing chunk {chunk.index}:")
+        print(f"Text: {chunk.text}")
+        print(f"Phonemes: {chunk.phonemes}")
 
     if output_mode in (OutputMode.PLAY, OutputMode.BOTH):
-        print("Playing audio...")
-        play_audio(chunk.audio, sample_rate, blocking=wait_after_play)
+        if player is not None:
+            if verbose:
+                print("Streaming audio...")
+        else:
+            if verbose:
+                print("Playing audio...")
+            play_audio(chunk.audio, sample_rate, blocking=wait_after_play)
     
-    if output_mode in (OutputMode.SAVE, OutputMode.BOTH) and output_path:
-        save_audio(chunk, output_path, filename, sample_rate)
-    
-    print("-" * 40)
-
-def get_audio_chunks(output_path: Path, filename: str) -> List[Path]:
-    """Get sorted list of audio chunk files."""
-    chunks = sorted(output_path.glob(f"{filename}_*.wav"))
-    if not chunks:
-        print("No audio chunks found to stitch")
-    return chunks
-
-def create_chunk_list_file(chunks: List[Path], output_path: Path) -> Path:
-    """Create a temporary file listing all audio chunks for ffmpeg."""
-    list_file = output_path / "chunks.txt"
-    with open(list_file, 'w') as f:
-        for chunk in chunks:
-            f.write(f"file '{chunk.name}'\n")
-    return list_file
-
-def run_ffmpeg_stitch(list_file: Path, output_file: Path) -> None:
-    """Run ffmpeg to concatenate audio files."""
-    try:
-        subprocess.run([
-            'ffmpeg', '-f', 'concat', '-safe', '0',
-            '-i', str(list_file),
-            '-c', 'copy',
-            str(output_file)
-        ], check=True)
-        print(f"\nSuccessfully combined audio chunks into: {output_file}")
-    except subprocess.CalledProcessError as e:
-        print(f"Error stitching audio files: {e}")
-    except Exception as e:
-        print(f"Unexpected error during audio stitching: {e}")
-
-def cleanup_files(list_file: Path, chunks: List[Path]) -> None:
-    """Clean up temporary files after stitching."""
-    try:
-        list_file.unlink()
-        for chunk in chunks:
-            chunk.unlink()
-    except Exception as e:
-        print(f"Warning: Error during cleanup: {e}")
-
-def stitch_audio_files(output_path: Path, filename: str) -> None:
-    """Combine numbered audio chunks into a single file using ffmpeg."""
-    chunks = get_audio_chunks(output_path, filename)
-    if not chunks:
-        return
-        
-    list_file = create_chunk_list_file(chunks, output_path)
-    output_file = output_path / f"{filename}.wav"
+    if output_mode in (OutputMode.SAVE, OutputMode.BOTH):
+        if writer is not None:
+            if verbose:
+                print(f"Appending to: {writer.output_file}")
+            writer.write(chunk.audio)
+        elif output_path:
+            save_audio(chunk, output_path, filename, sample_rate, encoding)
     
-    run_ffmpeg_stitch(list_file, output_file)
-    cleanup_files(list_file, chunks)
+    if verbose:
+        print("-" * 40)
 
 def play_audio_file(audio_file: str, volume: float = 1.0) -> tuple[bool, str]:
     """
@@ -105,6 +285,7 @@ def play_audio_file(audio_file: str, volume: float = 1.0) -> tuple[bool, str]:
         (success: bool, message: str)
     """
     try:
+        import sounddevice as sd
         data, samplerate = sf.read(audio_file)
         volume = max(0.0, min(volume, 1.0))
         data = data * volume
@@ -0,0 +1,131 @@
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+import numpy as np
+
+def file_digest(file_path: Optional[str]) -> Optional[str]:
+    """Return the SHA-256 of a file's contents, or None if no path is given."""
+    if file_path is None:
+        return None
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+def hash_params(**params: Any) -> str:
+    """Return a stable SHA-256 of JSON-serialisable parameters."""
+    blob = json.dumps(params, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(blob.encode('utf-8')).hexdigest()
+
+class AudioCache:
+    """Content-addressed on-disk cache of synthesized audio.
+
+    Entries are keyed by a hash of the chunk text and every synthesis
+    parameter. The least recently used entries are evicted once the cache
+    grows beyond ``max_bytes``.
+    """
+
+    SUFFIX = ".npz"
+    # Eviction leaves the cache this full, so a full cache is rescanned once
+    # per many writes instead of on every write
+    LOW_WATER = 0.9
+
+    def __init__(self, cache_dir: Path, max_bytes: int):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._size = sum(path.stat().st_size for path in self._entries())
+
+    @staticmethod
+    def make_key(**params: Any) -> str:
+        """Hash synthesis parameters into a cache key."""
+        return hash_params(**params)
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}{self.SUFFIX}"
+
+    def _entries(self):
+        return self.cache_dir.glob(f"*/*{self.SUFFIX}")
+
+    def get(self, key: str) -> Optional[Tuple[str, str, np.ndarray]]:
+        """Return cached (graphemes, phonemes, audio) or None on a miss."""
+        path = self._path(key)
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                entry = str(data['graphemes']), str(data['phonemes']), data['audio']
+        except (OSError, ValueError, KeyError):
+            self.misses += 1
+            return None
+        # Refresh the modification time so eviction is least-recently-used
+        os.utime(path)
+        self.hits += 1
+        return entry
+
+    def put(self, key: str, graphemes: str, phonemes: str, audio: np.ndarray) -> None:
+        """Store an entry, writing atomically, and evict old entries if needed."""
+        path = self._path(key)
+        path.parent.mkdir(exist_ok=True)
+        try:
+            replaced = path.stat().st_size
+        except FileNotFoundError:
+            replaced = 0
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                np.savez(
+                    f,
+                    graphemes=np.array(graphemes),
+                    phonemes=np.array(phonemes),
+                    audio=np.asarray(audio, dtype=np.float32)
+                )
+            os.replace(tmp_name, path)
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+        self._size += path.stat().st_size - replaced
+        if self._size > self.max_bytes:
+            self.evict()
+
+    def evict(self) -> None:
+        """Remove least recently used entries until the cache is LOW_WATER full."""
+        entries = []
+        for path in self._entries():
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        entries.sort()
+
+        self._size = sum(size for _, size, _ in entries)
+        target = int(self.max_bytes * self.LOW_WATER)
+        for _, size, path in entries:
+            if self._size <= target:
+                break
+            path.unlink(missing_ok=True)
+            self._size -= size
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss statistics for this run."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "size_bytes": self._size,
+        }
+
+    def print_stats(self) -> None:
+        """Print a one-line hit/miss summary."""
+        stats = self.stats()
+        print(
+            f"Audio cache: {stats['hits']} hits, {stats['misses']} misses "
+            f"({stats['hit_rate']:.0%} hit rate), "
+            f"{stats['size_bytes'] / (1 << 20):.1f} MB in {self.cache_dir}"
+        )
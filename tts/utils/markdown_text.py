@@ -0,0 +1,161 @@
+"""
+Direct Markdown-to-speech-text conversion.
+
+Markdown is converted line by line, without rendering and re-parsing HTML,
+so large documents can be streamed. Markup is dropped, code blocks, images
+and raw URLs are skipped, links are read as their text, and headings, list
+items and table rows are each read as a sentence of their own.
+"""
+
+import html
+import re
+from typing import Iterable, Iterator, List, Optional
+
+from .text import ensure_punctuation, iter_lines
+
+# Block-level syntax, matched against a single line
+FENCE = re.compile(r' {0,3}(`{3,}|~{3,})')
+ATX_HEADING = re.compile(r' {0,3}#{1,6}(?:[ \t]+|$)(.*?)(?:[ \t]+#+)?[ \t]*$')
+SETEXT_UNDERLINE = re.compile(r' {0,3}(?:=+|-+)[ \t]*$')
+THEMATIC_BREAK = re.compile(r' {0,3}([-*_])(?:[ \t]*\1){2,}[ \t]*$')
+BLOCKQUOTE = re.compile(r' {0,3}>[ \t]?')
+LIST_ITEM = re.compile(r'[ \t]*(?:[-*+]|\d{1,9}[.)])[ \t]+(?:\[[ xX]\][ \t]+)?')
+INDENTED_CODE = re.compile(r'(?: {4}|\t)')
+TABLE_DELIMITER = re.compile(r'[ \t]*\|?[ \t]*:?-+:?[ \t]*(?:\|[ \t]*:?-+:?[ \t]*)*\|?[ \t]*$')
+LINK_DEFINITION = re.compile(r' {0,3}\[[^\]]+\]:[ \t]*\S')
+HTML_COMMENT = re.compile(r'<!--.*?-->')
+
+# Inline syntax; INLINE_MARKUP finds lines that need any of the substitutions
+INLINE_MARKUP = re.compile(r'[`*_~\[<&\\]|://|www\.')
+FOOTNOTE_REFERENCE = re.compile(r'\[\^[^\]]+\]')
+IMAGE = re.compile(r'!\[[^\]]*\](?:\([^)]*\)|\[[^\]]*\])?')
+LINK = re.compile(r'\[([^\]]*)\](?:\([^)]*\)|\[[^\]]*\])')
+AUTOLINK = re.compile(r'<(?:[A-Za-z][A-Za-z0-9+.-]{1,31}:[^>\s]*|[^@>\s]+@[^>\s]+)>')
+# Bare URLs, with the space before them and any parentheses around them;
+# trailing punctuation is kept
+URL = (r'\b(?:[A-Za-z][A-Za-z0-9+.-]*://|www\.)(?:[^\s<>()]|\([^\s<>()]*\))*'
+       r'(?:[^\s<>().,;:!?\'"\]]|\([^\s<>()]*\))')
+BARE_URL = re.compile(rf'[ \t]*(?:\({URL}\)|{URL})')
+HTML_TAG = re.compile(r'</?[A-Za-z][^>]*>')
+CODE_SPAN = re.compile(r'(`+)[ ]?(.+?)[ ]?\1')
+EMPHASIS = re.compile(
+    r'(?<![\w\\])(\*{1,3}|~~)(?=\S)(.+?)(?<=\S)\1(?!\w)'
+    r'|(?<!\w)(_{1,3})(?=\S)(.+?)(?<=\S)\3(?!\w)'
+)
+ESCAPE = re.compile(r'\\([!-/:-@\[-`{-~])')
+
+def inline_to_text(line: str) -> str:
+    """Strip inline Markdown and HTML from a line of text."""
+    if not INLINE_MARKUP.search(line):
+        return line
+    line = FOOTNOTE_REFERENCE.sub('', line)
+    line = IMAGE.sub('', line)
+    line = LINK.sub(r'\1', line)
+    line = AUTOLINK.sub('', line)
+    line = BARE_URL.sub('', line)
+    line = HTML_TAG.sub('', line)
+    line = CODE_SPAN.sub(r'\2', line)
+    line = EMPHASIS.sub(lambda m: m.group(2) if m.group(2) is not None else m.group(4), line)
+    line = ESCAPE.sub(r'\1', line)
+    return html.unescape(line) if '&' in line else line
+
+def table_row_to_text(line: str) -> str:
+    """Read a table row as its cells separated by commas."""
+    cells = [inline_to_text(cell.strip()) for cell in line.strip().strip('|').split('|')]
+    return ', '.join(cell for cell in cells if cell)
+
+def iter_markdown_text(blocks: Iterable[str]) -> Iterator[str]:
+    """Convert a stream of Markdown text blocks to plain text for speech.
+
+    Each paragraph, heading, list item or table row is yielded as soon as it
+    is complete, ending with sentence punctuation and followed by a blank
+    line. Only the current paragraph is held in memory.
+    """
+    paragraph: List[str] = []
+    last_line: Optional[str] = None  # Raw text of the last paragraph line
+    fence: Optional[str] = None
+    in_comment = False
+    in_table = False
+    in_list = False
+    after_blank = True
+
+    def flush() -> Iterator[str]:
+        # Also collapses the gaps left by removed markup
+        text = ' '.join(' '.join(paragraph).split())
+        paragraph.clear()
+        if text:
+            yield ensure_punctuation(text) + '\n\n'
+
+    for line in iter_lines(blocks):
+        # Skip the contents of fenced code blocks and HTML comments
+        if fence is not None:
+            if line.lstrip().startswith(fence):
+                fence = None
+            continue
+        if in_comment:
+            if '-->' not in line:
+                continue
+            line = line.split('-->', 1)[1]
+            in_comment = False
+        if '<!--' in line:
+            line = HTML_COMMENT.sub('', line)
+            if '<!--' in line:
+                line, in_comment = line.split('<!--', 1)[0], True
+
+        if not line.strip():
+            yield from flush()
+            in_table = False
+            after_blank = True
+            continue
+        if after_blank and not line[0].isspace():
+            in_list = False
+        if after_blank and not in_list and INDENTED_CODE.match(line):
+            continue
+        if (match := FENCE.match(line)) is not None:
+            yield from flush()
+            fence = match.group(1)
+            continue
+
+        # Setext heading underline: the paragraph so far is a heading
+        if paragraph and not after_blank and SETEXT_UNDERLINE.match(line):
+            yield from flush()
+            continue
+        if THEMATIC_BREAK.match(line) or LINK_DEFINITION.match(line):
+            yield from flush()
+            continue
+        if (match := ATX_HEADING.match(line)) is not None:
+            yield from flush()
+            paragraph.append(inline_to_text(match.group(1)))
+            yield from flush()
+            continue
+
+        while (match := BLOCKQUOTE.match(line)) is not None:
+            line = line[match.end():]
+
+        # A delimiter row turns the previous line into a table header
+        if '|' in line and paragraph and last_line is not None and '|' in last_line \
+                and TABLE_DELIMITER.match(line):
+            paragraph.pop()
+            yield from flush()
+            paragraph.append(table_row_to_text(last_line))
+            yield from flush()
+            in_table = True
+            continue
+        if in_table and '|' in line:
+            paragraph.append(table_row_to_text(line))
+            yield from flush()
+            continue
+
+        if (match := LIST_ITEM.match(line)) is not None:
+            yield from flush()
+            line = line[match.end():]
+            in_list = True
+
+        paragraph.append(inline_to_text(line.strip()))
+        last_line = line
+        after_blank = False
+    yield from flush()
+
+def markdown_to_text(md_content: str) -> str:
+    """Convert markdown text to plain text."""
+    return ''.join(iter_markdown_text([md_content])).strip()
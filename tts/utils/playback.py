@@ -0,0 +1,88 @@
+import queue
+import threading
+from typing import Optional
+import numpy as np
+from ..config.settings import DEFAULT_PLAYBACK_QUEUE_SIZE
+
+class StreamingPlayer:
+    """Gapless playback of queued audio through one continuous output stream.
+
+    The caller (the synthesis worker) enqueues audio as it is produced while a
+    background thread drains the bounded queue into a single
+    ``sounddevice.OutputStream``, so synthesis of the next chunk overlaps with
+    playback of the current one.
+    """
+
+    _STOP = object()
+
+    def __init__(self, sample_rate: int, max_queue: int = DEFAULT_PLAYBACK_QUEUE_SIZE):
+        self.sample_rate = sample_rate
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue)
+        self._thread = threading.Thread(target=self._run, name="tts-playback", daemon=True)
+        self._abort = threading.Event()
+        self._error: Optional[Exception] = None
+
+    def start(self) -> "StreamingPlayer":
+        """Start the playback thread."""
+        self._thread.start()
+        return self
+
+    def enqueue(self, audio: np.ndarray) -> None:
+        """Queue audio for playback, blocking while the queue is full.
+
+        Raises the error that stopped playback, if any.
+        """
+        self._raise_error()
+        self._queue.put(np.ascontiguousarray(audio, dtype=np.float32).reshape(-1, 1))
+
+    def close(self, drain: bool = True) -> None:
+        """Stop the player, by default after all queued audio has been played.
+
+        When draining, raises the error that stopped playback, if any.
+        """
+        if not drain:
+            self._abort.set()
+            self._clear_queue()
+        if self._thread.is_alive():
+            self._queue.put(self._STOP)
+        self._thread.join()
+        if drain:
+            self._raise_error()
+
+    def _raise_error(self) -> None:
+        if self._error is not None:
+            raise self._error
+
+    def _clear_queue(self) -> None:
+        try:
+            while True:
+                self._queue.get_nowait()
+        except queue.Empty:
+            pass
+
+    def _fail(self, error: Exception) -> None:
+        self._error = error
+        # Unblock a producer waiting on a full queue
+        self._clear_queue()
+
+    def _run(self) -> None:
+        try:
+            # Imported here so the package loads on hosts without PortAudio
+            import sounddevice as sd
+            with sd.OutputStream(samplerate=self.sample_rate, channels=1, dtype='float32') as stream:
+                while True:
+                    audio = self._queue.get()
+                    if audio is self._STOP or self._abort.is_set():
+                        break
+                    stream.write(audio)
+                if self._abort.is_set():
+                    stream.abort()
+        except Exception as e:
+            # Any error, not only PortAudioError, must reach the producer or it blocks forever
+            self._fail(e)
+
+    def __enter__(self) -> "StreamingPlayer":
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close(drain=exc_type is None)
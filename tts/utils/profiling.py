@@ -0,0 +1,179 @@
+import json
+import sys
+import time
+from contextlib import contextmanager, nullcontext
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+ProfileHook = Callable[[Dict[str, Any]], None]
+
+_hooks: List[ProfileHook] = []
+
+def register_profile_hook(hook: ProfileHook) -> ProfileHook:
+    """Call hook with the report of every profiled run; enables profiling.
+
+    Returns the hook so it can be used as a decorator.
+    """
+    _hooks.append(hook)
+    return hook
+
+def unregister_profile_hook(hook: ProfileHook) -> None:
+    """Stop calling a previously registered hook."""
+    _hooks.remove(hook)
+
+def profile_hooks_registered() -> bool:
+    """Return whether any profile hook is registered."""
+    return bool(_hooks)
+
+def peak_rss_mb(children: bool = False) -> Optional[float]:
+    """Return the peak resident set size of this process (or its children) in MB."""
+    if resource is None:
+        return None
+    who = resource.RUSAGE_CHILDREN if children else resource.RUSAGE_SELF
+    peak = resource.getrusage(who).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in kilobytes elsewhere
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+@dataclass
+class StageTiming:
+    """Accumulated wall time of one pipeline stage."""
+    seconds: float = 0.0
+    calls: int = 0
+
+@dataclass
+class ChunkTiming:
+    """Timing of one synthesized chunk.
+
+    synthesis_seconds is the chunk's share of its batch when chunks are
+    synthesized in batches. ready_seconds is measured from the start of the run.
+    """
+    index: int
+    characters: int
+    audio_seconds: float
+    synthesis_seconds: float
+    output_seconds: float
+    ready_seconds: float
+
+    @property
+    def rtf(self) -> float:
+        """Real-time factor: synthesis time per second of audio."""
+        return self.synthesis_seconds / self.audio_seconds if self.audio_seconds else 0.0
+
+@dataclass
+class Profiler:
+    """Record per-stage and per-chunk wall time of a synthesis run."""
+    metadata: Dict[str, Any] = field(default_factory=dict)
+    stages: Dict[str, StageTiming] = field(default_factory=dict)
+    chunks: List[ChunkTiming] = field(default_factory=list)
+    start_time: float = field(default_factory=time.perf_counter)
+    end_time: Optional[float] = None
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Time a block of code and add it to the named stage."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_time(name, time.perf_counter() - start)
+
+    def add_time(self, name: str, seconds: float) -> None:
+        """Add wall time to the named stage."""
+        timing = self.stages.setdefault(name, StageTiming())
+        timing.seconds += seconds
+        timing.calls += 1
+
+    def iter_stage(self, name: str, items: Iterable) -> Iterator:
+        """Yield from items, timing each step of the iteration as the named stage.
+
+        Used for lazy stages, such as text parsing, that are interleaved
+        with the rest of the pipeline.
+        """
+        iterator = iter(items)
+        while True:
+            with self.stage(name):
+                item = next(iterator, StopIteration)
+            if item is StopIteration:
+                return
+            yield item
+
+    def elapsed(self) -> float:
+        """Return seconds since the run started."""
+        return (self.end_time or time.perf_counter()) - self.start_time
+
+    def record_chunk(
+        self,
+        index: int,
+        characters: int,
+        audio_seconds: float,
+        synthesis_seconds: float,
+        output_seconds: float
+    ) -> ChunkTiming:
+        """Record the timing of a chunk once its audio has been output."""
+        chunk = ChunkTiming(
+            index=index,
+            characters=characters,
+            audio_seconds=audio_seconds,
+            synthesis_seconds=synthesis_seconds,
+            output_seconds=output_seconds,
+            ready_seconds=self.elapsed()
+        )
+        self.chunks.append(chunk)
+        return chunk
+
+    def finish(self) -> Dict[str, Any]:
+        """Stop the clock, run registered hooks and return the report."""
+        self.end_time = time.perf_counter()
+        report = self.report()
+        for hook in list(_hooks):
+            hook(report)
+        return report
+
+    def report(self) -> Dict[str, Any]:
+        """Return the profile as a JSON-serialisable dict."""
+        wall = self.elapsed()
+        audio = sum(chunk.audio_seconds for chunk in self.chunks)
+        synthesis = sum(chunk.synthesis_seconds for chunk in self.chunks)
+        return {
+            **self.metadata,
+            "wall_seconds": wall,
+            "audio_seconds": audio,
+            "rtf": wall / audio if audio else None,
+            "synthesis_rtf": synthesis / audio if audio else None,
+            "first_chunk_seconds": self.chunks[0].ready_seconds if self.chunks else None,
+            "peak_rss_mb": peak_rss_mb(),
+            "peak_children_rss_mb": peak_rss_mb(children=True),
+            "stages": {name: asdict(timing) for name, timing in self.stages.items()},
+            "chunks": [{**asdict(chunk), "rtf": chunk.rtf} for chunk in self.chunks],
+        }
+
+    def print_summary(self) -> None:
+        """Print a per-stage timing table and run totals."""
+        report = self.report()
+        wall = report["wall_seconds"]
+        print("\nProfile:")
+        print(f"  {'stage':<12} {'calls':>7} {'seconds':>10} {'% wall':>7}")
+        for name, timing in self.stages.items():
+            share = 100 * timing.seconds / wall if wall else 0.0
+            print(f"  {name:<12} {timing.calls:>7} {timing.seconds:>10.3f} {share:>6.1f}%")
+        print(f"  Chunks: {len(self.chunks)}, audio: {report['audio_seconds']:.2f}s, wall: {wall:.2f}s")
+        if report["rtf"] is not None:
+            print(f"  Real-time factor: {report['rtf']:.3f} overall, {report['synthesis_rtf']:.3f} synthesis")
+        if report["first_chunk_seconds"] is not None:
+            print(f"  First chunk ready after {report['first_chunk_seconds']:.3f}s")
+        if report["peak_rss_mb"] is not None:
+            print(f"  Peak RSS: {report['peak_rss_mb']:.1f} MB (children: {report['peak_children_rss_mb']:.1f} MB)")
+
+    def save_json(self, path: Path) -> None:
+        """Write the report as JSON."""
+        Path(path).write_text(json.dumps(self.report(), indent=2) + "\n", encoding="utf-8")
+
+def profile_stage(profiler: Optional[Profiler], name: str):
+    """Return a context manager timing the named stage, or a no-op without a profiler."""
+    return profiler.stage(name) if profiler is not None else nullcontext()
@@ -0,0 +1,254 @@
+"""
+Input readers for the supported file formats.
+
+Readers are looked up by file suffix or MIME type. Each takes a binary
+stream and lazily yields the text to speak in segments, so even large
+inputs flow into the chunker as they are read.
+"""
+
+import codecs
+import json
+import posixpath
+import re
+import zipfile
+from html.parser import HTMLParser
+from pathlib import Path
+from typing import BinaryIO, Callable, Dict, Iterable, Iterator, List, Optional
+from xml.etree import ElementTree
+
+from .file import READ_BLOCK_SIZE
+from .markdown_text import iter_markdown_text
+from .text import ensure_punctuation, iter_lines
+
+# Binary input stream -> text segments
+Reader = Callable[[BinaryIO], Iterator[str]]
+
+def iter_decoded(stream: BinaryIO, block_size: int = READ_BLOCK_SIZE) -> Iterator[str]:
+    """Decode a UTF-8 byte stream in blocks, dropping a byte order mark."""
+    decoder = codecs.getincrementaldecoder('utf-8-sig')()
+    while block := stream.read(block_size):
+        if text := decoder.decode(block):
+            yield text
+    if text := decoder.decode(b'', final=True):
+        yield text
+
+class HTMLTextExtractor(HTMLParser):
+    """Collects the readable text of an HTML document as paragraphs.
+
+    Scripts, styles, the document head and preformatted (code) blocks are
+    skipped. Block elements end a paragraph and table cells are separated
+    by commas.
+    """
+
+    SKIP_TAGS = {'head', 'script', 'style', 'template', 'noscript', 'svg', 'math', 'pre'}
+    BLOCK_TAGS = {
+        'address', 'article', 'aside', 'blockquote', 'br', 'caption', 'dd', 'div', 'dl', 'dt',
+        'figcaption', 'figure', 'footer', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'header', 'hr',
+        'li', 'main', 'nav', 'ol', 'p', 'section', 'table', 'tr', 'ul',
+    }
+    CELL_TAGS = {'td', 'th'}
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.paragraphs: List[str] = []
+        self._parts: List[str] = []
+        self._skip_depth = 0
+
+    def flush(self) -> None:
+        text = ' '.join(''.join(self._parts).split()).strip(', ')
+        self._parts.clear()
+        if text:
+            self.paragraphs.append(ensure_punctuation(text) + '\n\n')
+
+    def handle_starttag(self, tag: str, attrs) -> None:
+        if tag in self.SKIP_TAGS:
+            self._skip_depth += 1
+        elif tag in self.BLOCK_TAGS and not self._skip_depth:
+            self.flush()
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag in self.SKIP_TAGS:
+            self._skip_depth = max(0, self._skip_depth - 1)
+        elif self._skip_depth:
+            return
+        elif tag in self.BLOCK_TAGS:
+            self.flush()
+        elif tag in self.CELL_TAGS:
+            self._parts.append(', ')
+
+    def handle_startendtag(self, tag: str, attrs) -> None:
+        # Self-closing tags such as <br/> have no content to skip
+        if tag in self.BLOCK_TAGS and not self._skip_depth:
+            self.flush()
+
+    def handle_data(self, data: str) -> None:
+        if not self._skip_depth:
+            self._parts.append(data)
+
+def iter_html_text(blocks: Iterable[str]) -> Iterator[str]:
+    """Convert a stream of HTML text blocks to paragraphs of plain text."""
+    parser = HTMLTextExtractor()
+    for block in blocks:
+        parser.feed(block)
+        yield from parser.paragraphs
+        parser.paragraphs.clear()
+    parser.close()
+    parser.flush()
+    yield from parser.paragraphs
+
+# Cue timing line of SRT ("00:00:01,000 --> ...") and WebVTT ("00:01.000 --> ...") files
+SUBTITLE_TIMING = re.compile(r'\s*(?:\d+:)?\d{1,2}:\d{2}[.,]\d{1,3}\s*-->')
+# Inline markup such as <i>, <c.yellow> or SSA override codes like {\an8}
+SUBTITLE_MARKUP = re.compile(r'<[^>]*>|\{\\[^}]*\}')
+
+def iter_subtitle_text(blocks: Iterable[str]) -> Iterator[str]:
+    """Yield the text of each SRT or WebVTT cue, one cue per line.
+
+    Cue numbers, identifiers, timings, WebVTT headers and NOTE or STYLE
+    blocks are dropped, as are cues repeating the previous cue's text.
+    """
+    cue: List[str] = []
+    in_cue = False
+    previous = None
+    for line in iter_lines(blocks):
+        if not line.strip():
+            text = ' '.join(' '.join(cue).split())
+            if text and text != previous:
+                yield text + '\n'
+                previous = text
+            cue.clear()
+            in_cue = False
+        elif SUBTITLE_TIMING.match(line):
+            in_cue = True
+        elif in_cue:
+            cue.append(SUBTITLE_MARKUP.sub('', line))
+    text = ' '.join(' '.join(cue).split())
+    if text and text != previous:
+        yield text + '\n'
+
+def iter_jsonl_text(blocks: Iterable[str]) -> Iterator[str]:
+    """Yield one utterance per JSON Lines record.
+
+    Each line is a JSON string or an object with a "text" string.
+    """
+    for number, line in enumerate(iter_lines(blocks), 1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError as e:
+            raise ValueError(f"Invalid JSON on line {number}: {e}")
+        text = record.get('text') if isinstance(record, dict) else record
+        if not isinstance(text, str):
+            raise ValueError(f'Line {number} must be a JSON string or an object with a "text" string')
+        if text.strip():
+            yield ensure_punctuation(text.strip()) + '\n\n'
+
+EPUB_CONTAINER = 'META-INF/container.xml'
+EPUB_NAMESPACES = {
+    'container': 'urn:oasis:names:tc:opendocument:xmlns:container',
+    'opf': 'http://www.idpf.org/2007/opf',
+}
+EPUB_DOCUMENT_TYPES = {'application/xhtml+xml', 'text/html'}
+
+def iter_epub_chapters(epub: zipfile.ZipFile) -> Iterator[str]:
+    """Yield the archive paths of an EPUB's content documents in reading order."""
+    try:
+        container = ElementTree.fromstring(epub.read(EPUB_CONTAINER))
+        rootfile = container.find('.//container:rootfile', EPUB_NAMESPACES)
+        package_path = rootfile.get('full-path')
+        package = ElementTree.fromstring(epub.read(package_path))
+    except (KeyError, AttributeError, ElementTree.ParseError) as e:
+        raise ValueError(f"Invalid EPUB file: {e}")
+    base = posixpath.dirname(package_path)
+    manifest = {
+        item.get('id'): item
+        for item in package.iterfind('opf:manifest/opf:item', EPUB_NAMESPACES)
+    }
+    for itemref in package.iterfind('opf:spine/opf:itemref', EPUB_NAMESPACES):
+        item = manifest.get(itemref.get('idref'))
+        if item is not None and item.get('media-type') in EPUB_DOCUMENT_TYPES:
+            yield posixpath.normpath(posixpath.join(base, item.get('href')))
+
+def read_epub(stream: BinaryIO) -> Iterator[str]:
+    """Read the text of an EPUB book chapter by chapter."""
+    with zipfile.ZipFile(stream) as epub:
+        for chapter in iter_epub_chapters(epub):
+            with epub.open(chapter) as document:
+                yield from iter_html_text(iter_decoded(document))
+
+def read_text(stream: BinaryIO) -> Iterator[str]:
+    return iter_decoded(stream)
+
+def read_markdown(stream: BinaryIO) -> Iterator[str]:
+    return iter_markdown_text(iter_decoded(stream))
+
+def read_html(stream: BinaryIO) -> Iterator[str]:
+    return iter_html_text(iter_decoded(stream))
+
+def read_subtitles(stream: BinaryIO) -> Iterator[str]:
+    return iter_subtitle_text(iter_decoded(stream))
+
+def read_jsonl(stream: BinaryIO) -> Iterator[str]:
+    return iter_jsonl_text(iter_decoded(stream))
+
+# File suffix -> reader
+READERS: Dict[str, Reader] = {
+    '.txt': read_text,
+    '.md': read_markdown,
+    '.markdown': read_markdown,
+    '.html': read_html,
+    '.htm': read_html,
+    '.xhtml': read_html,
+    '.epub': read_epub,
+    '.srt': read_subtitles,
+    '.vtt': read_subtitles,
+    '.jsonl': read_jsonl,
+    '.ndjson': read_jsonl,
+}
+
+# MIME type -> file suffix of its reader
+MIME_TYPES: Dict[str, str] = {
+    'text/plain': '.txt',
+    'text/markdown': '.md',
+    'text/html': '.html',
+    'application/xhtml+xml': '.xhtml',
+    'application/epub+zip': '.epub',
+    'application/x-subrip': '.srt',
+    'text/vtt': '.vtt',
+    'application/jsonl': '.jsonl',
+    'application/x-ndjson': '.ndjson',
+}
+
+def register_reader(reader: Reader, suffixes: Iterable[str], mime_types: Iterable[str] = ()) -> None:
+    """Register a reader for the given file suffixes (e.g. ".rst") and MIME types."""
+    suffixes = [suffix.lower() for suffix in suffixes]
+    for suffix in suffixes:
+        READERS[suffix] = reader
+    for mime_type in mime_types:
+        MIME_TYPES[mime_type.lower()] = suffixes[0]
+
+def get_reader(suffix: Optional[str] = None, mime_type: Optional[str] = None) -> Reader:
+    """Return the reader for a file suffix or, failing that, a MIME type."""
+    if suffix and suffix.lower() in READERS:
+        return READERS[suffix.lower()]
+    if mime_type and mime_type.lower() in MIME_TYPES:
+        return READERS[MIME_TYPES[mime_type.lower()]]
+    raise ValueError(f"Input file must be one of: {', '.join(sorted(READERS))}")
+
+def iter_input_file(input_file: str, mime_type: Optional[str] = None) -> Iterator[str]:
+    """Stream the text of an input file in segments, based on its type.
+
+    The type is taken from the file suffix, or from mime_type if the suffix
+    is not recognized.
+    """
+    input_path = Path(input_file)
+    if not input_path.exists():
+        raise FileNotFoundError(f"Input file not found: {input_file}")
+    reader = get_reader(input_path.suffix, mime_type)
+    with open(input_path, 'rb') as stream:
+        yield from reader(stream)
+
+def read_input_file(input_file: str, mime_type: Optional[str] = None) -> str:
+    """Read and process input file based on its type."""
+    return ''.join(iter_input_file(input_file, mime_type))
@@ -1,33 +1,320 @@
 import re
-from typing import List, Optional
+from typing import Dict, FrozenSet, Iterable, Iterator, List, Optional
 
-def process_text_chunks(text: str, split_pattern: Optional[str], sentences_per_chunk: int = 3) -> List[str]:
+# Sentence-ending punctuation, including CJK full-width marks and the Devanagari danda
+SENTENCE_END = '.!?…。！？।॥'
+# Quotes and brackets that may follow the punctuation ending a sentence
+CLOSING_PUNCTUATION = '"\'”’)]」』）】'
+
+# Candidate sentence ends. Latin punctuation must be followed by whitespace;
+# CJK and Devanagari punctuation ends a sentence even directly before the
+# next character, and a blank line always ends one. All require a following
+# non-space character, so a candidate at the end of a block is rechecked
+# once the next block arrives.
+SENTENCE_BOUNDARY = re.compile(
+    r'(?P<latin>[.!?…]+)[%(closing)s]*\s+(?=\S)|[。！？।॥]+[%(closing)s]*\s*(?=\S)|\n[^\S\n]*\n\s*(?=\S)'
+    % {'closing': re.escape(CLOSING_PUNCTUATION)}
+)
+PARAGRAPH_BREAK = re.compile(r'\n[^\S\n]*\n')
+CLAUSE_BOUNDARY = re.compile(r'(?<=[,;:])\s+|(?<=[，、；：])\s*')
+# Dotted initialisms such as "U.S" or "p.m" (the final period is not included)
+INITIALISM = re.compile(r'(?:\w\.)+\w')
+
+# Longest abbreviation checked before a period
+MAX_ABBREVIATION_CHARS = 12
+
+# Longest sentence held back waiting for a boundary; longer runs of text are
+# broken at the last newline or space before this length
+MAX_SENTENCE_CHARS = 4096
+
+ENGLISH_ABBREVIATIONS = frozenset({
+    'mr', 'mrs', 'ms', 'dr', 'prof', 'sr', 'jr', 'st', 'mt', 'rev', 'gen', 'col', 'lt', 'sgt', 'capt',
+    'vs', 'etc', 'e.g', 'i.e', 'cf', 'approx', 'dept', 'est', 'inc', 'ltd', 'corp',
+    'jan', 'feb', 'mar', 'apr', 'jun', 'jul', 'aug', 'sep', 'sept', 'oct', 'nov', 'dec',
+})
+
+# Language code -> lowercase abbreviations, without their final period, after
+# which a period does not end a sentence. Words that are also common at the
+# end of a sentence (such as "no") are left out.
+ABBREVIATIONS: Dict[str, FrozenSet[str]] = {
+    'en-us': ENGLISH_ABBREVIATIONS,
+    'en-gb': ENGLISH_ABBREVIATIONS,
+    'es': frozenset({
+        'sr', 'sra', 'srta', 'sres', 'dr', 'dra', 'prof', 'lic', 'ing', 'ud', 'uds', 'av', 'avda',
+        'etc', 'p.ej', 'pág', 'págs', 'núm', 'aprox', 'dpto', 'cía',
+    }),
+    'fr': frozenset({
+        'mme', 'mmes', 'mlle', 'mlles', 'dr', 'pr', 'me', 'mgr', 'st', 'ste', 'av', 'bd',
+        'etc', 'p.ex', 'cf', 'env', 'chap', 'éd', 'vol',
+    }),
+    'hi': frozenset({'डॉ', 'प्रो', 'श्री', 'श्रीमती', 'सं'}),
+    'it': frozenset({
+        'sig', 'sigg', 'sig.ra', 'sig.na', 'dott', 'dott.ssa', 'prof', 'avv', 'ing', 'arch', 'geom',
+        'ecc', 'p.es', 'pag', 'pagg', 'cfr', 'ca',
+    }),
+    'ja': frozenset(),
+    'pt-br': frozenset({
+        'sr', 'sra', 'srta', 'dr', 'dra', 'prof', 'profa', 'av', 'etc', 'p.ex', 'pág', 'págs',
+        'aprox', 'cia', 'ltda',
+    }),
+    'zh': frozenset(),
+}
+
+def ensure_punctuation(text: str) -> str:
+    """Ensure text ends with sentence-ending punctuation."""
+    text = text.rstrip()
+    return text if text.rstrip(CLOSING_PUNCTUATION)[-1:] in tuple(SENTENCE_END) else text + '.'
+
+def iter_lines(blocks: Iterable[str]) -> Iterator[str]:
+    """Split a stream of text blocks into lines, without line endings."""
+    tail = ''
+    for block in blocks:
+        lines = (tail + block).split('\n')
+        # The last line may continue in the next block
+        tail = lines.pop()
+        for line in lines:
+            yield line.rstrip('\r')
+    if tail:
+        yield tail.rstrip('\r')
+
+def split_overlong(text: str, start: int, max_chars: int = MAX_SENTENCE_CHARS) -> Iterator[int]:
+    """Yield forced break positions while text[start:] is longer than max_chars.
+
+    Breaks at the last newline, else the last whitespace, else max_chars.
+    """
+    while len(text) - start > max_chars:
+        end = start + max_chars
+        cut = text.rfind('\n', start + 1, end)
+        if cut < 0:
+            cut = max(text.rfind(' ', start + 1, end), text.rfind('\t', start + 1, end))
+        start = cut if cut > 0 else end
+        yield start
+
+def is_sentence_end(text: str, match: re.Match, abbreviations: FrozenSet[str]) -> bool:
+    """Decide whether a SENTENCE_BOUNDARY candidate really ends a sentence.
+
+    A blank line always does. A period after an abbreviation, an initial or
+    an initialism does not, and neither does an ellipsis followed by a
+    lowercase letter.
+    """
+    punctuation = match.group('latin')
+    if punctuation is None or PARAGRAPH_BREAK.search(match.group()):
+        return True
+    if punctuation.endswith(('…', '...')):
+        return not text[match.end()].islower()
+    if punctuation != '.':
+        return True
+    before = text[max(0, match.start() - MAX_ABBREVIATION_CHARS):match.start()].split()
+    if not before or text[match.start() - 1].isspace():
+        return True
+    word = before[-1].lstrip(CLOSING_PUNCTUATION + '"\'“‘([（「『')
+    if len(word) == 1 and word.isupper():
+        return False
+    return word.lower() not in abbreviations and INITIALISM.fullmatch(word) is None
+
+def iter_sentences(
+    blocks: Iterable[str],
+    split_pattern: Optional[str] = None,
+    language: Optional[str] = None
+) -> Iterator[str]:
+    """Incrementally split a stream of text blocks into sentences.
+
+    Blocks may end mid-sentence; the unfinished tail is carried over to the
+    next block, so only one partial sentence is ever held in memory. Text
+    running for more than MAX_SENTENCE_CHARS without a boundary is broken at
+    a newline or space, which keeps that memory bounded.
+
+    Args:
+        blocks: Text blocks, e.g. successive reads from a file or stdin
+        split_pattern: Optional regex pattern to split on instead of sentence boundaries
+        language: Language code (a key of LANGUAGE_CODES) whose abbreviations
+            do not end sentences (default: English)
+    """
+    if split_pattern:
+        pattern = re.compile(split_pattern)
+        tail = ''
+        for block in blocks:
+            pieces = pattern.split(tail + block)
+            # The last piece may continue in the next block
+            tail = pieces.pop()
+            start = 0
+            for cut in split_overlong(tail, 0):
+                pieces.append(tail[start:cut])
+                start = cut
+            tail = tail[start:]
+            for piece in pieces:
+                if piece.strip():
+                    yield piece.strip()
+        if tail.strip():
+            yield tail.strip()
+        return
+
+    abbreviations = ABBREVIATIONS.get(language or 'en-gb', frozenset())
+    tail = ''
+    # Characters a boundary candidate is made of; one cut short by the end of
+    # a block lies within the trailing run of these and is rescanned
+    boundary_chars = SENTENCE_END + CLOSING_PUNCTUATION + ' \t\n\r\f\v'
+    for block in blocks:
+        # Resume scanning where the previous block left off, not at the tail's start
+        scan = len(tail.rstrip(boundary_chars))
+        text = tail + block
+        start = 0
+        for match in SENTENCE_BOUNDARY.finditer(text, scan):
+            if is_sentence_end(text, match, abbreviations):
+                sentence = text[start:match.end()].strip()
+                if sentence:
+                    # A paragraph without final punctuation, such as a heading
+                    yield ensure_punctuation(sentence) if PARAGRAPH_BREAK.search(match.group()) else sentence
+                start = match.end()
+        for cut in split_overlong(text, start):
+            if text[start:cut].strip():
+                yield text[start:cut].strip()
+            start = cut
+        # The text after the last sentence end may continue in the next block
+        tail = text[start:]
+    if tail.strip():
+        yield tail.strip()
+
+def pack_pieces(pieces: Iterable[str], max_chars: int) -> Iterator[str]:
+    """Greedily join pieces with spaces into strings of at most max_chars.
+
+    A single piece longer than max_chars is yielded on its own.
+    """
+    current = ''
+    for piece in pieces:
+        if current and len(current) + 1 + len(piece) > max_chars:
+            yield current
+            current = piece
+        else:
+            current = f'{current} {piece}' if current else piece
+    if current:
+        yield current
+
+def split_long_sentence(sentence: str, max_chars: int) -> Iterator[str]:
+    """Split a sentence longer than max_chars at clause boundaries, then between words.
+
+    A single word longer than max_chars, such as a URL, is cut at the limit.
+    """
+    if len(sentence) <= max_chars:
+        yield sentence
+        return
+    for clause in pack_pieces(CLAUSE_BOUNDARY.split(sentence), max_chars):
+        if len(clause) <= max_chars:
+            yield clause
+            continue
+        for piece in pack_pieces(clause.split(), max_chars):
+            for start in range(0, len(piece), max_chars):
+                yield piece[start:start + max_chars]
+
+def iter_budget_chunks(
+    sentences: Iterable[str],
+    chunk_chars: int,
+    min_chunk_chars: Optional[int] = None,
+    max_chunk_chars: Optional[int] = None,
+    first_chunk_chars: Optional[int] = None
+) -> Iterator[str]:
+    """Group sentences into chunks of roughly chunk_chars characters.
+
+    A chunk ends at whichever sentence boundary is closer to chunk_chars,
+    provided it already has min_chunk_chars characters; no chunk
+    exceeds max_chunk_chars, so overlong sentences are split at clause
+    boundaries, between words or, for a word longer than that, within it.
+    The first chunk targets the shorter first_chunk_chars instead, so the
+    first audio is ready sooner.
+
+    Args:
+        sentences: Sentences, e.g. from iter_sentences()
+        chunk_chars: Target chunk length in characters
+        min_chunk_chars: Shortest chunk before the target may be exceeded (default: chunk_chars // 2)
+        max_chunk_chars: Hard limit on chunk length (default: 2 * chunk_chars)
+        first_chunk_chars: Target length of the first chunk (default: min_chunk_chars)
+    """
+    min_chunk_chars = chunk_chars // 2 if min_chunk_chars is None else min_chunk_chars
+    max_chunk_chars = 2 * chunk_chars if max_chunk_chars is None else max_chunk_chars
+    if not 0 <= min_chunk_chars <= chunk_chars <= max_chunk_chars or chunk_chars < 1:
+        raise ValueError("Chunk sizes must satisfy 0 <= min_chunk_chars <= chunk_chars <= max_chunk_chars")
+
+    first_chunk_chars = min_chunk_chars if first_chunk_chars is None else first_chunk_chars
+    target = min(first_chunk_chars or chunk_chars, max_chunk_chars)
+    # Leave room for the full stop ensure_punctuation() may add to a chunk
+    limit = max(max_chunk_chars - 1, 1)
+    # The first chunk's floor scales with its target, as min_chunk_chars does with chunk_chars
+    floor = min(min_chunk_chars * target // chunk_chars, target)
+    parts: List[str] = []
+    length = 0
+    for sentence in sentences:
+        for piece in split_long_sentence(sentence, limit):
+            extended = length + 1 + len(piece)
+            # End the chunk here if that lands closer to the target than adding the piece
+            if parts and (extended > limit or (extended - target > target - length and length >= floor)):
+                yield ensure_punctuation(' '.join(parts))
+                parts, length = [], 0
+                target, floor = chunk_chars, min_chunk_chars
+            length = length + 1 + len(piece) if parts else len(piece)
+            parts.append(piece)
+            # Emit a full chunk now rather than waiting for the next sentence
+            if length >= target:
+                yield ensure_punctuation(' '.join(parts))
+                parts, length = [], 0
+                target, floor = chunk_chars, min_chunk_chars
+    if parts:
+        yield ensure_punctuation(' '.join(parts))
+
+def iter_text_chunks(
+    blocks: Iterable[str],
+    split_pattern: Optional[str] = None,
+    sentences_per_chunk: int = 3,
+    chunk_chars: Optional[int] = None,
+    min_chunk_chars: Optional[int] = None,
+    max_chunk_chars: Optional[int] = None,
+    first_chunk_chars: Optional[int] = None,
+    language: Optional[str] = None
+) -> Iterator[str]:
+    """Yield TTS chunks from a stream of text blocks as soon as each is complete.
+
+    Args:
+        blocks: Text blocks, e.g. successive reads from a file or stdin
+        split_pattern: Optional regex pattern for custom splitting
+        sentences_per_chunk: Number of sentences to include in each chunk (default: 3)
+        chunk_chars: If given, group sentences by length instead of count;
+            see iter_budget_chunks() for this and the following arguments
+        language: Language code used to recognize abbreviations (default: English)
+    """
+    if split_pattern:
+        for piece in iter_sentences(blocks, split_pattern):
+            yield ensure_punctuation(piece)
+        return
+
+    if chunk_chars:
+        yield from iter_budget_chunks(
+            iter_sentences(blocks, language=language), chunk_chars, min_chunk_chars, max_chunk_chars, first_chunk_chars
+        )
+        return
+
+    # Group sentences into chunks
+    sentences: List[str] = []
+    for sentence in iter_sentences(blocks, language=language):
+        sentences.append(sentence)
+        if len(sentences) == sentences_per_chunk:
+            yield ensure_punctuation(' '.join(sentences))
+            sentences = []
+    if sentences:
+        yield ensure_punctuation(' '.join(sentences))
+
+def process_text_chunks(
+    text: str,
+    split_pattern: Optional[str],
+    sentences_per_chunk: int = 3,
+    **budget
+) -> List[str]:
     """Process text into chunks for TTS processing.
     
     Args:
         text: The input text to process
         split_pattern: Optional regex pattern for custom splitting
         sentences_per_chunk: Number of sentences to include in each chunk (default: 3)
+        **budget: chunk_chars and related limits or language, as for iter_text_chunks()
     """
     if not isinstance(text, str):
         return text if text else []
-    
-    # Ensure text ends with sentence-ending punctuation
-    if text and not text.rstrip()[-1] in '.!?':
-        text = text.rstrip() + '.'
-    
-    if split_pattern:
-        texts = [t.strip() for t in re.split(split_pattern, text) if t.strip()]
-    else:
-        # Split into individual sentences first
-        sentences = [t.strip() for t in re.split(r'(?<=[.!?])\s+', text) if t.strip()]
-        # Group sentences into chunks
-        texts = []
-        for i in range(0, len(sentences), sentences_per_chunk):
-            chunk = ' '.join(sentences[i:i + sentences_per_chunk])
-            texts.append(chunk)
-    
-    # Ensure each split chunk ends with punctuation
-    texts = [t if t.rstrip()[-1] in '.!?' else t.rstrip() + '.' for t in texts]
-    
-    return texts 
\ No newline at end of file
+    return list(iter_text_chunks([text], split_pattern, sentences_per_chunk, **budget))